@@ -7,7 +7,7 @@ Author: Loan Analytics Team
 Version: 1.0.0
 """
 
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 from functools import wraps
 
@@ -15,12 +15,16 @@ from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from database.connection import get_db_session
+from database.connection import get_db_session, get_async_db_session
 from database.models import User, UserRole, UserStatus
 from api.auth import decode_token, TokenPayload
 from api.config import get_settings
 
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
 settings = get_settings()
 security = HTTPBearer(auto_error=False)
 
@@ -43,6 +47,20 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator['AsyncSession', None]:
+    """
+    Get async database session for request-path lookups.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async session
+    """
+    db = get_async_db_session()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 # =============================================================================
 # Authentication Dependencies
 # =============================================================================
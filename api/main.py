@@ -21,6 +21,8 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .config import get_settings
 from database.connection import init_database, get_db
+from services.audit_service import get_audit_batcher
+from services.partition_service import get_partition_maintainer
 
 # Import middleware (optional - graceful fallback)
 try:
@@ -72,6 +74,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
     
+    # Audit rows are written in batches off the request path
+    get_audit_batcher().start()
+    
+    # Keeps audit/session partitions created ahead of time and drops
+    # expired session partitions (PostgreSQL only)
+    get_partition_maintainer().start()
+    
     logger.info(f"🚀 {settings.app_name} v{settings.app_version} started")
     
     yield
@@ -79,8 +88,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     
+    await get_partition_maintainer().stop()
+    await get_audit_batcher().stop()
+    
     try:
         get_db().close()
+        await get_db().close_async()
         logger.info("Database connections closed")
     except Exception:
         pass
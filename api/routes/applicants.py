@@ -21,10 +21,12 @@ from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import or_, and_
 
 from database.models import User, Applicant, KYCStatus, EmploymentType, Gender, MaritalStatus, Education
-from api.dependencies import get_db, get_current_user, require_roles
+from database.async_repositories import AsyncApplicantRepository
+from api.dependencies import get_db, get_async_db, get_current_user, require_roles
 from api.config import get_settings
 from api.schemas import (
     ApplicantCreateRequest,
@@ -294,17 +296,14 @@ async def create_applicant(
 async def get_applicant(
     applicant_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get applicant details by ID.
     """
-    applicant = db.query(Applicant).filter(
-        Applicant.id == applicant_id,
-        Applicant.is_deleted == False
-    ).first()
+    applicant = await AsyncApplicantRepository(db).get_by_id(applicant_id)
     
-    if not applicant:
+    if not applicant or applicant.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Applicant not found"
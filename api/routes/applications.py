@@ -19,9 +19,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import User, Applicant, LoanApplication, ApplicationAuditLog
-from api.dependencies import get_db, get_current_user, require_roles
+from database.async_repositories import AsyncLoanApplicationRepository
+from api.dependencies import get_db, get_async_db, get_current_user, require_roles
 from api.schemas import (
     ApplicationCreateRequest,
     ApplicationUpdateRequest,
@@ -267,12 +269,15 @@ async def create_application(
 async def get_application(
     application_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    service: ApplicationService = Depends(get_application_service)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get application details by ID."""
+    """Get application details by ID (same access rules as ``ApplicationService.get_application``)."""
     try:
-        application = service.get_application(db, application_id, current_user)
+        application = await AsyncLoanApplicationRepository(db).get_by_id(application_id)
+        if not application or application.is_deleted:
+            raise ApplicationNotFoundError(application_id)
+        if current_user.role.value == "applicant" and application.applicant.user_id != current_user.id:
+            raise AccessDeniedError()
         return to_detail_response(application)
     except Exception as e:
         raise handle_service_error(e)
@@ -203,8 +203,8 @@ async def login(
     # Create session record
     session = UserSession(
         user_id=user.id,
-        refresh_token_jti=token_data["refresh_jti"],
-        access_token_jti=token_data["access_jti"],
+        refresh_token_jti=UUID(token_data["refresh_jti"]),
+        access_token_jti=UUID(token_data["access_jti"]),
         ip_address=req.client.host if req.client else None,
         user_agent=req.headers.get("User-Agent"),
         expires_at=token_data["refresh_expires"]
@@ -256,7 +256,7 @@ async def refresh_token(
     
     # Check session exists and is not revoked
     session = db.query(UserSession).filter(
-        UserSession.refresh_token_jti == payload.jti,
+        UserSession.refresh_token_jti == UUID(payload.jti),
         UserSession.is_active == True,
         UserSession.revoked == False
     ).first()
@@ -295,8 +295,8 @@ async def refresh_token(
     )
     
     # Update session
-    session.refresh_token_jti = token_data["refresh_jti"]
-    session.access_token_jti = token_data["access_jti"]
+    session.refresh_token_jti = UUID(token_data["refresh_jti"])
+    session.access_token_jti = UUID(token_data["access_jti"])
     session.expires_at = token_data["refresh_expires"]
     session.last_used_at = datetime.utcnow()
     
@@ -330,7 +330,7 @@ async def logout(
         if payload:
             # Revoke the session
             session = db.query(UserSession).filter(
-                UserSession.access_token_jti == payload.jti,
+                UserSession.access_token_jti == UUID(payload.jti),
                 UserSession.user_id == current_user.id
             ).first()
             
@@ -360,7 +360,8 @@ async def logout_all_sessions(
     # Revoke all sessions
     db.query(UserSession).filter(
         UserSession.user_id == current_user.id,
-        UserSession.is_active == True
+        UserSession.is_active == True,
+        UserSession.revoked == False
     ).update({
         "is_active": False,
         "revoked": True,
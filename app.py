@@ -11,10 +11,8 @@ Last Updated: January 2026
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import os
+import string
 import sys
 from datetime import datetime
 
@@ -24,10 +22,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from data.data_generator import generate_synthetic_data, INDIAN_CITIES, LOAN_PURPOSES
 from models.loan_model import LoanApprovalModel, generate_human_explanation
 from utils.fairness_analyzer import (
-    FairnessAnalyzer, create_age_groups, create_income_groups,
+    FairnessAnalyzer, AGE_BINS, AGE_LABELS, INCOME_BINS, INCOME_LABELS,
     generate_fairness_summary_text
 )
 
+# Default city for the application form
+_AGRA_IDX = INDIAN_CITIES.index("Agra")
+
 # ═══════════════════════════════════════════════════════════════════
 # PAGE CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
@@ -577,6 +578,12 @@ st.markdown("""
     /* ═══════════════════════════════════════════════════════════════
        METRICS & STATS
        ═══════════════════════════════════════════════════════════════ */
+    .metrics-row {
+        display: grid;
+        grid-template-columns: repeat(4, minmax(0, 1fr));
+        gap: 1rem;
+    }
+    
     .metric-card {
         background: white;
         border-radius: var(--radius-lg);
@@ -891,26 +898,92 @@ def load_or_train_model():
     return model, "trained"
 
 
+def _downcast_numeric(df):
+    """Downcast integer and float columns to the smallest dtype that holds their values."""
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include='float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
+
 @st.cache_data
 def get_training_data():
     """Get or generate training data."""
     data_path = 'data/loan_applications.csv'
     
     if os.path.exists(data_path):
-        return pd.read_csv(data_path)
+        return _downcast_numeric(pd.read_csv(data_path))
     
     df = generate_synthetic_data(n_samples=5000)
     os.makedirs('data', exist_ok=True)
     df.to_csv(data_path, index=False)
-    return df
+    return _downcast_numeric(df)
+
+
+@st.cache_data
+def get_training_stats(df):
+    """Summary figures shown in the sidebar: approval rate, average amount, count."""
+    return df['loan_approved'].mean() * 100, df['loan_amount'].mean(), len(df)
 
 
 # ═══════════════════════════════════════════════════════════════════
 # VISUALIZATION FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
+# Static layout pieces shared by every render; only data-dependent keys
+# (titles, axis ranges) are merged in per call.
+_FAIRNESS_TITLE_BASE = {
+    'font': {'size': 16, 'family': 'Segoe UI', 'color': '#091E42'},
+    'x': 0
+}
+
+_FAIRNESS_YAXIS_BASE = {
+    'title': 'Approval Rate (%)',
+    'titlefont': {'size': 12, 'color': '#5E6C84'},
+    'gridcolor': '#F4F5F7',
+    'tickfont': {'color': '#5E6C84'}
+}
+
+_FAIRNESS_LAYOUT_BASE = {
+    'xaxis': {
+        'title': '',
+        'tickfont': {'size': 12, 'color': '#253858'}
+    },
+    'height': 360,
+    'margin': {'l': 20, 'r': 20, 't': 60, 'b': 40},
+    'plot_bgcolor': 'white',
+    'paper_bgcolor': 'white',
+    'font': {'family': 'Segoe UI, sans-serif'}
+}
+
+_IMPORTANCE_LAYOUT_BASE = {
+    'title': {
+        'text': '<b>What Matters Most</b><br><span style="font-size:12px;color:#5E6C84;">Top factors influencing loan decisions</span>',
+        'font': {'size': 18, 'family': 'Segoe UI', 'color': '#091E42'},
+        'x': 0
+    },
+    'xaxis': {
+        'title': 'Importance Score',
+        'titlefont': {'size': 13, 'color': '#5E6C84'},
+        'gridcolor': '#F4F5F7',
+        'tickfont': {'color': '#5E6C84'}
+    },
+    'yaxis': {
+        'categoryorder': 'total ascending',
+        'tickfont': {'size': 12, 'color': '#253858'}
+    },
+    'height': 450,
+    'margin': {'l': 20, 'r': 60, 't': 80, 'b': 60},
+    'plot_bgcolor': 'white',
+    'paper_bgcolor': 'white',
+    'font': {'family': 'Segoe UI, sans-serif'}
+}
+
+
 def create_contribution_chart(explanation, prediction_result):
     """Create professional horizontal bar chart for feature contributions."""
+    import plotly.graph_objects as go
     
     contributions = explanation['all_contributions'][:10]
     
@@ -966,6 +1039,7 @@ def create_contribution_chart(explanation, prediction_result):
 
 def create_gauge_chart(probability, title="Approval Likelihood"):
     """Create professional gauge chart."""
+    import plotly.graph_objects as go
     
     if probability >= 0.6:
         color = '#36B37E'
@@ -1017,6 +1091,7 @@ def create_gauge_chart(probability, title="Approval Likelihood"):
 
 def create_waterfall_chart(explanation, prediction_result):
     """Create waterfall chart showing score progression."""
+    import plotly.graph_objects as go
     
     contributions = explanation['all_contributions']
     base_value = explanation['base_value']
@@ -1082,6 +1157,7 @@ def create_waterfall_chart(explanation, prediction_result):
 
 def create_fairness_chart(fairness_data, attribute):
     """Create fairness comparison bar chart."""
+    import plotly.graph_objects as go
     
     groups = list(fairness_data['group_metrics'].keys())
     rates = [m['approval_rate'] * 100 for m in fairness_data['group_metrics'].values()]
@@ -1117,35 +1193,20 @@ def create_fairness_chart(fairness_data, attribute):
         annotation_font=dict(size=12, color='#FF8B00', family='Segoe UI')
     )
     
-    fig.update_layout(
-        title=dict(
-            text=f'<b>Approval Rates by {attribute.replace("_", " ").title()}</b>',
-            font=dict(size=16, family='Segoe UI', color='#091E42'),
-            x=0
-        ),
-        xaxis=dict(
-            title='',
-            tickfont=dict(size=12, color='#253858')
-        ),
-        yaxis=dict(
-            title='Approval Rate (%)',
-            titlefont=dict(size=12, color='#5E6C84'),
-            gridcolor='#F4F5F7',
-            range=[0, max(rates) * 1.25],
-            tickfont=dict(color='#5E6C84')
-        ),
-        height=360,
-        margin=dict(l=20, r=20, t=60, b=40),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family='Segoe UI, sans-serif')
-    )
+    fig.update_layout(_FAIRNESS_LAYOUT_BASE | {
+        'title': {
+            'text': f'<b>Approval Rates by {attribute.replace("_", " ").title()}</b>',
+            **_FAIRNESS_TITLE_BASE
+        },
+        'yaxis': _FAIRNESS_YAXIS_BASE | {'range': [0, max(rates) * 1.25]}
+    })
     
     return fig
 
 
 def create_feature_importance_chart(importance_df):
     """Create horizontal bar chart for feature importance."""
+    import plotly.graph_objects as go
     
     top_features = importance_df.head(10)
     
@@ -1166,32 +1227,136 @@ def create_feature_importance_chart(importance_df):
         hovertemplate='<b>%{y}</b><br>Importance: %{x:.4f}<extra></extra>'
     ))
     
+    fig.update_layout(_IMPORTANCE_LAYOUT_BASE)
+    
+    return fig
+
+
+def create_cibil_approval_chart(training_data):
+    """Create bar chart of approval rate per CIBIL score range."""
+    import plotly.graph_objects as go
+    
+    cibil_range = pd.cut(
+        training_data['cibil_score'],
+        bins=[300, 500, 600, 700, 800, 900],
+        labels=['300-500', '501-600', '601-700', '701-800', '801-900']
+    )
+    
+    cibil_approval = training_data.groupby(cibil_range)['loan_approved'].agg(['mean']).reset_index()
+    cibil_approval.columns = ['CIBIL Range', 'Approval Rate']
+    cibil_approval['Approval Rate'] = cibil_approval['Approval Rate'] * 100
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=cibil_approval['CIBIL Range'],
+        y=cibil_approval['Approval Rate'],
+        marker_color=['#DE350B', '#FF8B00', '#FFAB00', '#36B37E', '#00875A'],
+        text=[f'{r:.0f}%' for r in cibil_approval['Approval Rate']],
+        textposition='outside'
+    ))
     fig.update_layout(
-        title=dict(
-            text='<b>What Matters Most</b><br><span style="font-size:12px;color:#5E6C84;">Top factors influencing loan decisions</span>',
-            font=dict(size=18, family='Segoe UI', color='#091E42'),
-            x=0
-        ),
-        xaxis=dict(
-            title='Importance Score',
-            titlefont=dict(size=13, color='#5E6C84'),
-            gridcolor='#F4F5F7',
-            tickfont=dict(color='#5E6C84')
-        ),
-        yaxis=dict(
-            categoryorder='total ascending',
-            tickfont=dict(size=12, color='#253858')
-        ),
-        height=450,
-        margin=dict(l=20, r=60, t=80, b=60),
+        title='<b>Approval Rate by CIBIL Score</b>',
+        xaxis_title='CIBIL Score Range',
+        yaxis_title='Approval Rate (%)',
+        height=350,
         plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family='Segoe UI, sans-serif')
+        paper_bgcolor='white'
+    )
+    
+    return fig
+
+
+def create_loan_amount_chart(training_data):
+    """Create histogram of requested loan amounts in lakhs."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Histogram(
+        x=training_data['loan_amount'] / 100000,
+        nbinsx=25,
+        marker_color='#0052CC'
+    ))
+    fig.update_layout(
+        title='<b>Loan Amount Distribution</b>',
+        xaxis_title='Loan Amount (₹ Lakhs)',
+        yaxis_title='Number of Applications',
+        height=350,
+        plot_bgcolor='white',
+        paper_bgcolor='white'
     )
     
     return fig
 
 
+# ═══════════════════════════════════════════════════════════════════
+# METRIC COLOR THRESHOLDS
+# ═══════════════════════════════════════════════════════════════════
+
+_PALETTE_HIGH_IS_GOOD = np.array(['#DE350B', '#FFAB00', '#36B37E'])
+_PALETTE_HIGH_IS_BAD = _PALETTE_HIGH_IS_GOOD[::-1]
+
+_DTI_THRESHOLDS = np.array([35.0, 50.0])
+_CIBIL_THRESHOLDS = np.array([600, 700])
+_LIR_THRESHOLDS = np.array([1.0, 2.0])
+_STABILITY_THRESHOLDS = np.array([30, 60])
+
+
+def _color_for(value, thresholds, palette, side='right'):
+    """
+    Pick a traffic-light color by locating ``value`` among sorted thresholds.
+
+    ``side='right'`` treats a value equal to a threshold as belonging to the
+    upper band (``>=``); ``side='left'`` keeps it in the lower band (``<=``).
+    """
+    return str(palette[np.searchsorted(thresholds, value, side=side)])
+
+
+# ═══════════════════════════════════════════════════════════════════
+# HTML TEMPLATES
+# ═══════════════════════════════════════════════════════════════════
+
+# Parsed once at import; each rerun only performs the substitution.
+_METRIC_CARD_TPL = string.Template(
+    '<div class="metric-card">'
+    '<div class="metric-icon" style="background: $bg; color: $fg;">$emoji</div>'
+    '<div class="metric-value" style="color: $color;">$value</div>'
+    '<div class="metric-label">$label</div>'
+    '<div class="metric-change $status">$status_text</div>'
+    '</div>'
+)
+
+
+def render_input_preview(cibil_score, loan_amount, loan_tenure):
+    """Show the CIBIL band, the amount in lakhs and the EMI estimate for submitted inputs."""
+    if cibil_score >= 750:
+        band = "🟢 Excellent"
+    elif cibil_score >= 700:
+        band = "🟢 Good"
+    elif cibil_score >= 650:
+        band = "🟡 Fair"
+    else:
+        band = "🔴 Needs Improvement"
+    st.caption(f"CIBIL {cibil_score}: {band}  ·  Loan ₹{loan_amount/100000:.2f} Lakhs")
+    
+    interest_rate = 12.0
+    monthly_rate = interest_rate / 12 / 100
+    emi = (loan_amount * monthly_rate * (1 + monthly_rate)**loan_tenure) / ((1 + monthly_rate)**loan_tenure - 1)
+    
+    st.markdown(f"""
+    <div style="background: #E6F0FF; padding: 16px 20px; border-radius: 10px; margin-top: 8px;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div>
+                <span style="color: #5E6C84; font-size: 0.9rem;">Estimated Monthly EMI</span>
+                <div style="color: #0052CC; font-size: 1.4rem; font-weight: 700;">₹{emi:,.0f}</div>
+            </div>
+            <div style="text-align: right;">
+                <span style="color: #5E6C84; font-size: 0.9rem;">@ {interest_rate}% p.a.</span>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # MAIN APPLICATION
 # ═══════════════════════════════════════════════════════════════════
@@ -1241,8 +1406,7 @@ def main():
         
         # Stats
         st.markdown("---")
-        approval_rate = training_data['loan_approved'].mean() * 100
-        avg_amount = training_data['loan_amount'].mean()
+        approval_rate, avg_amount, total_processed = get_training_stats(training_data)
         
         st.markdown(f"""
         <div class="sidebar-stats">
@@ -1257,7 +1421,7 @@ def main():
             </div>
             <div class="stat-item">
                 <span class="stat-label">Total Processed</span>
-                <span class="stat-value">{len(training_data):,}</span>
+                <span class="stat-value">{total_processed:,}</span>
             </div>
         </div>
         """, unsafe_allow_html=True)
@@ -1287,148 +1451,128 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # FORM SECTION 1: Personal Information
-        st.markdown("""
-        <div class="form-section">
-            <div class="form-section-title">
-                <div class="form-section-icon">👤</div>
-                Personal Information
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            applicant_name = st.text_input("Full Name", value="Priya Sharma")
-        with col2:
-            age = st.number_input("Age", min_value=21, max_value=65, value=28)
-        with col3:
-            gender = st.selectbox("Gender", ["Female", "Male"])
-        with col4:
-            city = st.selectbox("City", INDIAN_CITIES, index=INDIAN_CITIES.index("Agra"))
-        
-        col5, col6, col7 = st.columns(3)
-        
-        with col5:
-            education = st.selectbox("Education", ["High School", "Graduate", "Post Graduate", "Professional"])
-        with col6:
-            marital_status = st.selectbox("Marital Status", ["Single", "Married", "Divorced"])
-        with col7:
-            num_dependents = st.number_input("Dependents", min_value=0, max_value=10, value=1)
-        
-        # FORM SECTION 2: Employment Details
-        st.markdown("""
-        <div class="form-section">
-            <div class="form-section-title">
-                <div class="form-section-icon">💼</div>
-                Employment Details
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            employment_type = st.selectbox("Employment Type", ["Salaried", "Self-Employed", "Business Owner", "Government", "Retired"])
-        with col2:
-            industry = st.selectbox("Industry", ["Information Technology", "Banking & Finance", "Healthcare", "Education", "Manufacturing", "Retail", "Real Estate", "Government", "Other"])
-        with col3:
-            years_at_job = st.number_input("Years at Current Job", min_value=0, max_value=40, value=3)
-        
-        col4, col5, col6 = st.columns(3)
-        
-        with col4:
-            monthly_income = st.number_input("Monthly Income (₹)", min_value=15000, max_value=1000000, value=45000, step=5000)
-        with col5:
-            existing_emi = st.number_input("Existing EMI (₹)", min_value=0, max_value=500000, value=8000, step=1000)
-        with col6:
-            num_existing_loans = st.number_input("Existing Loans", min_value=0, max_value=10, value=1)
-        
-        # FORM SECTION 3: Credit Profile
-        st.markdown("""
-        <div class="form-section">
-            <div class="form-section-title">
-                <div class="form-section-icon">📊</div>
-                Credit Profile
+        # All inputs live in one form so editing a field does not rerun the
+        # whole page; the script reruns once when the form is submitted.
+        with st.form("loan_app"):
+            # FORM SECTION 1: Personal Information
+            st.markdown("""
+            <div class="form-section">
+                <div class="form-section-title">
+                    <div class="form-section-icon">👤</div>
+                    Personal Information
+                </div>
             </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            cibil_score = st.slider("CIBIL Score", min_value=300, max_value=900, value=680)
-            if cibil_score >= 750:
-                st.caption("🟢 Excellent")
-            elif cibil_score >= 700:
-                st.caption("🟢 Good")
-            elif cibil_score >= 650:
-                st.caption("🟡 Fair")
-            else:
-                st.caption("🔴 Needs Improvement")
+            """, unsafe_allow_html=True)
             
-        with col2:
-            credit_history_years = st.number_input("Credit History (Years)", min_value=0, max_value=30, value=3)
-        with col3:
-            late_payments = st.number_input("Late Payments (2 Years)", min_value=0, max_value=20, value=2)
-        
-        col4, col5, col6 = st.columns(3)
-        
-        with col4:
-            has_defaults = st.checkbox("Has Previous Defaults", value=False)
-        with col5:
-            owns_property = st.checkbox("Owns Property", value=False)
-        with col6:
-            savings_balance = st.number_input("Savings Balance (₹)", min_value=0, max_value=5000000, value=120000, step=10000)
-        
-        years_with_bank = st.slider("Years with Bank", min_value=0, max_value=30, value=2)
-        
-        # FORM SECTION 4: Loan Request
-        st.markdown("""
-        <div class="form-section">
-            <div class="form-section-title">
-                <div class="form-section-icon">💰</div>
-                Loan Request Details
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                applicant_name = st.text_input("Full Name", value="Priya Sharma")
+            with col2:
+                age = st.number_input("Age", min_value=21, max_value=65, value=28)
+            with col3:
+                gender = st.selectbox("Gender", ["Female", "Male"])
+            with col4:
+                city = st.selectbox("City", INDIAN_CITIES, index=_AGRA_IDX)
+            
+            col5, col6, col7 = st.columns(3)
+            
+            with col5:
+                education = st.selectbox("Education", ["High School", "Graduate", "Post Graduate", "Professional"])
+            with col6:
+                marital_status = st.selectbox("Marital Status", ["Single", "Married", "Divorced"])
+            with col7:
+                num_dependents = st.number_input("Dependents", min_value=0, max_value=10, value=1)
+            
+            # FORM SECTION 2: Employment Details
+            st.markdown("""
+            <div class="form-section">
+                <div class="form-section-title">
+                    <div class="form-section-icon">💼</div>
+                    Employment Details
+                </div>
             </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            loan_amount = st.number_input("Loan Amount (₹)", min_value=50000, max_value=5000000, value=500000, step=25000)
-            st.caption(f"₹{loan_amount/100000:.2f} Lakhs")
-        with col2:
-            loan_tenure = st.selectbox("Tenure (Months)", [12, 24, 36, 48, 60, 72, 84], index=2)
-        with col3:
-            loan_purpose = st.selectbox("Purpose", LOAN_PURPOSES)
-        
-        # Calculate EMI preview
-        interest_rate = 12.0
-        monthly_rate = interest_rate / 12 / 100
-        emi = (loan_amount * monthly_rate * (1 + monthly_rate)**loan_tenure) / ((1 + monthly_rate)**loan_tenure - 1)
-        
-        st.markdown(f"""
-        <div style="background: #E6F0FF; padding: 16px 20px; border-radius: 10px; margin-top: 8px;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <span style="color: #5E6C84; font-size: 0.9rem;">Estimated Monthly EMI</span>
-                    <div style="color: #0052CC; font-size: 1.4rem; font-weight: 700;">₹{emi:,.0f}</div>
+            """, unsafe_allow_html=True)
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                employment_type = st.selectbox("Employment Type", ["Salaried", "Self-Employed", "Business Owner", "Government", "Retired"])
+            with col2:
+                industry = st.selectbox("Industry", ["Information Technology", "Banking & Finance", "Healthcare", "Education", "Manufacturing", "Retail", "Real Estate", "Government", "Other"])
+            with col3:
+                years_at_job = st.number_input("Years at Current Job", min_value=0, max_value=40, value=3)
+            
+            col4, col5, col6 = st.columns(3)
+            
+            with col4:
+                monthly_income = st.number_input("Monthly Income (₹)", min_value=15000, max_value=1000000, value=45000, step=5000)
+            with col5:
+                existing_emi = st.number_input("Existing EMI (₹)", min_value=0, max_value=500000, value=8000, step=1000)
+            with col6:
+                num_existing_loans = st.number_input("Existing Loans", min_value=0, max_value=10, value=1)
+            
+            # FORM SECTION 3: Credit Profile
+            st.markdown("""
+            <div class="form-section">
+                <div class="form-section-title">
+                    <div class="form-section-icon">📊</div>
+                    Credit Profile
                 </div>
-                <div style="text-align: right;">
-                    <span style="color: #5E6C84; font-size: 0.9rem;">@ {interest_rate}% p.a.</span>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                cibil_score = st.slider("CIBIL Score", min_value=300, max_value=900, value=680)
+            
+            with col2:
+                credit_history_years = st.number_input("Credit History (Years)", min_value=0, max_value=30, value=3)
+            with col3:
+                late_payments = st.number_input("Late Payments (2 Years)", min_value=0, max_value=20, value=2)
+            
+            col4, col5, col6 = st.columns(3)
+            
+            with col4:
+                has_defaults = st.checkbox("Has Previous Defaults", value=False)
+            with col5:
+                owns_property = st.checkbox("Owns Property", value=False)
+            with col6:
+                savings_balance = st.number_input("Savings Balance (₹)", min_value=0, max_value=5000000, value=120000, step=10000)
+            
+            years_with_bank = st.slider("Years with Bank", min_value=0, max_value=30, value=2)
+            
+            # FORM SECTION 4: Loan Request
+            st.markdown("""
+            <div class="form-section">
+                <div class="form-section-title">
+                    <div class="form-section-icon">💰</div>
+                    Loan Request Details
                 </div>
             </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
+            """, unsafe_allow_html=True)
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                loan_amount = st.number_input("Loan Amount (₹)", min_value=50000, max_value=5000000, value=500000, step=25000)
+            with col2:
+                loan_tenure = st.selectbox("Tenure (Months)", [12, 24, 36, 48, 60, 72, 84], index=2)
+            with col3:
+                loan_purpose = st.selectbox("Purpose", LOAN_PURPOSES)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # ASSESS BUTTON
+            col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
+            with col_btn2:
+                assess_clicked = st.form_submit_button("🔍  ASSESS LOAN ELIGIBILITY", use_container_width=True, type="primary")
         
-        # ASSESS BUTTON
-        col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
-        with col_btn2:
-            assess_clicked = st.button("🔍  ASSESS LOAN ELIGIBILITY", use_container_width=True, type="primary")
+        # Derived previews are drawn after submission: inside the form they
+        # would keep showing the previous submit's values while editing
+        if assess_clicked:
+            render_input_preview(cibil_score, loan_amount, loan_tenure)
         
         # ═══════════════════════════════════════════════════════════
         # RESULTS SECTION
@@ -1505,64 +1649,46 @@ def main():
             st.markdown("<br>", unsafe_allow_html=True)
             
             # KEY METRICS
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                dti = (existing_emi / monthly_income * 100) if monthly_income > 0 else 0
-                dti_color = '#36B37E' if dti < 35 else '#FFAB00' if dti < 50 else '#DE350B'
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-icon" style="background: #E6F0FF; color: #0052CC;">📊</div>
-                    <div class="metric-value" style="color: {dti_color};">{dti:.1f}%</div>
-                    <div class="metric-label">Debt-to-Income</div>
-                    <div class="metric-change {'positive' if dti < 35 else 'negative'}">
-                        {'✓ Healthy' if dti < 35 else '⚠ High'}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # All four cards are rendered in a single markdown call so the
+            # front-end receives one element instead of four column blocks.
+            dti = (existing_emi / monthly_income * 100) if monthly_income > 0 else 0
+            dti_color = _color_for(dti, _DTI_THRESHOLDS, _PALETTE_HIGH_IS_BAD)
+            cibil_color = _color_for(cibil_score, _CIBIL_THRESHOLDS, _PALETTE_HIGH_IS_GOOD)
+            loan_income_ratio = loan_amount / (monthly_income * 12) if monthly_income > 0 else 0
+            lir_color = _color_for(loan_income_ratio, _LIR_THRESHOLDS, _PALETTE_HIGH_IS_BAD, side='left')
+            stability_score = min(100, years_at_job * 15 + credit_history_years * 8)
+            stab_color = _color_for(stability_score, _STABILITY_THRESHOLDS, _PALETTE_HIGH_IS_GOOD)
             
-            with col2:
-                cibil_color = '#36B37E' if cibil_score >= 700 else '#FFAB00' if cibil_score >= 600 else '#DE350B'
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-icon" style="background: #E3FCEF; color: #36B37E;">📈</div>
-                    <div class="metric-value" style="color: {cibil_color};">{cibil_score}</div>
-                    <div class="metric-label">CIBIL Score</div>
-                    <div class="metric-change {'positive' if cibil_score >= 700 else 'negative'}">
-                        {'✓ Good' if cibil_score >= 700 else '⚠ Fair'}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                loan_income_ratio = loan_amount / (monthly_income * 12) if monthly_income > 0 else 0
-                lir_color = '#36B37E' if loan_income_ratio <= 1 else '#FFAB00' if loan_income_ratio <= 2 else '#DE350B'
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-icon" style="background: #FFF4E5; color: #FF8B00;">💰</div>
-                    <div class="metric-value" style="color: {lir_color};">{loan_income_ratio:.1f}x</div>
-                    <div class="metric-label">Loan-to-Income</div>
-                    <div class="metric-change {'positive' if loan_income_ratio <= 1 else 'negative'}">
-                        {'✓ OK' if loan_income_ratio <= 1 else '⚠ Moderate'}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                stability_score = min(100, years_at_job * 15 + credit_history_years * 8)
-                stab_color = '#36B37E' if stability_score >= 60 else '#FFAB00' if stability_score >= 30 else '#DE350B'
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-icon" style="background: #FFEBE6; color: #DE350B;">🏢</div>
-                    <div class="metric-value" style="color: {stab_color};">{stability_score}</div>
-                    <div class="metric-label">Stability Score</div>
-                    <div class="metric-change {'positive' if stability_score >= 60 else 'negative'}">
-                        {'✓ Strong' if stability_score >= 60 else '⚠ Building'}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("<br>", unsafe_allow_html=True)
+            html_parts = [
+                _METRIC_CARD_TPL.substitute(
+                    bg='#E6F0FF', fg='#0052CC', emoji='📊',
+                    color=dti_color, value=f'{dti:.1f}%', label='Debt-to-Income',
+                    status='positive' if dti < 35 else 'negative',
+                    status_text='✓ Healthy' if dti < 35 else '⚠ High'
+                ),
+                _METRIC_CARD_TPL.substitute(
+                    bg='#E3FCEF', fg='#36B37E', emoji='📈',
+                    color=cibil_color, value=cibil_score, label='CIBIL Score',
+                    status='positive' if cibil_score >= 700 else 'negative',
+                    status_text='✓ Good' if cibil_score >= 700 else '⚠ Fair'
+                ),
+                _METRIC_CARD_TPL.substitute(
+                    bg='#FFF4E5', fg='#FF8B00', emoji='💰',
+                    color=lir_color, value=f'{loan_income_ratio:.1f}x', label='Loan-to-Income',
+                    status='positive' if loan_income_ratio <= 1 else 'negative',
+                    status_text='✓ OK' if loan_income_ratio <= 1 else '⚠ Moderate'
+                ),
+                _METRIC_CARD_TPL.substitute(
+                    bg='#FFEBE6', fg='#DE350B', emoji='🏢',
+                    color=stab_color, value=stability_score, label='Stability Score',
+                    status='positive' if stability_score >= 60 else 'negative',
+                    status_text='✓ Strong' if stability_score >= 60 else '⚠ Building'
+                ),
+            ]
+            st.markdown(
+                '<div class="metrics-row">' + ''.join(html_parts) + '</div><br>',
+                unsafe_allow_html=True
+            )
             
             # EXPLANATION TABS
             st.markdown("### 📋 Decision Explanation")
@@ -1660,23 +1786,23 @@ def main():
                     suggestions.append(f"**Consider a smaller loan** — ₹{loan_amount:,} is high for your income.")
                 
                 if suggestions:
-                    st.markdown(f"""
-                    <div class="tips-container">
-                        <div class="tips-header">
-                            <div class="tips-icon">💡</div>
-                            <h3 class="tips-title">How to Improve Your Chances</h3>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    for i, suggestion in enumerate(suggestions, 1):
-                        st.markdown(f"""
-                        <div class="tip-item">
-                            <div class="tip-number">{i}</div>
-                            <div class="tip-text">{suggestion}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
+                    tips_html = ''.join(
+                        f'<div class="tip-item">'
+                        f'<div class="tip-number">{i}</div>'
+                        f'<div class="tip-text">{suggestion}</div>'
+                        f'</div>'
+                        for i, suggestion in enumerate(suggestions, 1)
+                    )
+                    st.markdown(
+                        '<div class="tips-container">'
+                        '<div class="tips-header">'
+                        '<div class="tips-icon">💡</div>'
+                        '<h3 class="tips-title">How to Improve Your Chances</h3>'
+                        '</div>'
+                        + tips_html +
+                        '</div>',
+                        unsafe_allow_html=True
+                    )
     
     # ═══════════════════════════════════════════════════════════════
     # PAGE: FAIRNESS MONITOR
@@ -1698,17 +1824,29 @@ def main():
         """, unsafe_allow_html=True)
         
         with st.spinner("Analyzing model fairness..."):
-            X = model.preprocess_data(training_data, is_training=False)
-            predictions = model.model.predict(X)
+            # Preprocessing the full dataset is the slow part of this page, so
+            # reuse the result across page switches. st.cache_data hands back a
+            # fresh copy of the frame on every rerun, so key on the cached
+            # model instance and the data shape rather than the frame's id.
+            data_key = (id(model), len(training_data))
+            if st.session_state.get('preprocessed_key') != data_key:
+                st.session_state.preprocessed_X = model.preprocess_data(training_data, is_training=False)
+                # Fairness metrics only need the 0/1 decision, so store it compactly
+                st.session_state.preprocessed_preds = (
+                    model.model.predict(st.session_state.preprocessed_X) >= 0.5
+                ).astype(np.uint8)
+                st.session_state.preprocessed_key = data_key
+            predictions = st.session_state.preprocessed_preds
             
             protected_attrs = pd.DataFrame({
-                'gender': training_data['gender'],
-                'age_group': create_age_groups(training_data['age']),
-                'income_group': create_income_groups(training_data['monthly_income']),
-                'employment_type': training_data['employment_type']
+                'gender': training_data['gender'].values,
+                'age_group': pd.cut(training_data['age'], bins=AGE_BINS, labels=AGE_LABELS),
+                'income_group': pd.cut(training_data['monthly_income'], bins=INCOME_BINS, labels=INCOME_LABELS),
+                'employment_type': training_data['employment_type'].values
             })
             
-            analyzer = FairnessAnalyzer(predictions, training_data['loan_approved'].values, protected_attrs)
+            actuals = training_data['loan_approved'].to_numpy(copy=False)
+            analyzer = FairnessAnalyzer(predictions, actuals, protected_attrs)
             report = analyzer.generate_fairness_report(['gender', 'age_group', 'income_group', 'employment_type'])
         
         if report['summary']['overall_fair']:
@@ -1776,49 +1914,11 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            training_data['cibil_range'] = pd.cut(
-                training_data['cibil_score'],
-                bins=[300, 500, 600, 700, 800, 900],
-                labels=['300-500', '501-600', '601-700', '701-800', '801-900']
-            )
-            
-            cibil_approval = training_data.groupby('cibil_range')['loan_approved'].agg(['mean']).reset_index()
-            cibil_approval.columns = ['CIBIL Range', 'Approval Rate']
-            cibil_approval['Approval Rate'] = cibil_approval['Approval Rate'] * 100
-            
-            fig_cibil = go.Figure()
-            fig_cibil.add_trace(go.Bar(
-                x=cibil_approval['CIBIL Range'],
-                y=cibil_approval['Approval Rate'],
-                marker_color=['#DE350B', '#FF8B00', '#FFAB00', '#36B37E', '#00875A'],
-                text=[f'{r:.0f}%' for r in cibil_approval['Approval Rate']],
-                textposition='outside'
-            ))
-            fig_cibil.update_layout(
-                title='<b>Approval Rate by CIBIL Score</b>',
-                xaxis_title='CIBIL Score Range',
-                yaxis_title='Approval Rate (%)',
-                height=350,
-                plot_bgcolor='white',
-                paper_bgcolor='white'
-            )
+            fig_cibil = create_cibil_approval_chart(training_data)
             st.plotly_chart(fig_cibil, use_container_width=True)
         
         with col2:
-            fig_loan = go.Figure()
-            fig_loan.add_trace(go.Histogram(
-                x=training_data['loan_amount'] / 100000,
-                nbinsx=25,
-                marker_color='#0052CC'
-            ))
-            fig_loan.update_layout(
-                title='<b>Loan Amount Distribution</b>',
-                xaxis_title='Loan Amount (₹ Lakhs)',
-                yaxis_title='Number of Applications',
-                height=350,
-                plot_bgcolor='white',
-                paper_bgcolor='white'
-            )
+            fig_loan = create_loan_amount_chart(training_data)
             st.plotly_chart(fig_loan, use_container_width=True)
     
     # ═══════════════════════════════════════════════════════════════
@@ -45,6 +45,12 @@ from .models import (
     Applicant,
     LoanApplication,
     ApplicationAuditLog,
+    AuditDailyRollup,
+    LoanApplicationStatusCount,
+    ApplicantKycStatusCount,
+    ensure_audit_partitions,
+    ensure_session_partitions,
+    drop_expired_session_partitions,
     ApplicationStatus,
     KYCStatus,
     EmploymentType,
@@ -57,7 +63,8 @@ from .repositories import (
     BaseRepository,
     ApplicantRepository,
     LoanApplicationRepository,
-    AuditLogRepository
+    AuditLogRepository,
+    invalidate_stats
 )
 
 __all__ = [
@@ -77,6 +84,12 @@ __all__ = [
     'Applicant',
     'LoanApplication',
     'ApplicationAuditLog',
+    'AuditDailyRollup',
+    'LoanApplicationStatusCount',
+    'ApplicantKycStatusCount',
+    'ensure_audit_partitions',
+    'ensure_session_partitions',
+    'drop_expired_session_partitions',
     
     # Enums
     'ApplicationStatus',
@@ -90,7 +103,8 @@ __all__ = [
     'BaseRepository',
     'ApplicantRepository',
     'LoanApplicationRepository',
-    'AuditLogRepository'
+    'AuditLogRepository',
+    'invalidate_stats'
 ]
 
 __version__ = '1.0.0'
@@ -0,0 +1,181 @@
+"""
+Async Repository Layer
+======================
+``AsyncSession`` (asyncpg) versions of the request-path lookups, so API
+handlers await the database instead of blocking the event loop.
+
+The API's lookup routes (``GET /applicants/{id}``, ``GET
+/applications/{id}``) use these through ``api.dependencies.get_async_db``.
+The sync repositories in ``repositories.py`` stay the interface for
+scripts, services and everything else; both share the applicant
+identifier cache.
+
+Requires ``sqlalchemy[asyncio]`` and ``asyncpg`` (``aiosqlite`` for the
+SQLite default); import this module directly (it is not re-exported
+from ``database``).
+
+Usage:
+    from database.connection import get_async_session_context
+    from database.async_repositories import AsyncApplicantRepository
+    
+    async with get_async_session_context() as session:
+        applicant = await AsyncApplicantRepository(session).get_by_email(email)
+
+Author: Loan Analytics Team
+Version: 1.0.0
+"""
+
+import json
+import logging
+from enum import Enum as PyEnum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.types import TypeDecorator
+
+from .models import Applicant, LoanApplication, ApplicationAuditLog
+from .repositories import ApplicantRepository, _cached_applicant_id, _remember_applicant_id
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseRepository:
+    """Base repository for ``AsyncSession``."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def commit(self):
+        """Commit current transaction."""
+        try:
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(f"Commit failed: {e}")
+            raise
+    
+    async def rollback(self):
+        """Rollback current transaction."""
+        await self.session.rollback()
+    
+    async def refresh(self, entity):
+        """Refresh entity from database."""
+        await self.session.refresh(entity)
+
+
+class AsyncApplicantRepository(AsyncBaseRepository):
+    """Async applicant lookups by id and unique identifiers."""
+    
+    async def get_by_id(self, applicant_id: UUID) -> Optional[Applicant]:
+        """Get applicant by ID (identity map first, then a primary key SELECT)."""
+        return await self.session.get(Applicant, applicant_id)
+    
+    async def _get_by_key(self, kind: str, value: str) -> Optional[Applicant]:
+        """Read-through identifier lookup, as ``ApplicantRepository._get_by_key``."""
+        column = ApplicantRepository._KEY_COLUMNS[kind]
+        cached_id = _cached_applicant_id(kind, value)
+        if cached_id is not None:
+            applicant = await self.session.get(Applicant, cached_id)
+            if applicant is not None and getattr(applicant, column.key) == value:
+                return applicant
+        
+        result = await self.session.execute(lambda_stmt(
+            lambda: select(Applicant).where(column == value).limit(1)
+        ))
+        applicant = result.scalars().first()
+        if applicant is not None:
+            _remember_applicant_id(kind, value, applicant.id)
+        return applicant
+    
+    async def get_by_email(self, email: str) -> Optional[Applicant]:
+        """Get applicant by email."""
+        return await self._get_by_key('email', email.lower())
+    
+    async def get_by_phone(self, phone: str) -> Optional[Applicant]:
+        """Get applicant by phone number."""
+        return await self._get_by_key('phone', phone)
+    
+    async def get_by_pan(self, pan: str) -> Optional[Applicant]:
+        """Get applicant by PAN number."""
+        return await self._get_by_key('pan', pan.upper())
+    
+    async def get_by_aadhaar(self, aadhaar: str) -> Optional[Applicant]:
+        """Get applicant by Aadhaar number."""
+        return await self._get_by_key('aadhaar', aadhaar)
+
+
+class AsyncLoanApplicationRepository(AsyncBaseRepository):
+    """Async loan application lookups."""
+    
+    async def get_by_id(self, application_id: UUID) -> Optional[LoanApplication]:
+        """Get application by ID with applicant data."""
+        result = await self.session.execute(lambda_stmt(
+            lambda: select(LoanApplication).options(
+                joinedload(LoanApplication.applicant)
+            ).where(LoanApplication.id == application_id).limit(1)
+        ))
+        return result.scalars().first()
+    
+    async def get_by_application_number(self, app_number: str) -> Optional[LoanApplication]:
+        """Get application by application number."""
+        result = await self.session.execute(lambda_stmt(
+            lambda: select(LoanApplication).options(
+                joinedload(LoanApplication.applicant)
+            ).where(LoanApplication.application_number == app_number).limit(1)
+        ))
+        return result.scalars().first()
+
+
+class AsyncAuditLogRepository(AsyncBaseRepository):
+    """Async audit log writes."""
+    
+    async def bulk_create(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Write many audit entries in one round-trip.
+        
+        Uses asyncpg's binary ``copy_records_to_table`` on PostgreSQL and
+        batched INSERTs elsewhere. Runs inside the session's transaction.
+        
+        Returns:
+            Number of rows written
+        """
+        if not entries:
+            return 0
+        
+        rows = ApplicationAuditLog._prepare_bulk_rows(entries)
+        table = ApplicationAuditLog.__table__
+        connection = await self.session.connection()
+        dialect = connection.dialect
+        
+        if dialect.driver != 'asyncpg':
+            chunk = ApplicationAuditLog.BULK_CHUNK_SIZE
+            for start in range(0, len(rows), chunk):
+                await self.session.execute(table.insert(), rows[start:start + chunk])
+            return len(rows)
+        
+        columns = sorted(rows[0])
+        records = []
+        for row in rows:
+            values = []
+            for key in columns:
+                value = row[key]
+                column_type = table.c[key].type
+                if isinstance(column_type, TypeDecorator):
+                    value = column_type.process_bind_param(value, dialect)
+                if isinstance(value, (dict, list)):
+                    # asyncpg's default jsonb codec takes text
+                    value = json.dumps(value, default=str)
+                elif isinstance(value, PyEnum):
+                    value = value.name
+                values.append(value)
+            records.append(tuple(values))
+        
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=columns
+        )
+        return len(rows)
@@ -1,7 +1,7 @@
 """
 Database Connection Manager
 ===========================
-SQLite connection management using SQLAlchemy.
+SQLite (default) or PostgreSQL connection management using SQLAlchemy.
 
 Supports:
 - Connection pooling
@@ -15,8 +15,8 @@ Version: 1.0.0
 
 import os
 import logging
-from typing import Optional, Generator
-from contextlib import contextmanager
+from typing import Optional, Generator, AsyncGenerator, TYPE_CHECKING
+from contextlib import contextmanager, asynccontextmanager
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
@@ -25,6 +25,9 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from .models import Base
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,9 +38,9 @@ class DatabaseConfig:
     
     def __init__(self):
         self.host = os.getenv('DB_HOST', 'localhost')
-        self.port = os.getenv('DB_PORT', '3306')
+        self.port = os.getenv('DB_PORT', '5432')
         self.database = os.getenv('DB_NAME', 'loan_approval')
-        self.username = os.getenv('DB_USER', 'root')
+        self.username = os.getenv('DB_USER', 'postgres')
         self.password = os.getenv('DB_PASSWORD', '')
         self.pool_size = int(os.getenv('DB_POOL_SIZE', '5'))
         self.max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '10'))
@@ -48,19 +51,23 @@ class DatabaseConfig:
         import pathlib
         self.db_path = pathlib.Path(__file__).parent.parent / 'data' / 'loan_approval.db'
     
+    def _postgres_url(self, driver: str) -> str:
+        """PostgreSQL URL for ``driver``; the sync and async engines share one server."""
+        return f"postgresql+{driver}://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+    
     @property
     def database_url(self) -> str:
-        """Get database connection URL (SQLite or MySQL)."""
+        """Get database connection URL (SQLite or PostgreSQL via psycopg2)."""
         if self.use_sqlite:
             return f"sqlite:///{self.db_path}"
-        return f"mysql+pymysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}?charset=utf8mb4"
+        return self._postgres_url('psycopg2')
     
     @property
     def async_database_url(self) -> str:
-        """Get async database connection URL."""
+        """Get async database connection URL (same backend as ``database_url``)."""
         if self.use_sqlite:
             return f"sqlite+aiosqlite:///{self.db_path}"
-        return f"mysql+aiomysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}?charset=utf8mb4"
+        return self._postgres_url('asyncpg')
 
 
 class DatabaseConnection:
@@ -73,6 +80,8 @@ class DatabaseConnection:
     _instance: Optional['DatabaseConnection'] = None
     _engine = None
     _session_factory = None
+    _async_engine = None
+    _async_session_factory = None
     
     def __new__(cls, config: Optional[DatabaseConfig] = None):
         if cls._instance is None:
@@ -125,11 +134,50 @@ class DatabaseConnection:
             logger.error(f"Failed to create database engine: {e}")
             raise
     
+    def _create_async_engine(self):
+        """Create the async engine (asyncpg) used by the request-path repositories."""
+        # Needs greenlet (sqlalchemy[asyncio]); imported here so sync-only users don't
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        
+        try:
+            if self.config.use_sqlite:
+                self._async_engine = create_async_engine(
+                    self.config.async_database_url,
+                    echo=self.config.echo
+                )
+            else:
+                self._async_engine = create_async_engine(
+                    self.config.async_database_url,
+                    pool_size=self.config.pool_size,
+                    max_overflow=self.config.max_overflow,
+                    pool_pre_ping=True,
+                    pool_recycle=3600,
+                    echo=self.config.echo
+                )
+            
+            self._async_session_factory = async_sessionmaker(
+                bind=self._async_engine,
+                autoflush=False,
+                expire_on_commit=False
+            )
+            logger.info("Async database engine created")
+            
+        except Exception as e:
+            logger.error(f"Failed to create async database engine: {e}")
+            raise
+    
     @property
     def engine(self):
         """Get the SQLAlchemy engine."""
         return self._engine
     
+    @property
+    def async_engine(self):
+        """Get the async SQLAlchemy engine (created on first use)."""
+        if self._async_engine is None:
+            self._create_async_engine()
+        return self._async_engine
+    
     def get_session(self) -> Session:
         """Get a new database session."""
         if not self._session_factory:
@@ -162,6 +210,36 @@ class DatabaseConnection:
         finally:
             session.close()
     
+    def get_async_session(self) -> 'AsyncSession':
+        """Get a new async database session."""
+        if self._async_session_factory is None:
+            self._create_async_engine()
+        return self._async_session_factory()
+    
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncGenerator['AsyncSession', None]:
+        """
+        Async counterpart of ``session_scope``.
+        
+        Usage:
+            async with db.async_session_scope() as session:
+                applicant = await AsyncApplicantRepository(session).get_by_id(id)
+        """
+        session = self.get_async_session()
+        try:
+            yield session
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.error(f"Database error: {e}")
+            raise
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Unexpected error: {e}")
+            raise
+        finally:
+            await session.close()
+    
     def create_tables(self):
         """Create all database tables."""
         try:
@@ -206,6 +284,12 @@ class DatabaseConnection:
         if self._engine:
             self._engine.dispose()
             logger.info("Database connections closed")
+    
+    async def close_async(self):
+        """Dispose the async engine, if one was created."""
+        if self._async_engine:
+            await self._async_engine.dispose()
+            logger.info("Async database connections closed")
 
 
 # ============================================================================
@@ -239,6 +323,11 @@ def get_db_session() -> Session:
     return get_db().get_session()
 
 
+def get_async_db_session() -> 'AsyncSession':
+    """Get a new async database session."""
+    return get_db().get_async_session()
+
+
 @contextmanager
 def get_session_context() -> Generator[Session, None, None]:
     """Context manager for database sessions."""
@@ -246,6 +335,13 @@ def get_session_context() -> Generator[Session, None, None]:
         yield session
 
 
+@asynccontextmanager
+async def get_async_session_context() -> AsyncGenerator['AsyncSession', None]:
+    """Async context manager for database sessions."""
+    async with get_db().async_session_scope() as session:
+        yield session
+
+
 def create_all_tables():
     """Create all database tables."""
     get_db().create_tables()
@@ -20,17 +20,23 @@ Author: Loan Analytics Team
 Version: 2.0.0
 """
 
+import csv
+import io
+import json
+import re
 import uuid
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 from typing import Optional, List, Any
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
-    Column, String, Integer, Float, Boolean, DateTime, Date, Text,
-    ForeignKey, Enum, Index, CheckConstraint, event
+    Column, String, Integer, BigInteger, SmallInteger, Float, Boolean, DateTime, Date, Text,
+    ForeignKey, Enum, Index, CheckConstraint, PrimaryKeyConstraint, event, desc, text,
+    literal_column
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.postgresql import UUID, JSONB, INET, insert as pg_insert
+from sqlalchemy.orm import relationship, declarative_base, validates
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -152,6 +158,51 @@ class AuditAction(PyEnum):
     DISBURSEMENT = "disbursement"
 
 
+# Precomputed member -> value strings for hot serialization paths
+_AUDIT_ACTION_VALUES = {action: action.value for action in AuditAction}
+
+# Stored smallint codes for audit actions. These are persisted: never
+# renumber, only append new codes.
+AUDIT_ACTION_CODES = {
+    AuditAction.CREATE: 1,
+    AuditAction.UPDATE: 2,
+    AuditAction.DELETE: 3,
+    AuditAction.STATUS_CHANGE: 4,
+    AuditAction.LOGIN: 5,
+    AuditAction.LOGOUT: 6,
+    AuditAction.PASSWORD_CHANGE: 7,
+    AuditAction.VERIFICATION: 8,
+    AuditAction.APPROVAL: 9,
+    AuditAction.REJECTION: 10,
+    AuditAction.DISBURSEMENT: 11,
+}
+_AUDIT_ACTIONS_BY_CODE = {code: action for action, code in AUDIT_ACTION_CODES.items()}
+
+
+class AuditActionCode(TypeDecorator):
+    """Stores an ``AuditAction`` (or its value string) as a 2-byte smallint."""
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return AUDIT_ACTION_CODES[AuditAction(value)]
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _AUDIT_ACTIONS_BY_CODE[value]
+
+
+# Strips phone formatting (Applicant._derive_phone_digits)
+_NON_DIGITS = re.compile(r'\D')
+
+# Native inet on PostgreSQL; text elsewhere (45 = longest IPv6 form), so
+# SQLite and MySQL setups can still create the tables
+IPAddress = String(45).with_variant(INET(), 'postgresql')
+
+
 # ============================================================================
 # Base Mixin for common fields
 # ============================================================================
@@ -181,6 +232,82 @@ class AuditMixin:
     updated_by = Column(UUID(as_uuid=True), nullable=True)
 
 
+# ============================================================================
+# Bulk Load Helpers
+# ============================================================================
+
+def fill_python_defaults(table, row: dict, now: datetime) -> dict:
+    """
+    Apply ``table``'s client-side column defaults to ``row`` in place.
+    
+    For load paths such as ``COPY`` that bypass SQLAlchemy's own default
+    handling. SQL expression defaults (``func.now()``) become ``now``.
+    """
+    for column in table.columns:
+        default = column.default
+        if default is None or column.key in row:
+            continue
+        if default.is_scalar:
+            row[column.key] = default.arg
+        elif default.is_callable:
+            row[column.key] = default.arg(None)
+        else:
+            row[column.key] = now
+    return row
+
+
+def copy_rows(session, table, rows: List[dict]) -> int:
+    """
+    Load rows into ``table`` with PostgreSQL ``COPY ... FROM STDIN``.
+    
+    All rows must have the same keys. Values are sent as CSV: TypeDecorator
+    binds are applied, dicts/lists go as JSON and enums by name (as
+    ``Enum`` columns store them). Requires a psycopg2 connection; runs
+    inside the session's transaction.
+    
+    Returns:
+        Number of rows copied
+    """
+    if not rows:
+        return 0
+    
+    columns = sorted(rows[0])
+    dialect = session.get_bind().dialect
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        values = []
+        for key in columns:
+            value = row[key]
+            column_type = table.c[key].type
+            if isinstance(column_type, TypeDecorator):
+                value = column_type.process_bind_param(value, dialect)
+            if value is None:
+                values.append('\\N')
+            elif isinstance(value, (dict, list)):
+                values.append(json.dumps(value, default=str))
+            elif isinstance(value, PyEnum):
+                values.append(value.name)
+            elif isinstance(value, (datetime, date)):
+                values.append(value.isoformat())
+            else:
+                values.append(str(value))
+        writer.writerow(values)
+    buffer.seek(0)
+    
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
+    finally:
+        cursor.close()
+    return len(rows)
+
+
 # ============================================================================
 # User Entity (for JWT Authentication)
 # ============================================================================
@@ -318,6 +445,10 @@ class Applicant(Base, TimestampMixin, SoftDeleteMixin, AuditMixin):
     email = Column(String(255), unique=True, nullable=False, index=True)
     phone_primary = Column(String(20), nullable=False, index=True)
     phone_alternate = Column(String(20), nullable=True)
+    # Digits-only forms of phone_primary for indexed equality search; set
+    # by _derive_phone_digits whenever phone_primary is assigned
+    phone_normalized = Column(String(20), unique=True)
+    phone_last4 = Column(String(4))
     
     # Current Address
     address_line1 = Column(String(255), nullable=True)
@@ -462,17 +593,35 @@ class Applicant(Base, TimestampMixin, SoftDeleteMixin, AuditMixin):
     __table_args__ = (
         Index('idx_applicant_email', 'email'),
         Index('idx_applicant_phone', 'phone_primary'),
+        Index('idx_applicant_phone_last4', 'phone_last4'),
         Index('idx_applicant_pan', 'pan_number'),
         Index('idx_applicant_ref', 'applicant_ref'),
         Index('idx_applicant_kyc_status', 'kyc_status'),
         Index('idx_applicant_created', 'created_at'),
         Index('idx_applicant_not_deleted', 'is_deleted'),
         Index('idx_applicant_city', 'city'),
+        # KYC work queue (iter_applicants_pending_kyc)
+        Index('ix_applicant_kyc_pending', 'created_at',
+              postgresql_where=text("NOT is_deleted AND kyc_status = 'PENDING'")),
         CheckConstraint('monthly_income >= 0', name='check_positive_income'),
         CheckConstraint('cibil_score IS NULL OR (cibil_score >= 300 AND cibil_score <= 900)', 
                        name='check_cibil_range'),
     )
     
+    @staticmethod
+    def phone_search_columns(phone: Optional[str]) -> dict:
+        """``phone_normalized`` / ``phone_last4`` values for a ``phone_primary``."""
+        digits = _NON_DIGITS.sub('', phone) if phone else ''
+        return {'phone_normalized': digits or None, 'phone_last4': digits[-4:] or None}
+    
+    @validates('phone_primary')
+    def _derive_phone_digits(self, key: str, value: Optional[str]) -> Optional[str]:
+        # Filled here rather than as generated columns so every dialect has
+        # them; Core UPDATEs of phone_primary must use phone_search_columns
+        for column, derived in self.phone_search_columns(value).items():
+            setattr(self, column, derived)
+        return value
+    
     @staticmethod
     def generate_applicant_ref() -> str:
         """Generate unique applicant reference."""
@@ -570,6 +719,27 @@ class Applicant(Base, TimestampMixin, SoftDeleteMixin, AuditMixin):
         return f"<Applicant(id={self.id}, ref='{self.applicant_ref}', name='{self.full_name}')>"
 
 
+# Full-name search expression. The trigram index below is built on exactly
+# this expression, so ILIKE '%...%' filters on it can use the index.
+APPLICANT_NAME_SEARCH = (
+    Applicant.first_name + literal_column("' '")
+    + func.coalesce(Applicant.middle_name, literal_column("''"))
+    + literal_column("' '") + Applicant.last_name
+)
+
+
+@event.listens_for(Applicant.__table__, 'after_create')
+def _create_applicant_name_trgm_index(target, connection, **kw):
+    """Create the pg_trgm GIN index backing substring name search."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_applicant_name_trgm ON applicants USING gin "
+        "((first_name || ' ' || coalesce(middle_name, '') || ' ' || last_name) gin_trgm_ops)"
+    ))
+
+
 # ============================================================================
 # Loan Application Entity
 # ============================================================================
@@ -725,11 +895,14 @@ class LoanApplication(Base, TimestampMixin, SoftDeleteMixin, AuditMixin):
     
     # Relationships
     applicant = relationship("Applicant", back_populates="loan_applications")
+    # lazy="raise": load explicitly with selectinload() to avoid N+1 queries;
+    # deletes rely on the FK's ON DELETE CASCADE instead of loading the rows
     audit_logs = relationship(
         "ApplicationAuditLog",
         back_populates="application",
         cascade="all, delete-orphan",
-        lazy="dynamic"
+        passive_deletes=True,
+        lazy="raise"
     )
     
     # Indexes
@@ -743,6 +916,12 @@ class LoanApplication(Base, TimestampMixin, SoftDeleteMixin, AuditMixin):
         Index('idx_loan_requires_review', 'requires_manual_review'),
         Index('idx_loan_assigned', 'assigned_to'),
         Index('idx_loan_risk', 'risk_level'),
+        # Status-filtered listings, newest first, without a heap visit for the summary columns
+        Index('ix_la_status_created', 'status', desc('created_at'),
+              postgresql_include=['loan_amount', 'approval_probability']),
+        # Manual review queue (get_applications_for_review)
+        Index('ix_la_review_pending', 'created_at',
+              postgresql_where=text("requires_manual_review AND status = 'UNDER_REVIEW'")),
         CheckConstraint('loan_amount >= 10000', name='check_min_loan_amount'),
         CheckConstraint('tenure_months >= 3 AND tenure_months <= 360', 
                        name='check_tenure_range'),
@@ -830,6 +1009,21 @@ class LoanApplication(Base, TimestampMixin, SoftDeleteMixin, AuditMixin):
         return f"<LoanApplication(id={self.id}, number='{self.application_number}', status='{self.status.value}')>"
 
 
+# Row size (bytes) above which PostgreSQL moves the largest values (the ML
+# explanation payloads) out to TOAST; the default is ~2 kB
+LOAN_APPLICATION_TOAST_TARGET = 512
+
+
+@event.listens_for(LoanApplication.__table__, 'after_create')
+def _tune_loan_application_toast(target, connection, **kw):
+    """Keep ML payloads out of the heap so scans read narrower tuples."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(
+        f"ALTER TABLE loan_applications SET (toast_tuple_target = {LOAN_APPLICATION_TOAST_TARGET})"
+    ))
+
+
 # ============================================================================
 # Application Audit Log Entity
 # ============================================================================
@@ -838,32 +1032,34 @@ class ApplicationAuditLog(Base, TimestampMixin):
     """
     Audit log for tracking all changes to entities.
     Never deleted - provides complete audit trail for compliance.
+    
+    On PostgreSQL the table is range-partitioned by month on ``created_at``;
+    see ``ensure_audit_partitions``.
     """
     __tablename__ = 'application_audit_logs'
     
-    # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Primary Key (with created_at, since PostgreSQL requires the partition key in it).
+    # Filled per row by SQLAlchemy; the server default covers raw SQL inserts.
+    id = Column(UUID(as_uuid=True), default=uuid.uuid4, server_default=func.gen_random_uuid())
     
     # References
     application_id = Column(
         UUID(as_uuid=True),
         ForeignKey('loan_applications.id', ondelete='CASCADE'),
-        nullable=True,
-        index=True
+        nullable=True
     )
-    applicant_id = Column(UUID(as_uuid=True), nullable=True, index=True)
-    user_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    applicant_id = Column(UUID(as_uuid=True), nullable=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
     
     # Action Details
     entity_type = Column(String(50), nullable=False)
     entity_id = Column(UUID(as_uuid=True), nullable=False)
-    action = Column(Enum(AuditAction), nullable=False, index=True)
+    action = Column(AuditActionCode, nullable=False)
     
     # Change Details
     field_name = Column(String(100), nullable=True)
-    old_value = Column(JSONB, nullable=True)
-    new_value = Column(JSONB, nullable=True)
-    changes = Column(JSONB, default=dict)
+    # Single delta payload: {field: {"old": ..., "new": ...}}
+    changes = Column(JSONB, nullable=False, default=dict, server_default='{}')
     
     # Context
     performed_by = Column(UUID(as_uuid=True), nullable=True)
@@ -871,48 +1067,469 @@ class ApplicationAuditLog(Base, TimestampMixin):
     performed_by_role = Column(String(50), nullable=True)
     
     # Request Context
-    ip_address = Column(String(50), nullable=True)
-    user_agent = Column(Text, nullable=True)
+    ip_address = Column(IPAddress, nullable=True)
+    user_agent = Column(String(512), nullable=True)
     request_id = Column(String(100), nullable=True)
     
     # Additional Info
-    reason = Column(Text, nullable=True)
-    notes = Column(Text, nullable=True)
+    reason = Column(String(1024), nullable=True)
+    notes = Column(String(2048), nullable=True)
     extra_data = Column(JSONB, default=dict)
     
     # Relationships
-    application = relationship("LoanApplication", back_populates="audit_logs")
+    application = relationship("LoanApplication", back_populates="audit_logs", lazy="raise")
     
-    # Indexes
+    # Indexes (declared only here, not via Column(index=True), so each
+    # column gets exactly one B-tree)
     __table_args__ = (
-        Index('idx_audit_application', 'application_id'),
+        # Application timeline as an index-only scan over the display columns
+        Index('idx_audit_app_time', 'application_id', desc('created_at'),
+              postgresql_include=['action', 'entity_type', 'field_name', 'performed_by_name']),
         Index('idx_audit_applicant', 'applicant_id'),
         Index('idx_audit_user', 'user_id'),
-        Index('idx_audit_entity', 'entity_type', 'entity_id'),
-        Index('idx_audit_action', 'action'),
+        # Entity timeline ("latest events for X") as an index-only scan
+        Index('idx_audit_entity', 'entity_type', 'entity_id', desc('created_at'),
+              postgresql_include=['action', 'performed_by']),
         Index('idx_audit_performed_by', 'performed_by'),
-        Index('idx_audit_created', 'created_at'),
+        # Append-only, time-ordered rows: BRIN prunes range scans at a tiny size
+        Index('idx_audit_created', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # jsonb_path_ops GIN indexes serve @> containment lookups
+        Index('idx_audit_changes_gin', 'changes',
+              postgresql_using='gin', postgresql_ops={'changes': 'jsonb_path_ops'}),
+        Index('idx_audit_extra_data_gin', 'extra_data',
+              postgresql_using='gin', postgresql_ops={'extra_data': 'jsonb_path_ops'}),
+        # Subnet containment scans (ip_address <<= '10.0.0.0/8')
+        Index('idx_audit_ip_gist', 'ip_address',
+              postgresql_using='gist', postgresql_ops={'ip_address': 'inet_ops'}),
+        CheckConstraint(f'action BETWEEN 1 AND {max(AUDIT_ACTION_CODES.values())}',
+                        name='check_audit_action_code'),
+        PrimaryKeyConstraint('id', 'created_at', name='pk_application_audit_logs'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
     
+    # Rows per INSERT batch; keeps bind parameters well under PostgreSQL's limit
+    BULK_CHUNK_SIZE = 1000
+    
+    # Free-text columns are capped so rows stay inline instead of being TOASTed
+    TEXT_LIMITS = {'user_agent': 512, 'reason': 1024, 'notes': 2048}
+    
+    @validates(*TEXT_LIMITS)
+    def _trim_text(self, key: str, value: Optional[str]) -> Optional[str]:
+        return value[:self.TEXT_LIMITS[key]] if value else value
+    
+    @classmethod
+    def _prepare_bulk_rows(cls, entries: List[dict]) -> List[dict]:
+        """Fill defaults, trim text and give every row the same keys (on copies)."""
+        now = datetime.now(timezone.utc)
+        rows = []
+        for entry in entries:
+            row = dict(entry)
+            row.setdefault('created_at', now)
+            row.setdefault('updated_at', now)
+            row.setdefault('changes', {})
+            row.setdefault('extra_data', {})
+            for key, limit in cls.TEXT_LIMITS.items():
+                if row.get(key):
+                    row[key] = row[key][:limit]
+            rows.append(row)
+        
+        # Bulk paths use one column set for all rows; an explicit NULL would
+        # bypass the id default
+        keys = set().union(*rows)
+        for row in rows:
+            for key in keys - row.keys():
+                row[key] = uuid.uuid4() if key == 'id' else None
+        return rows
+    
+    @classmethod
+    def bulk_log(cls, session, entries: List[dict]) -> int:
+        """
+        Insert many audit entries with executemany batches.
+        
+        Bypasses the ORM unit of work: timestamps are filled in Python, ``id``
+        comes from the column default, and rows go through a Core INSERT in
+        chunks of ``BULK_CHUNK_SIZE``. On PostgreSQL the INSERT skips rows
+        whose primary key ``(id, created_at)`` already exists: entries that
+        carry both (``AuditBatcher.defer`` stamps them) can be re-sent after
+        a failed commit without duplicating rows.
+        
+        Args:
+            session: Active SQLAlchemy session (the caller owns the transaction)
+            entries: Column-name -> value mappings, one per audit row
+        
+        Returns:
+            Number of rows submitted
+        """
+        if not entries:
+            return 0
+        
+        rows = cls._prepare_bulk_rows(entries)
+        table = cls.__table__
+        if session.get_bind().dialect.name == 'postgresql':
+            stmt = pg_insert(table).on_conflict_do_nothing(constraint='pk_application_audit_logs')
+        else:
+            stmt = table.insert()
+        for start in range(0, len(rows), cls.BULK_CHUNK_SIZE):
+            session.execute(stmt, rows[start:start + cls.BULK_CHUNK_SIZE])
+        return len(rows)
+    
+    @classmethod
+    def bulk_copy(cls, session, entries: List[dict]) -> int:
+        """
+        Stream many audit entries into the table with PostgreSQL ``COPY``.
+        
+        Same row preparation as ``bulk_log`` but a single round-trip for the
+        whole batch. Requires a psycopg2 connection; runs inside the
+        session's transaction.
+        
+        Returns:
+            Number of rows copied
+        """
+        if not entries:
+            return 0
+        
+        return copy_rows(session, cls.__table__, cls._prepare_bulk_rows(entries))
+    
+    @staticmethod
+    def delta(old_values: Optional[dict], new_values: Optional[dict]) -> dict:
+        """Pack before/after mappings into a ``{field: {"old", "new"}}`` delta."""
+        old_values = old_values or {}
+        new_values = new_values or {}
+        return {
+            field: {'old': old_values.get(field), 'new': new_values.get(field)}
+            for field in {**old_values, **new_values}
+        }
+    
+    def _side(self, key: str) -> Any:
+        """One side of ``changes``: scalar for single-field rows, else a mapping."""
+        changes = self.changes or {}
+        if self.field_name:
+            return (changes.get(self.field_name) or {}).get(key)
+        return {field: (diff or {}).get(key) for field, diff in changes.items()} or None
+    
+    @property
+    def old_value(self) -> Any:
+        """Previous value(s), derived from ``changes``."""
+        return self._side('old')
+    
+    @property
+    def new_value(self) -> Any:
+        """New value(s), derived from ``changes``."""
+        return self._side('new')
+    
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        performed_by = self.performed_by
+        ip_address = self.ip_address
+        created_at = self.created_at
         return {
             'id': str(self.id),
             'entity_type': self.entity_type,
             'entity_id': str(self.entity_id),
-            'action': self.action.value,
+            'action': _AUDIT_ACTION_VALUES[self.action],
             'field_name': self.field_name,
-            'old_value': self.old_value,
-            'new_value': self.new_value,
-            'performed_by': str(self.performed_by) if self.performed_by else None,
+            'old_value': self._side('old'),
+            'new_value': self._side('new'),
+            'performed_by': str(performed_by) if performed_by else None,
             'performed_by_name': self.performed_by_name,
             'reason': self.reason,
-            'ip_address': self.ip_address,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'ip_address': str(ip_address) if ip_address else None,
+            'created_at': created_at.isoformat() if created_at else None,
         }
     
     def __repr__(self):
-        return f"<AuditLog(id={self.id}, action='{self.action.value}', entity='{self.entity_type}')>"
+        return f"<AuditLog(id={self.id}, action='{_AUDIT_ACTION_VALUES[self.action]}', entity='{self.entity_type}')>"
+
+
+# Months of audit partitions to keep created ahead of the current one
+AUDIT_PARTITION_MONTHS_AHEAD = 2
+
+
+def _first_of_month(day: date, months_later: int = 0) -> date:
+    """First day of the month ``months_later`` months after ``day``'s month."""
+    month_index = day.year * 12 + (day.month - 1) + months_later
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _ensure_range_partition(
+    connection,
+    parent: str,
+    name: str,
+    column: str,
+    lower: date,
+    upper: date
+) -> None:
+    """
+    Create partition ``name`` of ``parent`` for ``[lower, upper)`` on ``column``.
+    
+    Rows for the range that already landed in ``{parent}_default`` are
+    moved into the new table before it is attached; PostgreSQL refuses a
+    plain ``CREATE TABLE ... PARTITION OF`` while the default partition
+    holds rows that belong to it. Caller owns the transaction.
+    """
+    if connection.execute(text("SELECT to_regclass(:name)"), {'name': name}).scalar() is not None:
+        return
+    
+    default = f"{parent}_default"
+    bounds = {'lower': lower, 'upper': upper}
+    has_default = connection.execute(
+        text("SELECT to_regclass(:name)"), {'name': default}
+    ).scalar() is not None
+    stranded = has_default and connection.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {default} "
+        f"WHERE {column} >= :lower AND {column} < :upper)"
+    ), bounds).scalar()
+    
+    partition_bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    if not stranded:
+        connection.execute(text(f"CREATE TABLE {name} PARTITION OF {parent} {partition_bounds}"))
+        return
+    
+    connection.execute(text(
+        f"CREATE TABLE {name} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    connection.execute(text(
+        f"WITH moved AS (DELETE FROM {default} "
+        f"WHERE {column} >= :lower AND {column} < :upper RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ), bounds)
+    connection.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {name} {partition_bounds}"))
+
+
+def _stranded_range_starts(connection, parent: str, column: str, unit: str) -> List[date]:
+    """Starts of the ``unit`` ('month' / 'week') ranges with rows in ``{parent}_default``."""
+    default = f"{parent}_default"
+    if connection.execute(text("SELECT to_regclass(:name)"), {'name': default}).scalar() is None:
+        return []
+    return sorted(start.date() for start in connection.execute(text(
+        f"SELECT DISTINCT date_trunc('{unit}', {column}) FROM {default}"
+    )).scalars())
+
+
+def ensure_audit_partitions(
+    connection,
+    months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD,
+    start: Optional[date] = None
+) -> List[str]:
+    """
+    Create monthly audit log partitions from ``start`` through ``months_ahead``.
+    
+    Idempotent; ``services.partition_service`` runs it periodically so next
+    month's partition exists before rows arrive. Rows that fell into the
+    default partition meanwhile are moved into their month's partition.
+    No-op outside PostgreSQL.
+    
+    Returns:
+        Names of the partitions ensured
+    """
+    if connection.dialect.name != 'postgresql':
+        return []
+    
+    month = _first_of_month(start or datetime.now(timezone.utc).date())
+    months = [_first_of_month(month, offset) for offset in range(months_ahead + 1)]
+    months += [
+        stranded for stranded in _stranded_range_starts(
+            connection, 'application_audit_logs', 'created_at', 'month'
+        ) if stranded not in months
+    ]
+    names = []
+    for lower in months:
+        upper = _first_of_month(lower, 1)
+        name = f"application_audit_logs_{lower:%Y_%m}"
+        _ensure_range_partition(
+            connection, 'application_audit_logs', name, 'created_at', lower, upper
+        )
+        names.append(name)
+    return names
+
+
+@event.listens_for(ApplicationAuditLog.__table__, 'after_create')
+def _create_audit_partitions(target, connection, **kw):
+    """Create the default and initial monthly partitions with the table."""
+    if connection.dialect.name != 'postgresql':
+        return
+    # Catches rows outside the pre-created months instead of failing the insert
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS application_audit_logs_default "
+        "PARTITION OF application_audit_logs DEFAULT"
+    ))
+    ensure_audit_partitions(connection)
+
+
+class AuditDailyRollup(Base):
+    """
+    Per-day audit event counts by entity type and action.
+    
+    Maintained on PostgreSQL by an AFTER INSERT trigger on
+    ``application_audit_logs`` so dashboards never scan the base table.
+    """
+    __tablename__ = 'audit_daily_rollup'
+    
+    day = Column(Date, primary_key=True)
+    entity_type = Column(String(50), primary_key=True)
+    action = Column(AuditActionCode, primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            'day': self.day.isoformat(),
+            'entity_type': self.entity_type,
+            'action': _AUDIT_ACTION_VALUES[self.action],
+            'count': self.count,
+        }
+
+
+_AUDIT_ROLLUP_FUNCTION = """
+CREATE OR REPLACE FUNCTION audit_daily_rollup_bump() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO audit_daily_rollup (day, entity_type, action, count)
+    VALUES ((NEW.created_at AT TIME ZONE 'UTC')::date, NEW.entity_type, NEW.action, 1)
+    ON CONFLICT (day, entity_type, action)
+    DO UPDATE SET count = audit_daily_rollup.count + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_AUDIT_ROLLUP_TRIGGER = """
+CREATE TRIGGER trg_audit_daily_rollup
+AFTER INSERT ON application_audit_logs
+FOR EACH ROW EXECUTE FUNCTION audit_daily_rollup_bump()
+"""
+
+
+@event.listens_for(ApplicationAuditLog.__table__, 'after_create')
+def _create_audit_rollup_trigger(target, connection, **kw):
+    """Install the trigger that keeps ``audit_daily_rollup`` current."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(_AUDIT_ROLLUP_FUNCTION))
+    connection.execute(text(_AUDIT_ROLLUP_TRIGGER))
+
+
+class LoanApplicationStatusCount(Base):
+    """
+    Number of loan applications per status.
+    
+    Maintained on PostgreSQL by a trigger on ``loan_applications`` so status
+    counts are a read of a dozen rows instead of a table scan.
+    """
+    __tablename__ = 'loan_application_status_counts'
+    
+    status = Column(Enum(ApplicationStatus), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+class ApplicantKycStatusCount(Base):
+    """
+    Number of (not soft-deleted) applicants per KYC status.
+    
+    Maintained on PostgreSQL by a trigger on ``applicants``.
+    """
+    __tablename__ = 'applicant_kyc_status_counts'
+    
+    kyc_status = Column(Enum(KYCStatus), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+_STATUS_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION loan_application_status_count_bump() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE loan_application_status_counts SET count = count - 1
+        WHERE status = OLD.status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO loan_application_status_counts (status, count)
+        VALUES (NEW.status, 1)
+        ON CONFLICT (status) DO UPDATE SET count = loan_application_status_counts.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_STATUS_COUNT_TRIGGER = """
+CREATE TRIGGER trg_loan_application_status_count
+AFTER INSERT OR DELETE OR UPDATE OF status ON loan_applications
+FOR EACH ROW EXECUTE FUNCTION loan_application_status_count_bump()
+"""
+
+_KYC_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION applicant_kyc_status_count_bump() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted AND OLD.kyc_status IS NOT NULL THEN
+        UPDATE applicant_kyc_status_counts SET count = count - 1
+        WHERE kyc_status = OLD.kyc_status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_deleted AND NEW.kyc_status IS NOT NULL THEN
+        INSERT INTO applicant_kyc_status_counts (kyc_status, count)
+        VALUES (NEW.kyc_status, 1)
+        ON CONFLICT (kyc_status) DO UPDATE SET count = applicant_kyc_status_counts.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_KYC_COUNT_TRIGGER = """
+CREATE TRIGGER trg_applicant_kyc_status_count
+AFTER INSERT OR DELETE OR UPDATE OF kyc_status, is_deleted ON applicants
+FOR EACH ROW EXECUTE FUNCTION applicant_kyc_status_count_bump()
+"""
+
+
+@event.listens_for(LoanApplication.__table__, 'after_create')
+def _create_status_count_trigger(target, connection, **kw):
+    """Install the trigger that keeps ``loan_application_status_counts`` current."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(_STATUS_COUNT_FUNCTION))
+    connection.execute(text(_STATUS_COUNT_TRIGGER))
+
+
+@event.listens_for(Applicant.__table__, 'after_create')
+def _create_kyc_count_trigger(target, connection, **kw):
+    """Install the trigger that keeps ``applicant_kyc_status_counts`` current."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(_KYC_COUNT_FUNCTION))
+    connection.execute(text(_KYC_COUNT_TRIGGER))
+
+
+# NOTIFY channel announcing new audit rows to LISTENing consumers
+AUDIT_NOTIFY_CHANNEL = 'audit_channel'
+
+# Payload carries the full primary key so consumers can fetch the row
+# with a partition-pruned PK lookup
+_AUDIT_NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION notify_audit() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify(
+        '{AUDIT_NOTIFY_CHANNEL}',
+        json_build_object('id', NEW.id, 'created_at', NEW.created_at)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_AUDIT_NOTIFY_TRIGGER = """
+CREATE TRIGGER trg_audit_notify
+AFTER INSERT ON application_audit_logs
+FOR EACH ROW EXECUTE FUNCTION notify_audit()
+"""
+
+
+@event.listens_for(ApplicationAuditLog.__table__, 'after_create')
+def _create_audit_notify_trigger(target, connection, **kw):
+    """Install the trigger that NOTIFYs ``AUDIT_NOTIFY_CHANNEL`` per new row."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(_AUDIT_NOTIFY_FUNCTION))
+    connection.execute(text(_AUDIT_NOTIFY_TRIGGER))
 
 
 # ============================================================================
@@ -922,26 +1539,32 @@ class ApplicationAuditLog(Base, TimestampMixin):
 class UserSession(Base, TimestampMixin):
     """
     Track user sessions and refresh tokens.
+    
+    On PostgreSQL the table is range-partitioned by week on ``expires_at``,
+    so expired sessions are removed by dropping whole partitions; see
+    ``drop_expired_session_partitions``.
     """
     __tablename__ = 'user_sessions'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
+    # Primary Key (with expires_at, since PostgreSQL requires the partition key in it)
+    id = Column(UUID(as_uuid=True), default=uuid.uuid4, server_default=func.gen_random_uuid())
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     
     # Token Info
-    refresh_token_jti = Column(String(255), unique=True, nullable=False, index=True)
-    access_token_jti = Column(String(255), nullable=True)
+    # JTIs are uuid4 values (see api.auth); 16-byte keys keep the lookup index small
+    refresh_token_jti = Column(UUID(as_uuid=True), nullable=False)
+    access_token_jti = Column(UUID(as_uuid=True), nullable=True)
     
     # Session Info
     device_name = Column(String(255), nullable=True)
     device_type = Column(String(50), nullable=True)
     browser = Column(String(100), nullable=True)
     os = Column(String(100), nullable=True)
-    ip_address = Column(String(50), nullable=True)
+    ip_address = Column(IPAddress, nullable=True)
     location = Column(String(255), nullable=True)
     
     # Status
-    is_active = Column(Boolean, default=True, index=True)
+    is_active = Column(Boolean, default=True)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     last_used_at = Column(DateTime(timezone=True), default=func.now())
     
@@ -950,12 +1573,116 @@ class UserSession(Base, TimestampMixin):
     revoked_at = Column(DateTime(timezone=True), nullable=True)
     revoked_reason = Column(String(255), nullable=True)
     
+    # Token validation and per-user listings only ever look at live sessions,
+    # so index just those rows; historical sessions stay out of the B-trees.
+    # Unique indexes on a partitioned table must contain the partition key.
     __table_args__ = (
-        Index('idx_session_user', 'user_id'),
-        Index('idx_session_token', 'refresh_token_jti'),
-        Index('idx_session_active', 'is_active'),
+        Index('idx_session_token_live', 'refresh_token_jti', 'expires_at', unique=True,
+              postgresql_where=text('is_active AND NOT revoked')),
+        Index('idx_session_user_live', 'user_id',
+              postgresql_where=text('is_active AND NOT revoked')),
         Index('idx_session_expires', 'expires_at'),
+        PrimaryKeyConstraint('id', 'expires_at', name='pk_user_sessions'),
+        {'postgresql_partition_by': 'RANGE (expires_at)'},
     )
     
     def __repr__(self):
         return f"<UserSession(id={self.id}, user_id={self.user_id}, active={self.is_active})>"
+
+
+# Weeks of session partitions to keep created ahead (covers refresh token lifetime)
+SESSION_PARTITION_WEEKS_AHEAD = 2
+
+# Weeks a session partition is kept after all of its sessions have expired
+SESSION_PARTITION_RETENTION_WEEKS = 4
+
+
+def _week_start(day: date, weeks_later: int = 0) -> date:
+    """Monday of the week ``weeks_later`` weeks after ``day``'s week."""
+    return day - timedelta(days=day.weekday()) + timedelta(weeks=weeks_later)
+
+
+def ensure_session_partitions(
+    connection,
+    weeks_ahead: int = SESSION_PARTITION_WEEKS_AHEAD,
+    start: Optional[date] = None
+) -> List[str]:
+    """
+    Create weekly session partitions from ``start`` through ``weeks_ahead``.
+    
+    Idempotent; ``services.partition_service`` runs it periodically before
+    ``drop_expired_session_partitions``. Sessions that fell into the
+    default partition are moved into their week's partition, so they are
+    dropped with it later. No-op outside PostgreSQL.
+    
+    Returns:
+        Names of the partitions ensured
+    """
+    if connection.dialect.name != 'postgresql':
+        return []
+    
+    week = _week_start(start or datetime.now(timezone.utc).date())
+    weeks = [_week_start(week, offset) for offset in range(weeks_ahead + 1)]
+    weeks += [
+        stranded for stranded in _stranded_range_starts(
+            connection, 'user_sessions', 'expires_at', 'week'
+        ) if stranded not in weeks
+    ]
+    names = []
+    for lower in weeks:
+        upper = _week_start(lower, 1)
+        name = f"user_sessions_{lower:%Y%m%d}"
+        _ensure_range_partition(connection, 'user_sessions', name, 'expires_at', lower, upper)
+        names.append(name)
+    return names
+
+
+def drop_expired_session_partitions(
+    connection,
+    retention_weeks: int = SESSION_PARTITION_RETENTION_WEEKS,
+    today: Optional[date] = None
+) -> List[str]:
+    """
+    Detach and drop weekly session partitions past the retention window.
+    
+    Replaces a bulk ``DELETE ... WHERE expires_at < now()``: dropping a
+    partition is constant-time and leaves no dead tuples to vacuum.
+    No-op outside PostgreSQL.
+    
+    Returns:
+        Names of the partitions dropped
+    """
+    if connection.dialect.name != 'postgresql':
+        return []
+    
+    cutoff = _week_start(today or datetime.now(timezone.utc).date(), -retention_weeks)
+    partitions = connection.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "WHERE parent.relname = 'user_sessions'"
+    )).scalars().all()
+    
+    dropped = []
+    for name in partitions:
+        suffix = name.rsplit('_', 1)[-1]
+        if not suffix.isdigit():
+            continue  # default partition
+        upper = _week_start(datetime.strptime(suffix, '%Y%m%d').date(), 1)
+        if upper <= cutoff:
+            connection.execute(text(f"ALTER TABLE user_sessions DETACH PARTITION {name}"))
+            connection.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
+
+
+@event.listens_for(UserSession.__table__, 'after_create')
+def _create_session_partitions(target, connection, **kw):
+    """Create the default and initial weekly partitions with the table."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS user_sessions_default "
+        "PARTITION OF user_sessions DEFAULT"
+    ))
+    ensure_session_partitions(connection)
@@ -15,23 +15,135 @@ Author: Loan Analytics Team
 Version: 1.0.0
 """
 
+import copy
+import functools
+import itertools
 import logging
-from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime, date
+import re
+import threading
+import time
+import warnings
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator, Iterable
+from datetime import datetime, date, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, or_, func, desc, asc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, desc, asc, cast, insert, update, select, lambda_stmt, Numeric
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload, defer
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from .models import (
-    Applicant, LoanApplication, ApplicationAuditLog,
-    ApplicationStatus, KYCStatus, EmploymentType
+    Applicant, LoanApplication, ApplicationAuditLog, AuditDailyRollup, APPLICANT_NAME_SEARCH,
+    LoanApplicationStatusCount, ApplicantKycStatusCount,
+    ApplicationStatus, KYCStatus, EmploymentType, AuditAction,
+    copy_rows, fill_python_defaults
 )
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Aggregate Cache
+# ============================================================================
+
+# Seconds a cached dashboard aggregate stays valid
+STATS_CACHE_TTL = 30
+
+_stats_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_stats_cache_lock = threading.Lock()
+
+
+def invalidate_stats() -> None:
+    """Drop all cached aggregates (call after writes that change them)."""
+    with _stats_cache_lock:
+        _stats_cache.clear()
+
+
+def _cached_stats(method: Callable) -> Callable:
+    """
+    Memoize an aggregate repository method for ``STATS_CACHE_TTL`` seconds.
+    
+    Process-local; keyed by the session's engine, method and arguments
+    (never the session itself), so two databases in one process do not
+    share entries. Callers get a copy, so mutating a result cannot poison
+    the cache.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        engine = self.session.get_bind().engine
+        key = (id(engine), method.__qualname__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with _stats_cache_lock:
+            hit = _stats_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return copy.deepcopy(hit[1])
+        
+        result = method(self, *args, **kwargs)
+        with _stats_cache_lock:
+            _stats_cache[key] = (now + STATS_CACHE_TTL, result)
+        return copy.deepcopy(result)
+    return wrapper
+
+
+# ============================================================================
+# Applicant Identifier Cache
+# ============================================================================
+
+# Seconds an identifier -> applicant id mapping is trusted
+APPLICANT_KEY_CACHE_TTL = 300
+APPLICANT_KEY_CACHE_SIZE = 10_000
+
+# (kind, normalized identifier) -> (expiry, applicant id). Ids rather than
+# entities are cached so nothing is shared across sessions.
+_applicant_key_cache: Dict[Tuple[str, str], Tuple[float, UUID]] = {}
+_applicant_key_lock = threading.Lock()
+
+
+def _cached_applicant_id(kind: str, value: str) -> Optional[UUID]:
+    """Applicant id cached for an identifier, if still fresh."""
+    with _applicant_key_lock:
+        hit = _applicant_key_cache.get((kind, value))
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def _remember_applicant_id(kind: str, value: str, applicant_id: UUID) -> None:
+    """Cache an identifier -> applicant id mapping."""
+    with _applicant_key_lock:
+        if len(_applicant_key_cache) >= APPLICANT_KEY_CACHE_SIZE:
+            # Dicts keep insertion order: drop the oldest entry
+            _applicant_key_cache.pop(next(iter(_applicant_key_cache)))
+        _applicant_key_cache[(kind, value)] = (
+            time.monotonic() + APPLICANT_KEY_CACHE_TTL, applicant_id
+        )
+
+# Timestamps are timestamptz: write aware UTC values (utcnow() is naive)
+UTC = timezone.utc
+
+# Bounds for turning date filters into inclusive timestamp ranges
+DAY_START = datetime.min.time()
+DAY_END = datetime.max.time()
+
+# Default rows per round trip for the streaming iterators
+STREAM_BATCH_SIZE = 1000
+
+# Hard cap on the deprecated list-returning queue getters
+LIST_ROW_CAP = 10_000
+
+# Rows per multi-row INSERT in bulk loads (matches insertmanyvalues' page size)
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Bulk loads at least this large go through COPY on PostgreSQL, in chunks of this size
+BULK_COPY_THRESHOLD = 10_000
+
+# Large ML payloads that list queries never serialize (to_dict skips them)
+_DEFERRED_APPLICATION_PAYLOADS = (
+    defer(LoanApplication.feature_contributions, raiseload=True),
+    defer(LoanApplication.status_history, raiseload=True),
+)
+
+
 class BaseRepository:
     """Base repository with common CRUD operations."""
     
@@ -54,6 +166,25 @@ class BaseRepository:
     def refresh(self, entity):
         """Refresh entity from database."""
         self.session.refresh(entity)
+    
+    def _paginate(self, query, page: int, page_size: int) -> Tuple[List[Any], int]:
+        """
+        Fetch one page of an (already sorted) query plus the total match count.
+        
+        The total rides along as a ``count(*) OVER ()`` window column, so the
+        filters are evaluated once in a single round-trip. Only an empty page
+        past the end needs a separate count.
+        """
+        offset = (page - 1) * page_size
+        rows = query.add_columns(
+            func.count().over().label('_total')
+        ).offset(offset).limit(page_size).all()
+        
+        if rows:
+            return [row[0] for row in rows], rows[0]._total
+        if offset == 0:
+            return [], 0
+        return [], query.order_by(None).count()
 
 
 class ApplicantRepository(BaseRepository):
@@ -69,6 +200,7 @@ class ApplicantRepository(BaseRepository):
         try:
             self.session.add(applicant)
             self.session.flush()  # Get ID without committing
+            invalidate_stats()
             logger.info(f"Created applicant: {applicant.id}")
             return applicant
         except IntegrityError as e:
@@ -77,52 +209,112 @@ class ApplicantRepository(BaseRepository):
             raise ValueError(f"Applicant with this email/phone already exists")
     
     def get_by_id(self, applicant_id: UUID) -> Optional[Applicant]:
-        """Get applicant by ID."""
-        return self.session.query(Applicant).filter(
-            Applicant.id == applicant_id
-        ).first()
+        """Get applicant by ID (identity map first, then a primary key SELECT)."""
+        return self.session.get(Applicant, applicant_id)
+    
+    # Lookup kind -> identifying column, shared by the cached getters
+    _KEY_COLUMNS = {
+        'email': Applicant.email,
+        'phone': Applicant.phone_primary,
+        'pan': Applicant.pan_number,
+        'aadhaar': Applicant.aadhaar_number,
+    }
+    
+    def _get_by_key(self, kind: str, value: str) -> Optional[Applicant]:
+        """
+        Read-through lookup on a unique identifier.
+        
+        A cached hit becomes a primary-key ``session.get`` (free when the
+        applicant is already in the identity map); the identifier is
+        re-checked so a stale mapping falls back to the query.
+        """
+        column = self._KEY_COLUMNS[kind]
+        cached_id = _cached_applicant_id(kind, value)
+        if cached_id is not None:
+            applicant = self.session.get(Applicant, cached_id)
+            if applicant is not None and getattr(applicant, column.key) == value:
+                return applicant
+        
+        # lambda_stmt caches the compiled SELECT per lookup kind
+        applicant = self.session.execute(lambda_stmt(
+            lambda: select(Applicant).where(column == value).limit(1)
+        )).scalars().first()
+        if applicant is not None:
+            _remember_applicant_id(kind, value, applicant.id)
+        return applicant
+    
+    def _forget_keys(self, applicant: Applicant) -> None:
+        """Drop cached identifier mappings for an applicant's current values."""
+        with _applicant_key_lock:
+            for kind, column in self._KEY_COLUMNS.items():
+                _applicant_key_cache.pop((kind, getattr(applicant, column.key, None)), None)
     
     def get_by_email(self, email: str) -> Optional[Applicant]:
         """Get applicant by email."""
-        return self.session.query(Applicant).filter(
-            Applicant.email == email.lower()
-        ).first()
+        return self._get_by_key('email', email.lower())
     
     def get_by_phone(self, phone: str) -> Optional[Applicant]:
         """Get applicant by phone number."""
-        return self.session.query(Applicant).filter(
-            Applicant.phone == phone
-        ).first()
+        return self._get_by_key('phone', phone)
     
     def get_by_pan(self, pan: str) -> Optional[Applicant]:
         """Get applicant by PAN number."""
-        return self.session.query(Applicant).filter(
-            Applicant.pan_number == pan.upper()
-        ).first()
+        return self._get_by_key('pan', pan.upper())
     
     def get_by_aadhaar(self, aadhaar: str) -> Optional[Applicant]:
         """Get applicant by Aadhaar number."""
-        return self.session.query(Applicant).filter(
-            Applicant.aadhaar_number == aadhaar
-        ).first()
+        return self._get_by_key('aadhaar', aadhaar)
     
     def update(self, applicant: Applicant, data: Dict[str, Any]) -> Applicant:
         """Update applicant fields."""
         for key, value in data.items():
             if hasattr(applicant, key) and key not in ['id', 'created_at']:
                 setattr(applicant, key, value)
-        applicant.updated_at = datetime.utcnow()
+        applicant.updated_at = datetime.now(UTC)
         self.session.flush()
+        invalidate_stats()
         logger.info(f"Updated applicant: {applicant.id}")
         return applicant
     
+    # Columns update_by_id() may write; the phone search columns follow phone_primary
+    _UPDATABLE = frozenset(
+        c.key for c in Applicant.__table__.columns
+    ) - {'id', 'created_at', 'phone_normalized', 'phone_last4'}
+    
+    def update_by_id(self, applicant_id: UUID, data: Dict[str, Any]) -> bool:
+        """
+        Update applicant fields with a single UPDATE statement.
+        
+        Keys outside ``_UPDATABLE`` are ignored. The applicant is not loaded;
+        a copy already in the session is synchronized. A Core UPDATE skips
+        the ORM validators, so the phone search columns are recomputed here.
+        Cached identifier mappings need no purge: hits are re-checked
+        against the row.
+        
+        Returns:
+            True if the applicant exists
+        """
+        values = {k: v for k, v in data.items() if k in self._UPDATABLE}
+        if 'phone_primary' in values:
+            values.update(Applicant.phone_search_columns(values['phone_primary']))
+        values['updated_at'] = datetime.now(UTC)
+        result = self.session.execute(
+            update(Applicant).where(Applicant.id == applicant_id).values(**values)
+        )
+        if result.rowcount:
+            invalidate_stats()
+            logger.info(f"Updated applicant: {applicant_id}")
+        return result.rowcount > 0
+    
     def delete(self, applicant_id: UUID) -> bool:
-        """Soft delete applicant (set is_active=False)."""
+        """Soft delete applicant (set is_deleted=True)."""
         applicant = self.get_by_id(applicant_id)
         if applicant:
-            applicant.is_active = False
-            applicant.updated_at = datetime.utcnow()
+            self._forget_keys(applicant)
+            applicant.soft_delete()
+            applicant.updated_at = datetime.now(UTC)
             self.session.flush()
+            invalidate_stats()
             logger.info(f"Deactivated applicant: {applicant_id}")
             return True
         return False
@@ -131,8 +323,10 @@ class ApplicantRepository(BaseRepository):
         """Permanently delete applicant (use with caution!)."""
         applicant = self.get_by_id(applicant_id)
         if applicant:
+            self._forget_keys(applicant)
             self.session.delete(applicant)
             self.session.flush()
+            invalidate_stats()
             logger.info(f"Permanently deleted applicant: {applicant_id}")
             return True
         return False
@@ -160,27 +354,32 @@ class ApplicantRepository(BaseRepository):
         Returns:
             Tuple of (list of applicants, total count)
         """
-        query = self.session.query(Applicant)
+        # Results go straight to serializers: fail loudly on lazy loads (N+1)
+        query = self.session.query(Applicant).options(raiseload('*'))
         
         # Apply filters
         filters = []
         
         if is_active is not None:
-            filters.append(Applicant.is_active == is_active)
+            # "Active" applicants are the ones not soft-deleted
+            filters.append(Applicant.is_deleted == (not is_active))
         
         if name:
-            name_filter = or_(
-                Applicant.first_name.ilike(f'%{name}%'),
-                Applicant.last_name.ilike(f'%{name}%'),
-                Applicant.middle_name.ilike(f'%{name}%')
-            )
-            filters.append(name_filter)
+            # Each word must appear somewhere in the full name; served by the
+            # ix_applicant_name_trgm trigram index on PostgreSQL
+            for term in name.split():
+                filters.append(APPLICANT_NAME_SEARCH.ilike(f'%{term}%'))
         
         if email:
             filters.append(Applicant.email.ilike(f'%{email}%'))
         
         if phone:
-            filters.append(Applicant.phone.contains(phone))
+            # Full numbers match exactly, shorter input matches the last 4 digits
+            digits = re.sub(r'\D', '', phone)
+            if len(digits) >= 10:
+                filters.append(Applicant.phone_normalized == digits)
+            else:
+                filters.append(Applicant.phone_last4 == digits[-4:])
         
         if city:
             filters.append(Applicant.city.ilike(f'%{city}%'))
@@ -203,9 +402,6 @@ class ApplicantRepository(BaseRepository):
         if filters:
             query = query.filter(and_(*filters))
         
-        # Get total count
-        total = query.count()
-        
         # Apply sorting
         sort_column = getattr(Applicant, sort_by, Applicant.created_at)
         if sort_order.lower() == 'desc':
@@ -213,35 +409,60 @@ class ApplicantRepository(BaseRepository):
         else:
             query = query.order_by(asc(sort_column))
         
-        # Apply pagination
-        offset = (page - 1) * page_size
-        applicants = query.offset(offset).limit(page_size).all()
-        
-        return applicants, total
+        # Page and total count in one query
+        return self._paginate(query, page, page_size)
     
     def get_all_active(self) -> List[Applicant]:
-        """Get all active applicants."""
+        """Get all active (not deleted) applicants."""
         return self.session.query(Applicant).filter(
-            Applicant.is_active == True
+            Applicant.is_deleted == False
         ).all()
     
+    @_cached_stats
     def count_by_kyc_status(self) -> Dict[str, int]:
-        """Get count of applicants by KYC status."""
-        results = self.session.query(
-            Applicant.kyc_status,
-            func.count(Applicant.id)
-        ).filter(
-            Applicant.is_active == True
-        ).group_by(Applicant.kyc_status).all()
+        """
+        Get count of (not deleted) applicants by KYC status.
+        
+        Reads the trigger-maintained ``applicant_kyc_status_counts`` on
+        PostgreSQL; other databases aggregate the applicants table.
+        """
+        if self.session.get_bind().dialect.name == 'postgresql':
+            results = self.session.query(
+                ApplicantKycStatusCount.kyc_status,
+                ApplicantKycStatusCount.count
+            ).filter(ApplicantKycStatusCount.count > 0).all()
+        else:
+            results = self.session.query(
+                Applicant.kyc_status,
+                func.count(Applicant.id)
+            ).filter(
+                Applicant.is_deleted == False,
+                Applicant.kyc_status != None
+            ).group_by(Applicant.kyc_status).all()
         
         return {status.value: count for status, count in results}
     
-    def get_applicants_pending_kyc(self) -> List[Applicant]:
-        """Get applicants with pending KYC verification."""
-        return self.session.query(Applicant).filter(
-            Applicant.is_active == True,
+    def iter_applicants_pending_kyc(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE,
+        limit: Optional[int] = None
+    ) -> Iterator[Applicant]:
+        """Stream applicants with pending KYC verification, oldest first."""
+        query = self.session.query(Applicant).options(raiseload('*')).filter(
+            Applicant.is_deleted == False,
             Applicant.kyc_status == KYCStatus.PENDING
-        ).all()
+        ).order_by(asc(Applicant.created_at))
+        if limit is not None:
+            query = query.limit(limit)
+        return iter(query.yield_per(batch_size))
+    
+    def get_applicants_pending_kyc(self) -> List[Applicant]:
+        """Deprecated: use iter_applicants_pending_kyc. Capped at LIST_ROW_CAP rows."""
+        warnings.warn(
+            "get_applicants_pending_kyc is deprecated; use iter_applicants_pending_kyc",
+            DeprecationWarning, stacklevel=2
+        )
+        return list(self.iter_applicants_pending_kyc(limit=LIST_ROW_CAP))
     
     def update_kyc_status(
         self,
@@ -249,40 +470,58 @@ class ApplicantRepository(BaseRepository):
         status: KYCStatus,
         verified_by: Optional[str] = None
     ) -> Optional[Applicant]:
-        """Update KYC status for an applicant."""
-        applicant = self.get_by_id(applicant_id)
+        """Update KYC status for an applicant (one UPDATE ... RETURNING, no SELECT)."""
+        now = datetime.now(UTC)
+        values = {'kyc_status': status, 'updated_at': now}
+        if status == KYCStatus.VERIFIED:
+            values['kyc_completed_at'] = now
+            values['kyc_verified_by'] = verified_by
+        
+        applicant = self.session.execute(
+            update(Applicant)
+            .where(Applicant.id == applicant_id)
+            .values(**values)
+            .returning(Applicant)
+        ).scalar_one_or_none()
         if applicant:
-            applicant.kyc_status = status
-            if status == KYCStatus.VERIFIED:
-                applicant.kyc_verified_at = datetime.utcnow()
-                applicant.kyc_verified_by = verified_by
-            applicant.updated_at = datetime.utcnow()
-            self.session.flush()
+            invalidate_stats()
             logger.info(f"Updated KYC status for {applicant_id}: {status.value}")
-            return applicant
-        return None
+        return applicant
     
-    def get_high_value_applicants(self, min_income: float = 100000) -> List[Applicant]:
-        """Get high-value applicants based on income."""
-        return self.session.query(Applicant).filter(
-            Applicant.is_active == True,
+    def iter_high_value_applicants(
+        self,
+        min_income: float = 100000,
+        batch_size: int = STREAM_BATCH_SIZE,
+        limit: Optional[int] = None
+    ) -> Iterator[Applicant]:
+        """Stream high-value applicants, highest income first."""
+        query = self.session.query(Applicant).filter(
+            Applicant.is_deleted == False,
             Applicant.monthly_income >= min_income
-        ).order_by(desc(Applicant.monthly_income)).all()
+        ).order_by(desc(Applicant.monthly_income))
+        if limit is not None:
+            query = query.limit(limit)
+        return iter(query.yield_per(batch_size))
     
+    def get_high_value_applicants(self, min_income: float = 100000) -> List[Applicant]:
+        """Deprecated: use iter_high_value_applicants. Capped at LIST_ROW_CAP rows."""
+        warnings.warn(
+            "get_high_value_applicants is deprecated; use iter_high_value_applicants",
+            DeprecationWarning, stacklevel=2
+        )
+        return list(self.iter_high_value_applicants(min_income, limit=LIST_ROW_CAP))
+    
+    @_cached_stats
     def get_statistics(self) -> Dict[str, Any]:
         """Get applicant statistics."""
-        total = self.session.query(func.count(Applicant.id)).filter(
-            Applicant.is_active == True
-        ).scalar()
-        
-        avg_income = self.session.query(func.avg(Applicant.monthly_income)).filter(
-            Applicant.is_active == True
-        ).scalar()
-        
-        avg_cibil = self.session.query(func.avg(Applicant.cibil_score)).filter(
-            Applicant.is_active == True,
-            Applicant.cibil_score != None
-        ).scalar()
+        # One scan; AVG already skips NULL cibil scores
+        total, avg_income, avg_cibil = self.session.query(
+            func.count(Applicant.id),
+            func.avg(Applicant.monthly_income),
+            func.avg(Applicant.cibil_score)
+        ).filter(
+            Applicant.is_deleted == False
+        ).one()
         
         kyc_counts = self.count_by_kyc_status()
         
@@ -311,6 +550,7 @@ class LoanApplicationRepository(BaseRepository):
             
             self.session.add(application)
             self.session.flush()
+            invalidate_stats()
             logger.info(f"Created loan application: {application.application_number}")
             return application
         except IntegrityError as e:
@@ -318,21 +558,94 @@ class LoanApplicationRepository(BaseRepository):
             logger.error(f"Failed to create application: {e}")
             raise ValueError(f"Failed to create loan application")
     
+    def bulk_create(self, applications: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert many applications from column mappings (for ingest jobs).
+        
+        ``applications`` may be any iterable, including a generator; at most
+        ``BULK_COPY_THRESHOLD`` rows are held in memory. Missing application
+        numbers are generated in Python. Loads smaller than the threshold use
+        multi-row INSERTs of ``BULK_INSERT_CHUNK_SIZE``; larger loads on
+        PostgreSQL are streamed with ``COPY``.
+        
+        Returns:
+            Number of applications inserted
+        """
+        source = iter(applications)
+        batch = list(itertools.islice(source, BULK_COPY_THRESHOLD))
+        use_copy = (
+            len(batch) == BULK_COPY_THRESHOLD
+            and self.session.get_bind().dialect.name == 'postgresql'
+        )
+        table = LoanApplication.__table__
+        total = 0
+        
+        while batch:
+            now = datetime.now(UTC)
+            rows = []
+            for mapping in batch:
+                row = dict(mapping)
+                if not row.get('application_number'):
+                    row['application_number'] = LoanApplication.generate_application_number()
+                rows.append(row)
+            
+            if use_copy:
+                # COPY applies no client-side defaults and needs one column set
+                for row in rows:
+                    fill_python_defaults(table, row, now)
+                keys = set().union(*rows)
+                for row in rows:
+                    for key in keys - row.keys():
+                        row[key] = None
+                copy_rows(self.session, table, rows)
+            else:
+                for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                    self.session.execute(
+                        insert(LoanApplication), rows[start:start + BULK_INSERT_CHUNK_SIZE]
+                    )
+            
+            total += len(rows)
+            batch = list(itertools.islice(source, BULK_COPY_THRESHOLD))
+        
+        if total:
+            invalidate_stats()
+            logger.info(f"Bulk created {total} loan applications")
+        return total
+    
     def get_by_id(self, application_id: UUID) -> Optional[LoanApplication]:
         """Get application by ID with applicant data."""
+        return self.session.execute(lambda_stmt(
+            lambda: select(LoanApplication).options(
+                joinedload(LoanApplication.applicant)
+            ).where(LoanApplication.id == application_id).limit(1)
+        )).scalars().first()
+    
+    def _get_for_update(self, application_id: UUID) -> Optional[LoanApplication]:
+        """
+        Get an application for mutation: a single-table primary key lookup.
+        
+        Relationships are ``raiseload`` so write paths never lazily pull the
+        applicant (or anything else) by accident; use ``get_by_id`` for reads.
+        """
+        return self.session.get(
+            LoanApplication, application_id, options=[raiseload('*')]
+        )
+    
+    def get_with_audit_logs(self, application_ids: List[UUID]) -> List[LoanApplication]:
+        """Get applications with their audit logs batch-loaded in one extra query."""
         return self.session.query(LoanApplication).options(
-            joinedload(LoanApplication.applicant)
+            selectinload(LoanApplication.audit_logs)
         ).filter(
-            LoanApplication.id == application_id
-        ).first()
+            LoanApplication.id.in_(application_ids)
+        ).all()
     
     def get_by_application_number(self, app_number: str) -> Optional[LoanApplication]:
         """Get application by application number."""
-        return self.session.query(LoanApplication).options(
-            joinedload(LoanApplication.applicant)
-        ).filter(
-            LoanApplication.application_number == app_number
-        ).first()
+        return self.session.execute(lambda_stmt(
+            lambda: select(LoanApplication).options(
+                joinedload(LoanApplication.applicant)
+            ).where(LoanApplication.application_number == app_number).limit(1)
+        )).scalars().first()
     
     def get_by_applicant_id(self, applicant_id: UUID) -> List[LoanApplication]:
         """Get all applications for an applicant."""
@@ -345,81 +658,125 @@ class LoanApplicationRepository(BaseRepository):
         application_id: UUID,
         status: ApplicationStatus,
         updated_by: str,
-        remarks: Optional[str] = None
+        remarks: Optional[str] = None,
+        defer_audit: Optional[List[Dict[str, Any]]] = None
     ) -> Optional[LoanApplication]:
-        """Update application status with audit trail."""
-        application = self.get_by_id(application_id)
-        if application:
-            old_status = application.status
-            application.status = status
-            application.status_updated_at = datetime.utcnow()
-            application.status_updated_by = updated_by
-            
-            if remarks:
-                application.review_remarks = remarks
+        """
+        Update application status with audit trail.
+        
+        Pass ``defer_audit`` to collect the audit row instead of writing it;
+        flush the collected rows with ``AuditLogRepository.bulk_create``.
+        """
+        values = {
+            'status': status,
+            'status_updated_at': datetime.now(UTC),
+            'status_updated_by': updated_by,
+        }
+        if remarks:
+            values['reviewer_notes'] = remarks
+        
+        transitioned = self._transition(application_id, values)
+        if transitioned:
+            application, old_status = transitioned
             
             # Create audit log
-            audit_log = ApplicationAuditLog(
-                application_id=application_id,
-                action='status_change',
-                field_name='status',
-                old_value=old_status.value,
-                new_value=status.value,
-                changed_by=updated_by,
-                remarks=remarks
-            )
-            self.session.add(audit_log)
-            self.session.flush()
+            self._record_audit({
+                'entity_type': 'loan_application',
+                'entity_id': application_id,
+                'application_id': application_id,
+                'action': AuditAction.STATUS_CHANGE,
+                'field_name': 'status',
+                'changes': {'status': {'old': old_status.value, 'new': status.value}},
+                'performed_by': updated_by,
+                'reason': remarks
+            }, defer_audit)
+            invalidate_stats()
             
             logger.info(f"Updated application {application_id} status: {old_status.value} -> {status.value}")
             return application
         return None
     
+    @staticmethod
+    def _prediction_values(prediction_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values (including the derived status) for an ML prediction result."""
+        now = datetime.now(UTC)
+        values = {
+            # Prediction fields
+            'approval_probability': prediction_result.get('approval_probability'),
+            'confidence_score': prediction_result.get('confidence_score'),
+            'risk_level': prediction_result.get('risk_level'),
+            'model_version': prediction_result.get('model_version'),
+            'model_id': prediction_result.get('model_id'),
+            
+            # Explanation fields
+            'decision_explanation': prediction_result.get('explanation'),
+            'positive_factors': prediction_result.get('positive_factors', []),
+            'negative_factors': prediction_result.get('negative_factors', []),
+            'feature_contributions': prediction_result.get('feature_contributions', {}),
+            
+            # Eligibility tips
+            'eligibility_tips': prediction_result.get('eligibility_tips', []),
+            'action_items': prediction_result.get('action_items', []),
+            
+            'status_updated_at': now,
+            'updated_at': now,
+        }
+        
+        # Set status based on prediction
+        if prediction_result.get('approved'):
+            if prediction_result.get('requires_manual_review'):
+                review_reason = prediction_result.get('review_reason')
+                values['status'] = ApplicationStatus.UNDER_REVIEW
+                values['requires_manual_review'] = True
+                values['manual_review_reasons'] = [review_reason] if review_reason else []
+            else:
+                values['status'] = ApplicationStatus.APPROVED
+        else:
+            values['status'] = ApplicationStatus.REJECTED
+            values['rejection_reason'] = prediction_result.get('rejection_reason', 'Application did not meet eligibility criteria')
+        return values
+    
     def update_ml_prediction(
         self,
         application_id: UUID,
         prediction_result: Dict[str, Any]
     ) -> Optional[LoanApplication]:
         """Update application with ML prediction results."""
-        application = self.get_by_id(application_id)
+        application = self._get_for_update(application_id)
         if application:
-            # Update prediction fields
-            application.approval_probability = prediction_result.get('approval_probability')
-            application.confidence_score = prediction_result.get('confidence_score')
-            application.risk_level = prediction_result.get('risk_level')
-            application.model_version = prediction_result.get('model_version')
-            application.model_id = prediction_result.get('model_id')
-            
-            # Update explanation fields
-            application.decision_explanation = prediction_result.get('explanation')
-            application.positive_factors = prediction_result.get('positive_factors', [])
-            application.negative_factors = prediction_result.get('negative_factors', [])
-            application.feature_contributions = prediction_result.get('feature_contributions', {})
-            
-            # Update eligibility tips
-            application.eligibility_tips = prediction_result.get('eligibility_tips', [])
-            application.action_items = prediction_result.get('action_items', [])
-            
-            # Set status based on prediction
-            if prediction_result.get('approved'):
-                if prediction_result.get('requires_manual_review'):
-                    application.status = ApplicationStatus.UNDER_REVIEW
-                    application.requires_manual_review = True
-                    application.manual_review_reason = prediction_result.get('review_reason')
-                else:
-                    application.status = ApplicationStatus.APPROVED
-            else:
-                application.status = ApplicationStatus.REJECTED
-                application.rejection_reason = prediction_result.get('rejection_reason', 'Application did not meet eligibility criteria')
-            
-            application.status_updated_at = datetime.utcnow()
-            application.updated_at = datetime.utcnow()
+            for key, value in self._prediction_values(prediction_result).items():
+                setattr(application, key, value)
             
             self.session.flush()
+            invalidate_stats()
             logger.info(f"Updated ML prediction for application: {application_id}")
             return application
         return None
     
+    def bulk_update_ml_predictions(self, predictions: List[Dict[str, Any]]) -> int:
+        """
+        Apply many ML prediction results in batched UPDATEs.
+        
+        Each item is a prediction result (as for ``update_ml_prediction``)
+        plus the application ``id``. Statuses are derived in Python and rows
+        go out as an executemany UPDATE keyed on the primary key, without
+        loading the applications first.
+        
+        Returns:
+            Number of applications updated
+        """
+        if not predictions:
+            return 0
+        
+        mappings = [
+            {'id': prediction['id'], **self._prediction_values(prediction)}
+            for prediction in predictions
+        ]
+        self.session.execute(update(LoanApplication), mappings)
+        invalidate_stats()
+        logger.info(f"Updated ML predictions for {len(mappings)} applications")
+        return len(mappings)
+    
     def search(
         self,
         applicant_id: Optional[UUID] = None,
@@ -443,8 +800,11 @@ class LoanApplicationRepository(BaseRepository):
         Returns:
             Tuple of (list of applications, total count)
         """
+        # Results go straight to serializers: fail loudly on lazy loads (N+1)
         query = self.session.query(LoanApplication).options(
-            joinedload(LoanApplication.applicant)
+            selectinload(LoanApplication.applicant),
+            raiseload('*'),
+            *_DEFERRED_APPLICATION_PAYLOADS
         )
         
         filters = []
@@ -471,10 +831,10 @@ class LoanApplicationRepository(BaseRepository):
             filters.append(LoanApplication.risk_level == risk_level)
         
         if date_from:
-            filters.append(LoanApplication.created_at >= datetime.combine(date_from, datetime.min.time()))
+            filters.append(LoanApplication.created_at >= datetime.combine(date_from, DAY_START))
         
         if date_to:
-            filters.append(LoanApplication.created_at <= datetime.combine(date_to, datetime.max.time()))
+            filters.append(LoanApplication.created_at <= datetime.combine(date_to, DAY_END))
         
         if requires_review is not None:
             filters.append(LoanApplication.requires_manual_review == requires_review)
@@ -482,9 +842,6 @@ class LoanApplicationRepository(BaseRepository):
         if filters:
             query = query.filter(and_(*filters))
         
-        # Get total count
-        total = query.count()
-        
         # Apply sorting
         sort_column = getattr(LoanApplication, sort_by, LoanApplication.created_at)
         if sort_order.lower() == 'desc':
@@ -492,77 +849,103 @@ class LoanApplicationRepository(BaseRepository):
         else:
             query = query.order_by(asc(sort_column))
         
-        # Apply pagination
-        offset = (page - 1) * page_size
-        applications = query.offset(offset).limit(page_size).all()
-        
-        return applications, total
+        # Page and total count in one query
+        return self._paginate(query, page, page_size)
     
-    def get_pending_applications(self) -> List[LoanApplication]:
-        """Get all pending applications awaiting processing."""
-        return self.session.query(LoanApplication).filter(
+    def iter_pending_applications(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE,
+        limit: Optional[int] = None
+    ) -> Iterator[LoanApplication]:
+        """Stream pending applications awaiting processing, oldest first."""
+        query = self.session.query(LoanApplication).options(
+            *_DEFERRED_APPLICATION_PAYLOADS
+        ).filter(
             LoanApplication.status.in_([
                 ApplicationStatus.PENDING,
                 ApplicationStatus.DRAFT
             ])
-        ).order_by(asc(LoanApplication.created_at)).all()
+        ).order_by(asc(LoanApplication.created_at))
+        if limit is not None:
+            query = query.limit(limit)
+        return iter(query.yield_per(batch_size))
+    
+    def get_pending_applications(self) -> List[LoanApplication]:
+        """Deprecated: use iter_pending_applications. Capped at LIST_ROW_CAP rows."""
+        warnings.warn(
+            "get_pending_applications is deprecated; use iter_pending_applications",
+            DeprecationWarning, stacklevel=2
+        )
+        return list(self.iter_pending_applications(limit=LIST_ROW_CAP))
     
     def get_applications_for_review(self) -> List[LoanApplication]:
         """Get applications requiring manual review."""
         return self.session.query(LoanApplication).options(
-            joinedload(LoanApplication.applicant)
+            selectinload(LoanApplication.applicant),
+            raiseload('*'),
+            *_DEFERRED_APPLICATION_PAYLOADS
         ).filter(
             LoanApplication.status == ApplicationStatus.UNDER_REVIEW,
             LoanApplication.requires_manual_review == True
         ).order_by(asc(LoanApplication.created_at)).all()
     
+    @_cached_stats
     def count_by_status(self) -> Dict[str, int]:
-        """Get count of applications by status."""
-        results = self.session.query(
-            LoanApplication.status,
-            func.count(LoanApplication.id)
-        ).group_by(LoanApplication.status).all()
+        """
+        Get count of applications by status.
+        
+        Reads the trigger-maintained ``loan_application_status_counts`` on
+        PostgreSQL; other databases aggregate the applications table.
+        """
+        if self.session.get_bind().dialect.name == 'postgresql':
+            results = self.session.query(
+                LoanApplicationStatusCount.status,
+                LoanApplicationStatusCount.count
+            ).filter(LoanApplicationStatusCount.count > 0).all()
+        else:
+            results = self.session.query(
+                LoanApplication.status,
+                func.count(LoanApplication.id)
+            ).group_by(LoanApplication.status).all()
         
         return {status.value: count for status, count in results}
     
+    @_cached_stats
     def get_statistics(
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None
     ) -> Dict[str, Any]:
         """Get loan application statistics."""
-        query = self.session.query(LoanApplication)
+        is_approved = LoanApplication.status == ApplicationStatus.APPROVED
+        
+        # All figures from a single scan via conditional aggregates
+        query = self.session.query(
+            func.count(LoanApplication.id).label('total'),
+            func.count(LoanApplication.id).filter(is_approved).label('approved'),
+            func.count(LoanApplication.id).filter(
+                LoanApplication.status == ApplicationStatus.REJECTED
+            ).label('rejected'),
+            func.count(LoanApplication.id).filter(LoanApplication.status.in_([
+                ApplicationStatus.PENDING,
+                ApplicationStatus.DRAFT,
+                ApplicationStatus.UNDER_REVIEW
+            ])).label('pending'),
+            func.sum(LoanApplication.loan_amount).filter(is_approved).label('total_amount'),
+            func.avg(LoanApplication.loan_amount).label('avg_amount'),
+            func.avg(LoanApplication.approval_probability).label('avg_probability')
+        )
         
         if date_from:
-            query = query.filter(LoanApplication.created_at >= datetime.combine(date_from, datetime.min.time()))
+            query = query.filter(LoanApplication.created_at >= datetime.combine(date_from, DAY_START))
         if date_to:
-            query = query.filter(LoanApplication.created_at <= datetime.combine(date_to, datetime.max.time()))
-        
-        total = query.count()
-        
-        approved = query.filter(LoanApplication.status == ApplicationStatus.APPROVED).count()
-        rejected = query.filter(LoanApplication.status == ApplicationStatus.REJECTED).count()
-        pending = query.filter(LoanApplication.status.in_([
-            ApplicationStatus.PENDING,
-            ApplicationStatus.DRAFT,
-            ApplicationStatus.UNDER_REVIEW
-        ])).count()
-        
-        total_amount = query.filter(
-            LoanApplication.status == ApplicationStatus.APPROVED
-        ).with_entities(
-            func.sum(LoanApplication.loan_amount)
-        ).scalar() or 0
-        
-        avg_amount = query.with_entities(
-            func.avg(LoanApplication.loan_amount)
-        ).scalar() or 0
-        
-        avg_approval_probability = query.filter(
-            LoanApplication.approval_probability != None
-        ).with_entities(
-            func.avg(LoanApplication.approval_probability)
-        ).scalar() or 0
+            query = query.filter(LoanApplication.created_at <= datetime.combine(date_to, DAY_END))
+        
+        row = query.one()
+        total, approved, rejected, pending = row.total, row.approved, row.rejected, row.pending
+        total_amount = row.total_amount or 0
+        avg_amount = row.avg_amount or 0
+        avg_approval_probability = row.avg_probability or 0
         
         status_counts = self.count_by_status()
         
@@ -581,7 +964,9 @@ class LoanApplicationRepository(BaseRepository):
     def get_recent_applications(self, limit: int = 10) -> List[LoanApplication]:
         """Get most recent applications."""
         return self.session.query(LoanApplication).options(
-            joinedload(LoanApplication.applicant)
+            selectinload(LoanApplication.applicant),
+            raiseload('*'),
+            *_DEFERRED_APPLICATION_PAYLOADS
         ).order_by(desc(LoanApplication.created_at)).limit(limit).all()
     
     def get_application_audit_trail(self, application_id: UUID) -> List[ApplicationAuditLog]:
@@ -597,35 +982,42 @@ class LoanApplicationRepository(BaseRepository):
         approved_amount: Optional[float] = None,
         interest_rate: Optional[float] = None,
         tenure_months: Optional[int] = None,
-        remarks: Optional[str] = None
+        remarks: Optional[str] = None,
+        defer_audit: Optional[List[Dict[str, Any]]] = None
     ) -> Optional[LoanApplication]:
-        """Approve a loan application."""
-        application = self.get_by_id(application_id)
-        if application:
-            application.status = ApplicationStatus.APPROVED
-            application.status_updated_at = datetime.utcnow()
-            application.status_updated_by = approved_by
-            application.review_remarks = remarks
-            
-            if approved_amount:
-                application.approved_amount = approved_amount
-            if interest_rate:
-                application.interest_rate = interest_rate
-            if tenure_months:
-                application.tenure_months = tenure_months
+        """Approve a loan application (``defer_audit`` as in ``update_status``)."""
+        now = datetime.now(UTC)
+        values = {
+            'status': ApplicationStatus.APPROVED,
+            'status_updated_at': now,
+            'status_updated_by': approved_by,
+            'approved_at': now,
+            'approved_by': approved_by,
+            'reviewer_notes': remarks,
+        }
+        if approved_amount:
+            values['loan_amount_approved'] = approved_amount
+        if interest_rate:
+            values['interest_rate_final'] = interest_rate
+        if tenure_months:
+            values['tenure_approved'] = tenure_months
+        
+        transitioned = self._transition(application_id, values)
+        if transitioned:
+            application, old_status = transitioned
             
             # Create audit log
-            audit_log = ApplicationAuditLog(
-                application_id=application_id,
-                action='approval',
-                field_name='status',
-                old_value=application.status.value,
-                new_value=ApplicationStatus.APPROVED.value,
-                changed_by=approved_by,
-                remarks=remarks
-            )
-            self.session.add(audit_log)
-            self.session.flush()
+            self._record_audit({
+                'entity_type': 'loan_application',
+                'entity_id': application_id,
+                'application_id': application_id,
+                'action': AuditAction.APPROVAL,
+                'field_name': 'status',
+                'changes': {'status': {'old': old_status.value, 'new': ApplicationStatus.APPROVED.value}},
+                'performed_by': approved_by,
+                'reason': remarks
+            }, defer_audit)
+            invalidate_stats()
             
             logger.info(f"Application {application_id} approved by {approved_by}")
             return application
@@ -636,38 +1028,125 @@ class LoanApplicationRepository(BaseRepository):
         application_id: UUID,
         rejected_by: str,
         rejection_reason: str,
-        rejection_category: Optional[str] = None
+        rejection_category: Optional[str] = None,
+        defer_audit: Optional[List[Dict[str, Any]]] = None
     ) -> Optional[LoanApplication]:
-        """Reject a loan application."""
-        application = self.get_by_id(application_id)
-        if application:
-            old_status = application.status
-            application.status = ApplicationStatus.REJECTED
-            application.status_updated_at = datetime.utcnow()
-            application.status_updated_by = rejected_by
-            application.rejection_reason = rejection_reason
-            application.rejection_category = rejection_category
-            application.rejected_at = datetime.utcnow()
+        """Reject a loan application (``defer_audit`` as in ``update_status``)."""
+        now = datetime.now(UTC)
+        transitioned = self._transition(application_id, {
+            'status': ApplicationStatus.REJECTED,
+            'status_updated_at': now,
+            'status_updated_by': rejected_by,
+            'rejection_reason': rejection_reason,
+            'rejection_category': rejection_category,
+            'rejected_at': now,
+            'rejected_by': rejected_by,
+        })
+        if transitioned:
+            application, old_status = transitioned
             
             # Create audit log
-            audit_log = ApplicationAuditLog(
-                application_id=application_id,
-                action='rejection',
-                field_name='status',
-                old_value=old_status.value,
-                new_value=ApplicationStatus.REJECTED.value,
-                changed_by=rejected_by,
-                remarks=rejection_reason
-            )
-            self.session.add(audit_log)
-            self.session.flush()
+            self._record_audit({
+                'entity_type': 'loan_application',
+                'entity_id': application_id,
+                'application_id': application_id,
+                'action': AuditAction.REJECTION,
+                'field_name': 'status',
+                'changes': {'status': {'old': old_status.value, 'new': ApplicationStatus.REJECTED.value}},
+                'performed_by': rejected_by,
+                'reason': rejection_reason
+            }, defer_audit)
+            invalidate_stats()
             
             logger.info(f"Application {application_id} rejected by {rejected_by}")
             return application
         return None
     
+    def _transition(
+        self,
+        application_id: UUID,
+        values: Dict[str, Any]
+    ) -> Optional[Tuple[LoanApplication, ApplicationStatus]]:
+        """
+        Apply ``values`` and report the status they replaced.
+        
+        On PostgreSQL this is a single UPDATE ... RETURNING round trip: the
+        previous status comes from a locked sub-select joined into the
+        UPDATE (its row is the pre-update version). Other dialects either
+        lack UPDATE ... RETURNING (MySQL) or return the updated row from the
+        join (SQLite), so they lock and read the status first. Returns
+        ``(application, old_status)``, or None if the application does not
+        exist.
+        """
+        if self.session.get_bind().dialect.name != 'postgresql':
+            old_status = self.session.execute(
+                select(LoanApplication.status)
+                .where(LoanApplication.id == application_id)
+                .with_for_update()
+            ).scalar_one_or_none()
+            if old_status is None:
+                return None
+            self.session.execute(
+                update(LoanApplication)
+                .where(LoanApplication.id == application_id)
+                .values(**values)
+            )
+            return self.session.get(LoanApplication, application_id), old_status
+        
+        old = select(LoanApplication.id, LoanApplication.status).where(
+            LoanApplication.id == application_id
+        ).with_for_update().subquery('old')
+        row = self.session.execute(
+            update(LoanApplication)
+            .where(LoanApplication.id == old.c.id)
+            .values(**values)
+            .returning(LoanApplication, old.c.status)
+        ).first()
+        return (row[0], row[1]) if row else None
+    
+    def _record_audit(
+        self,
+        entry: Dict[str, Any],
+        defer_audit: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        """Write an audit row now, or append it to ``defer_audit`` for a bulk write."""
+        if defer_audit is not None:
+            defer_audit.append(entry)
+        else:
+            ApplicationAuditLog.bulk_log(self.session, [entry])
+    
+    @_cached_stats
     def get_risk_analysis(self) -> Dict[str, Any]:
-        """Get risk level analysis of applications."""
+        """
+        Get risk level analysis of applications.
+        
+        On PostgreSQL the server builds the finished mapping with
+        ``jsonb_object_agg`` and returns it as a single value.
+        """
+        if self.session.get_bind().dialect.name == 'postgresql':
+            buckets = select(
+                LoanApplication.risk_level,
+                func.count().label('cnt'),
+                func.avg(LoanApplication.loan_amount).label('avg_amount'),
+                func.avg(LoanApplication.approval_probability).label('avg_prob')
+            ).where(
+                LoanApplication.risk_level != None
+            ).group_by(LoanApplication.risk_level).subquery()
+            
+            return self.session.execute(select(
+                func.jsonb_object_agg(
+                    buckets.c.risk_level,
+                    func.jsonb_build_object(
+                        'count', buckets.c.cnt,
+                        'average_amount',
+                        func.coalesce(func.round(cast(buckets.c.avg_amount, Numeric), 2), 0),
+                        'average_approval_probability',
+                        func.coalesce(func.round(cast(buckets.c.avg_prob * 100, Numeric), 2), 0)
+                    ),
+                    type_=JSONB
+                )
+            )).scalar() or {}
+        
         results = self.session.query(
             LoanApplication.risk_level,
             func.count(LoanApplication.id),
@@ -696,6 +1175,20 @@ class AuditLogRepository(BaseRepository):
         self.session.flush()
         return audit_log
     
+    def create_many(self, entries: List[Dict[str, Any]]) -> int:
+        """Insert many audit entries in batched INSERTs."""
+        return ApplicationAuditLog.bulk_log(self.session, entries)
+    
+    def bulk_create(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Write many audit entries in one round-trip.
+        
+        Uses ``COPY`` on PostgreSQL and batched INSERTs elsewhere.
+        """
+        if self.session.get_bind().dialect.name == 'postgresql':
+            return ApplicationAuditLog.bulk_copy(self.session, entries)
+        return ApplicationAuditLog.bulk_log(self.session, entries)
+    
     def get_by_application(
         self,
         application_id: UUID,
@@ -709,7 +1202,49 @@ class AuditLogRepository(BaseRepository):
         if action:
             query = query.filter(ApplicationAuditLog.action == action)
         
-        return query.order_by(desc(ApplicationAuditLog.timestamp)).all()
+        return query.order_by(desc(ApplicationAuditLog.created_at)).all()
+    
+    def get_by_key(self, log_id: UUID, created_at: datetime) -> Optional[ApplicationAuditLog]:
+        """Get one audit log by its full primary key (prunes to one partition)."""
+        return self.session.get(ApplicationAuditLog, (log_id, created_at))
+    
+    def get_by_entity(
+        self,
+        entity_type: str,
+        entity_id: UUID,
+        limit: int = 50
+    ) -> List[ApplicationAuditLog]:
+        """Get the most recent audit logs for an entity."""
+        return self.session.query(ApplicationAuditLog).filter(
+            ApplicationAuditLog.entity_type == entity_type,
+            ApplicationAuditLog.entity_id == entity_id
+        ).order_by(desc(ApplicationAuditLog.created_at)).limit(limit).all()
+    
+    def get_by_changes(self, fragment: Dict[str, Any], limit: int = 100) -> List[ApplicationAuditLog]:
+        """
+        Get audit logs whose ``changes`` contain the given JSON fragment.
+        
+        Uses JSONB containment (``@>``) so the GIN index on ``changes`` applies.
+        """
+        return self.session.query(ApplicationAuditLog).filter(
+            ApplicationAuditLog.changes.op('@>')(cast(fragment, JSONB))
+        ).order_by(desc(ApplicationAuditLog.created_at)).limit(limit).all()
+    
+    def get_daily_counts(
+        self,
+        start: date,
+        end: date,
+        entity_type: Optional[str] = None
+    ) -> List[AuditDailyRollup]:
+        """Get per-day action counts from the rollup table (``end`` inclusive)."""
+        query = self.session.query(AuditDailyRollup).filter(
+            AuditDailyRollup.day.between(start, end)
+        )
+        
+        if entity_type:
+            query = query.filter(AuditDailyRollup.entity_type == entity_type)
+        
+        return query.order_by(AuditDailyRollup.day, AuditDailyRollup.action).all()
     
     def get_recent_activity(self, limit: int = 50) -> List[ApplicationAuditLog]:
         """Get recent audit activity across all applications."""
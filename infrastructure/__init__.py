@@ -34,6 +34,7 @@ from .scaling import (
     ScalingDecision,
     ScalingDirection,
     MetricsCollector,
+    MetricsSnapshot,
     MetricType,
     ServiceRegistry,
     ServiceInstance,
@@ -64,6 +65,7 @@ __all__ = [
     'ScalingDecision',
     'ScalingDirection',
     'MetricsCollector',
+    'MetricsSnapshot',
     'MetricType',
     'ServiceRegistry',
     'ServiceInstance',
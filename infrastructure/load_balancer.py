@@ -16,19 +16,66 @@ Version: 1.0.0
 """
 
 import asyncio
+import sys
 import time
 import random
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
-from collections import deque
+from typing import Dict, List, Optional, Any, Callable, ClassVar, Tuple
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, count
 import threading
-import hashlib
+import zlib
+
+import numpy as np
+
+# aiohttp is only needed by HealthCheckService
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Process-local clock origin: hot paths store time.monotonic_ns() and only
+# stats output converts back to wall-clock time
+_WALL_ORIGIN = datetime.utcnow()
+_MONOTONIC_ORIGIN_NS = time.monotonic_ns()
+
+
+def _monotonic_ns_to_datetime(ns: int) -> Optional[datetime]:
+    """Wall-clock time for a monotonic timestamp (0 means never)."""
+    if not ns:
+        return None
+    return _WALL_ORIGIN + timedelta(microseconds=(ns - _MONOTONIC_ORIGIN_NS) // 1000)
+
+
+def monotonic_ns_isoformat(ns: int) -> Optional[str]:
+    """ISO wall-clock string for a monotonic timestamp, for stats output."""
+    moment = _monotonic_ns_to_datetime(ns)
+    return moment.isoformat() if moment else None
+
+
+def jump_hash(key: int, num_buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach): map ``key`` to a bucket in
+    ``[0, num_buckets)``.
+    
+    Growing or shrinking the bucket count by one moves only ~1/n of keys,
+    where ``key % n`` would remap almost all of them.
+    """
+    bucket, candidate = -1, 0
+    while candidate < num_buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
 
 # =============================================================================
 # Enums and Types
@@ -64,7 +111,7 @@ class CircuitState(str, Enum):
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ServerInstance:
     """Represents a backend server instance."""
     id: str
@@ -77,9 +124,22 @@ class ServerInstance:
     total_requests: int = 0
     failed_requests: int = 0
     avg_response_time_ms: float = 0.0
-    last_health_check: Optional[datetime] = None
-    last_failure: Optional[datetime] = None
+    last_health_check_ns: int = 0  # time.monotonic_ns(); 0 = never
+    last_failure_ns: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Guards the request counters so request start/end for one server does
+    # not need the load balancer's pool-wide lock
+    _stats_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    # Set by LoadBalancer.add_server so the per-request path needs no
+    # lookups by server id
+    _circuit_breaker: Optional["CircuitBreaker"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    RESPONSE_TIME_ALPHA: ClassVar[float] = 0.1  # EMA smoothing factor
     
     @property
     def url(self) -> str:
@@ -103,16 +163,16 @@ class ServerInstance:
         self.total_requests += 1
         if not success:
             self.failed_requests += 1
-            self.last_failure = datetime.utcnow()
+            self.last_failure_ns = time.monotonic_ns()
         
-        # Update rolling average response time
-        alpha = 0.1  # Smoothing factor
-        self.avg_response_time_ms = (
-            alpha * response_time_ms + (1 - alpha) * self.avg_response_time_ms
+        # Rolling average response time: avg + alpha * (x - avg) is the
+        # usual EMA with one multiply
+        self.avg_response_time_ms += self.RESPONSE_TIME_ALPHA * (
+            response_time_ms - self.avg_response_time_ms
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckConfig:
     """Health check configuration."""
     endpoint: str = "/health"
@@ -122,7 +182,7 @@ class HealthCheckConfig:
     unhealthy_threshold: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     """Circuit breaker configuration."""
     failure_threshold: int = 5
@@ -144,34 +204,74 @@ class CircuitBreaker:
     - Periodically testing recovery
     """
     
-    def __init__(self, config: CircuitBreakerConfig):
+    def __init__(
+        self,
+        config: CircuitBreakerConfig,
+        on_state_change: Optional[Callable[[CircuitState], None]] = None
+    ):
         self.config = config
+        self.on_state_change = on_state_change
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self.half_open_requests = 0
+        self._last_failure_ns = 0  # time.monotonic_ns(); 0 = never
+        # Trial requests admitted while half-open and not yet finished
+        self._half_open_inflight = 0
+        # Guards state transitions and trial slots; the CLOSED read path is lock-free
         self._lock = threading.Lock()
     
     def can_execute(self) -> bool:
-        """Check if request can proceed."""
+        """
+        Check if a request could proceed, without claiming anything.
+        
+        Half-open, this is True while trial slots are free; the caller that
+        actually sends the request claims one with ``try_acquire``.
+        """
+        # Fast path: a single attribute read (assignment is atomic)
+        if self.state is CircuitState.CLOSED:
+            return True
+        
         with self._lock:
-            if self.state == CircuitState.CLOSED:
+            self._check_recovery()
+            if self.state is CircuitState.HALF_OPEN:
+                return self._half_open_inflight < self.config.half_open_max_requests
+            return self.state is CircuitState.CLOSED
+    
+    def try_acquire(self) -> bool:
+        """
+        Admit one request, claiming a trial slot when half-open.
+        
+        At most ``half_open_max_requests`` trials are in flight at once;
+        each admitted request must be followed by ``release``.
+        """
+        if self.state is CircuitState.CLOSED:
+            return True
+        
+        with self._lock:
+            self._check_recovery()
+            if self.state is CircuitState.HALF_OPEN:
+                if self._half_open_inflight >= self.config.half_open_max_requests:
+                    return False
+                self._half_open_inflight += 1
                 return True
-            
-            if self.state == CircuitState.OPEN:
-                # Check if recovery timeout passed
-                if self.last_failure_time:
-                    elapsed = (datetime.utcnow() - self.last_failure_time).total_seconds()
-                    if elapsed >= self.config.recovery_timeout_seconds:
-                        self._transition_to_half_open()
-                        return True
-                return False
-            
-            if self.state == CircuitState.HALF_OPEN:
-                return self.half_open_requests < self.config.half_open_max_requests
-            
-            return False
+            return self.state is CircuitState.CLOSED
+    
+    def release(self):
+        """Free the trial slot of a finished request (no-op if none is held)."""
+        if self.state is CircuitState.CLOSED:
+            # Transitions reset the slots; nothing can be held
+            return
+        with self._lock:
+            if self._half_open_inflight:
+                self._half_open_inflight -= 1
+    
+    def _check_recovery(self):
+        """Go half-open once the recovery timeout has passed; caller holds the lock."""
+        if self.state is not CircuitState.OPEN or not self._last_failure_ns:
+            return
+        elapsed_ns = time.monotonic_ns() - self._last_failure_ns
+        if elapsed_ns >= self.config.recovery_timeout_seconds * 1_000_000_000:
+            self._transition_to_half_open()
     
     def record_success(self):
         """Record successful request."""
@@ -187,7 +287,7 @@ class CircuitBreaker:
         """Record failed request."""
         with self._lock:
             self.failure_count += 1
-            self.last_failure_time = datetime.utcnow()
+            self._last_failure_ns = time.monotonic_ns()
             
             if self.state == CircuitState.HALF_OPEN:
                 self._transition_to_open()
@@ -195,24 +295,38 @@ class CircuitBreaker:
                 if self.failure_count >= self.config.failure_threshold:
                     self._transition_to_open()
     
+    def _reset_half_open_inflight(self):
+        """Start the next half-open period with all trial slots free."""
+        self._half_open_inflight = 0
+    
     def _transition_to_open(self):
         """Transition to open state."""
+        self._reset_half_open_inflight()
         self.state = CircuitState.OPEN
         logger.warning(f"Circuit breaker opened after {self.failure_count} failures")
+        self._notify_state_change()
     
     def _transition_to_half_open(self):
         """Transition to half-open state."""
-        self.state = CircuitState.HALF_OPEN
-        self.half_open_requests = 0
+        self._reset_half_open_inflight()
         self.success_count = 0
+        self.state = CircuitState.HALF_OPEN
         logger.info("Circuit breaker half-open, testing recovery")
+        self._notify_state_change()
     
     def _transition_to_closed(self):
         """Transition to closed state."""
+        self._reset_half_open_inflight()
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
         logger.info("Circuit breaker closed, service recovered")
+        self._notify_state_change()
+    
+    def _notify_state_change(self):
+        """Tell the owner (e.g. LoadBalancer) that the state changed."""
+        if self.on_state_change is not None:
+            self.on_state_change(self.state)
 
 
 # =============================================================================
@@ -234,7 +348,7 @@ class RateLimiter:
         self.rate = requests_per_second
         self.burst_size = burst_size
         self.tokens = burst_size
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = threading.Lock()
     
     def acquire(self, tokens: int = 1) -> bool:
@@ -244,7 +358,7 @@ class RateLimiter:
         Returns True if tokens acquired, False if rate limited.
         """
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             elapsed = now - self.last_update
             self.last_update = now
             
@@ -269,13 +383,64 @@ class RateLimiter:
             return needed / self.rate
 
 
+class _ClientWindow:
+    """
+    Fixed-size ring of a client's last ``max_requests`` admission times.
+    
+    ``head`` is the next slot to write; once ``count`` reaches capacity it
+    is also the oldest entry. Entries are monotonic, so each of the two
+    slices either side of ``head`` is sorted.
+    """
+    
+    __slots__ = ('buf', 'head', 'count')
+    
+    def __init__(self, capacity: int):
+        self.buf = array('d', bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+    
+    def expired(self, cutoff: float) -> int:
+        """Number of stored entries older than ``cutoff``."""
+        buf, head = self.buf, self.head
+        if self.count < len(buf):
+            return bisect_left(buf, cutoff, 0, self.count)
+        return (bisect_left(buf, cutoff, head, len(buf)) - head +
+                bisect_left(buf, cutoff, 0, head))
+    
+    def newest(self) -> float:
+        """Most recent admission time (only valid when ``count`` > 0)."""
+        return self.buf[self.head - 1]
+    
+    def append(self, now: float):
+        """Record an admission, overwriting the oldest entry when full."""
+        self.buf[self.head] = now
+        self.head = (self.head + 1) % len(self.buf)
+        if self.count < len(self.buf):
+            self.count += 1
+
+
 class DistributedRateLimiter:
     """
     Per-client rate limiter with sliding window.
     
-    Tracks rate limits for individual clients (by IP or API key).
+    Tracks rate limits for individual clients (by IP or API key). Each
+    client keeps a fixed-size ring of its last ``max_requests`` admission
+    times, so a check is one compare against the oldest entry instead of
+    evicting expired timestamps one by one.
+    
+    Clients are striped over ``SHARDS`` dicts, each with its own lock, so
+    checks for unrelated clients do not serialize on one lock. State is
+    per process, like the circuit breakers: each worker enforces its own
+    limit.
+    
+    Stale clients are swept incrementally: every ``SWEEP_EVERY`` checks,
+    one shard is cleaned in turn, so ``cleanup()`` no longer has to be
+    called to bound memory.
     """
     
+    SHARDS = 16  # power of two; shard = hash(client_id) & (SHARDS - 1)
+    SWEEP_EVERY = 10_000
+    
     def __init__(
         self,
         requests_per_window: int = 100,
@@ -283,8 +448,10 @@ class DistributedRateLimiter:
     ):
         self.max_requests = requests_per_window
         self.window_seconds = window_seconds
-        self.clients: Dict[str, deque] = {}
-        self._lock = threading.Lock()
+        self._shards: List[Tuple[Dict[str, _ClientWindow], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(self.SHARDS)
+        ]
+        self._check_counter = count(1)
     
     def is_allowed(self, client_id: str) -> tuple[bool, dict]:
         """
@@ -292,47 +459,61 @@ class DistributedRateLimiter:
         
         Returns (allowed, rate_limit_info)
         """
-        with self._lock:
-            now = time.time()
+        # Header-derived ids arrive as fresh strings; the interned copy is
+        # shared by every window key for that client
+        result = self._check(sys.intern(client_id))
+        
+        checks = next(self._check_counter)
+        if checks % self.SWEEP_EVERY == 0:
+            # Outside the client's shard lock, which may be the one swept
+            self._sweep_shard(*self._shards[(checks // self.SWEEP_EVERY) % self.SHARDS])
+        return result
+    
+    def _check(self, client_id: str) -> tuple[bool, dict]:
+        """Sliding-window check and admission for one client."""
+        clients, lock = self._shards[hash(client_id) & (self.SHARDS - 1)]
+        with lock:
+            now = time.monotonic()
             cutoff = now - self.window_seconds
             
-            if client_id not in self.clients:
-                self.clients[client_id] = deque()
-            
-            # Remove old timestamps
-            while self.clients[client_id] and self.clients[client_id][0] < cutoff:
-                self.clients[client_id].popleft()
+            window = clients.get(client_id)
+            if window is None:
+                window = clients[client_id] = _ClientWindow(self.max_requests)
             
-            current_count = len(self.clients[client_id])
+            current_count = window.count - window.expired(cutoff)
             remaining = max(0, self.max_requests - current_count)
             
             info = {
                 "limit": self.max_requests,
                 "remaining": remaining,
-                "reset": int(cutoff + self.window_seconds),
+                "reset": int(time.time()),
                 "window": self.window_seconds
             }
             
             if current_count >= self.max_requests:
                 return False, info
             
-            self.clients[client_id].append(now)
+            window.append(now)
             info["remaining"] = remaining - 1
             return True, info
     
     def cleanup(self):
-        """Remove stale client entries."""
-        with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds * 2
+        """Remove stale client entries, one shard at a time."""
+        for clients, lock in self._shards:
+            self._sweep_shard(clients, lock)
+    
+    def _sweep_shard(self, clients: Dict[str, _ClientWindow], lock: threading.Lock):
+        """Drop clients idle for two windows from one shard."""
+        with lock:
+            cutoff = time.monotonic() - self.window_seconds * 2
             
             stale = [
-                client_id for client_id, timestamps in self.clients.items()
-                if not timestamps or timestamps[-1] < cutoff
+                client_id for client_id, window in clients.items()
+                if not window.count or window.newest() < cutoff
             ]
             
             for client_id in stale:
-                del self.clients[client_id]
+                del clients[client_id]
 
 
 # =============================================================================
@@ -349,8 +530,21 @@ class LoadBalancer:
     - Circuit breakers per server
     - Connection tracking
     - Graceful server draining
+    
+    The list of routable servers is cached and only rebuilt after an
+    event that can change it (pool, health, capacity or circuit state),
+    so routing does not rebuild it per request.
+    
+    Each server also owns a slot in parallel numpy arrays mirroring its
+    connection count and response time, so least-connections and
+    least-response-time selection is one masked ``argmin``. The
+    ``ServerInstance`` fields stay the source of truth for the API.
     """
     
+    INITIAL_SLOTS = 16
+    # How long a probing server that refused a request is skipped
+    PROBE_DENIAL_TTL_NS = 5_000_000
+    
     def __init__(
         self,
         strategy: LoadBalancingStrategy = LoadBalancingStrategy.ROUND_ROBIN,
@@ -365,8 +559,30 @@ class LoadBalancer:
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self.rate_limiters: Dict[str, RateLimiter] = {}
         
-        self._round_robin_index = 0
+        self._rr_counter = count()  # next() is atomic under the GIL
         self._lock = threading.Lock()
+        
+        # Servers that are healthy and under capacity, in pool order
+        self._available_cache: List[ServerInstance] = []
+        self._available_dirty = True
+        # Cached servers split by breaker state: CLOSED ones always pass,
+        # the rest must still ask can_execute() (recovery, free half-open
+        # slots); only the server actually picked claims a slot
+        self._steady_servers: List[ServerInstance] = []
+        self._probe_servers: List[ServerInstance] = []
+        # Negative cache: probe server id -> monotonic ns to skip it until
+        self._probe_denied_until: Dict[str, int] = {}
+        # Running weight totals over the cache, for weighted round-robin
+        self._weight_cumsum: List[int] = []
+        self._weight_total = 0
+        
+        # Struct-of-arrays mirror of per-server routing stats, by slot
+        self._slots: Dict[str, int] = {}
+        self._server_by_slot: List[Optional[ServerInstance]] = []
+        self._free_slots: List[int] = []
+        self._conn_arr = np.zeros(self.INITIAL_SLOTS, dtype=np.int32)
+        self._rt_arr = np.zeros(self.INITIAL_SLOTS, dtype=np.float64)
+        self._available_mask = np.zeros(self.INITIAL_SLOTS, dtype=bool)
         self._health_check_task: Optional[asyncio.Task] = None
     
     def add_server(
@@ -389,10 +605,15 @@ class LoadBalancer:
         
         with self._lock:
             self.servers[server_id] = server
-            self.circuit_breakers[server_id] = CircuitBreaker(self.circuit_config)
+            self._assign_slot(server)
+            server._circuit_breaker = self.circuit_breakers[server_id] = CircuitBreaker(
+                self.circuit_config,
+                on_state_change=self._invalidate_available
+            )
             self.rate_limiters[server_id] = RateLimiter(
                 requests_per_second=max_connections * 0.8
             )
+            self._available_dirty = True
         
         logger.info(f"Added server {server_id} at {host}:{port}")
     
@@ -409,7 +630,74 @@ class LoadBalancer:
                 del self.servers[server_id]
                 del self.circuit_breakers[server_id]
                 del self.rate_limiters[server_id]
+                self._release_slot(server_id)
                 logger.info(f"Server {server_id} removed")
+            self._available_dirty = True
+    
+    def _assign_slot(self, server: ServerInstance):
+        """Give ``server`` a stats slot; caller holds ``self._lock``."""
+        slot = self._slots.get(server.id)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = len(self._server_by_slot)
+                self._server_by_slot.append(None)
+                if slot == len(self._conn_arr):
+                    size = 2 * slot
+                    self._conn_arr = np.resize(self._conn_arr, size)
+                    self._rt_arr = np.resize(self._rt_arr, size)
+                    self._available_mask = np.zeros(size, dtype=bool)
+                    self._available_dirty = True
+            self._slots[server.id] = slot
+        server._slot = slot
+        self._server_by_slot[slot] = server
+        self._conn_arr[slot] = server.current_connections
+        self._rt_arr[slot] = server.avg_response_time_ms
+    
+    def _release_slot(self, server_id: str):
+        """Free a removed server's stats slot; caller holds ``self._lock``."""
+        slot = self._slots.pop(server_id)
+        self._server_by_slot[slot]._slot = -1
+        self._server_by_slot[slot] = None
+        self._available_mask[slot] = False
+        self._free_slots.append(slot)
+    
+    def _invalidate_available(self, *_):
+        """Mark the routable server cache stale (also a breaker callback)."""
+        self._available_dirty = True
+    
+    def _available_servers(self) -> List[ServerInstance]:
+        """Routable servers; caller holds ``self._lock``."""
+        if self._available_dirty:
+            self._available_dirty = False
+            self._available_cache = [s for s in self.servers.values() if s.is_available]
+            self._available_mask[:] = False
+            self._available_mask[[s._slot for s in self._available_cache]] = True
+            self._weight_cumsum = list(accumulate(s.weight for s in self._available_cache))
+            self._weight_total = self._weight_cumsum[-1] if self._weight_cumsum else 0
+            self._steady_servers = []
+            self._probe_servers = []
+            for s in self._available_cache:
+                if s._circuit_breaker.state is CircuitState.CLOSED:
+                    self._steady_servers.append(s)
+                else:
+                    self._probe_servers.append(s)
+            self._probe_denied_until.clear()
+        
+        if not self._probe_servers:
+            return self._available_cache
+        
+        now_ns = time.monotonic_ns()
+        admitted = []
+        for s in self._probe_servers:
+            if now_ns < self._probe_denied_until.get(s.id, 0):
+                continue
+            if s._circuit_breaker.can_execute():
+                admitted.append(s)
+            else:
+                self._probe_denied_until[s.id] = now_ns + self.PROBE_DENIAL_TTL_NS
+        return self._steady_servers + admitted
     
     def get_server(self, client_ip: Optional[str] = None) -> Optional[ServerInstance]:
         """
@@ -422,53 +710,58 @@ class LoadBalancer:
             Selected server or None if all unavailable
         """
         with self._lock:
-            available = [
-                s for s in self.servers.values()
-                if s.is_available and self.circuit_breakers[s.id].can_execute()
-            ]
-            
-            if not available:
-                logger.warning("No healthy servers available")
-                return None
+            available = self._available_servers()
             
-            if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
-                return self._round_robin(available)
-            elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
-                return self._weighted_round_robin(available)
-            elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
-                return self._least_connections(available)
-            elif self.strategy == LoadBalancingStrategy.IP_HASH:
-                return self._ip_hash(available, client_ip)
-            elif self.strategy == LoadBalancingStrategy.RANDOM:
-                return self._random(available)
-            elif self.strategy == LoadBalancingStrategy.LEAST_RESPONSE_TIME:
-                return self._least_response_time(available)
+            while available:
+                server = self._select(available, client_ip)
+                breaker = server._circuit_breaker
+                if breaker is None or breaker.try_acquire():
+                    return server
+                # Its trial slots filled up since the check: pick another
+                self._probe_denied_until[server.id] = time.monotonic_ns() + self.PROBE_DENIAL_TTL_NS
+                available = [s for s in available if s is not server]
             
-            return available[0]
+            logger.warning("No healthy servers available")
+            return None
+    
+    def _select(
+        self,
+        available: List[ServerInstance],
+        client_ip: Optional[str]
+    ) -> ServerInstance:
+        """Apply the strategy to a non-empty list; caller holds ``self._lock``."""
+        if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
+            return self._round_robin(available)
+        elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
+            return self._weighted_round_robin(available)
+        elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
+            return self._least_connections(available)
+        elif self.strategy == LoadBalancingStrategy.IP_HASH:
+            return self._ip_hash(available, client_ip)
+        elif self.strategy == LoadBalancingStrategy.RANDOM:
+            return self._random(available)
+        elif self.strategy == LoadBalancingStrategy.LEAST_RESPONSE_TIME:
+            return self._least_response_time(available)
+        
+        return available[0]
     
     def _round_robin(self, servers: List[ServerInstance]) -> ServerInstance:
         """Simple round-robin selection."""
-        server = servers[self._round_robin_index % len(servers)]
-        self._round_robin_index += 1
-        return server
+        return servers[next(self._rr_counter) % len(servers)]
     
     def _weighted_round_robin(self, servers: List[ServerInstance]) -> ServerInstance:
         """Weighted round-robin based on server weights."""
-        total_weight = sum(s.weight for s in servers)
-        target = self._round_robin_index % total_weight
-        self._round_robin_index += 1
-        
-        cumulative = 0
-        for server in servers:
-            cumulative += server.weight
-            if cumulative > target:
-                return server
-        
-        return servers[-1]
+        if servers is self._available_cache:
+            cumsum, total_weight = self._weight_cumsum, self._weight_total
+        else:
+            cumsum = list(accumulate(s.weight for s in servers))
+            total_weight = cumsum[-1]
+        target = next(self._rr_counter) % total_weight
+        return servers[bisect_right(cumsum, target)]
     
     def _least_connections(self, servers: List[ServerInstance]) -> ServerInstance:
         """Select server with fewest active connections."""
-        return min(servers, key=lambda s: s.current_connections)
+        return self._argmin_server(servers, self._conn_arr, np.iinfo(np.int32).max)
     
     def _ip_hash(
         self,
@@ -479,8 +772,9 @@ class LoadBalancer:
         if not client_ip:
             return self._round_robin(servers)
         
-        hash_value = int(hashlib.md5(client_ip.encode()).hexdigest(), 16)
-        index = hash_value % len(servers)
+        # CRC32 is stable across processes (unlike hash()) and far cheaper
+        # than MD5; nothing here needs cryptographic strength
+        index = jump_hash(zlib.crc32(client_ip.encode()), len(servers))
         return servers[index]
     
     def _random(self, servers: List[ServerInstance]) -> ServerInstance:
@@ -489,70 +783,127 @@ class LoadBalancer:
     
     def _least_response_time(self, servers: List[ServerInstance]) -> ServerInstance:
         """Select server with lowest average response time."""
-        return min(servers, key=lambda s: s.avg_response_time_ms)
+        return self._argmin_server(servers, self._rt_arr, np.inf)
     
-    def record_request_start(self, server_id: str):
-        """Record start of a request to a server."""
-        with self._lock:
-            if server_id in self.servers:
-                self.servers[server_id].current_connections += 1
+    def _argmin_server(
+        self,
+        servers: List[ServerInstance],
+        stats: np.ndarray,
+        fill: Any
+    ) -> ServerInstance:
+        """Server in ``servers`` with the smallest mirrored ``stats`` value."""
+        if servers is self._available_cache:
+            mask = self._available_mask
+        else:
+            # Breakers are probing: mask just the servers that passed
+            mask = np.zeros(len(stats), dtype=bool)
+            mask[[s._slot for s in servers]] = True
+        return self._server_by_slot[int(np.argmin(np.where(mask, stats, fill)))]
+    
+    def record_request_start(self, server: ServerInstance):
+        """
+        Record start of a request to ``server`` (as returned by
+        ``get_server``). Takes no pool-wide lock and no lookups by id.
+        """
+        with server._stats_lock:
+            server.current_connections += 1
+            self._mirror_stats(server)
+            if server.current_connections >= server.max_connections:
+                self._available_dirty = True
     
     def record_request_end(
         self,
-        server_id: str,
+        server: ServerInstance,
         success: bool,
         response_time_ms: float
     ):
-        """Record end of a request with result."""
-        with self._lock:
-            if server_id in self.servers:
-                server = self.servers[server_id]
-                server.current_connections = max(0, server.current_connections - 1)
-                server.record_request(success, response_time_ms)
-            
-            if server_id in self.circuit_breakers:
-                if success:
-                    self.circuit_breakers[server_id].record_success()
-                else:
-                    self.circuit_breakers[server_id].record_failure()
+        """Record end of a request to ``server`` with result (no pool-wide lock)."""
+        with server._stats_lock:
+            if server.current_connections >= server.max_connections:
+                self._available_dirty = True
+            server.current_connections = max(0, server.current_connections - 1)
+            server.record_request(success, response_time_ms)
+            self._mirror_stats(server)
+        
+        # Circuit breakers carry their own lock
+        breaker = server._circuit_breaker
+        if breaker is not None:
+            breaker.release()
+            if success:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+    
+    def _mirror_stats(self, server: ServerInstance):
+        """
+        Copy a server's counters into its stats slot.
+        
+        Caller holds ``server._stats_lock``. Without the pool lock a write
+        can race an array resize and be lost; the slot is rewritten in full
+        on the server's next request, so it is stale by at most that long.
+        """
+        slot = server._slot
+        if slot >= 0 and self._server_by_slot[slot] is server:
+            self._conn_arr[slot] = server.current_connections
+            self._rt_arr[slot] = server.avg_response_time_ms
     
     def update_server_health(self, server_id: str, healthy: bool):
         """Update server health status."""
         with self._lock:
             if server_id in self.servers:
                 server = self.servers[server_id]
-                server.last_health_check = datetime.utcnow()
+                server.last_health_check_ns = time.monotonic_ns()
                 
+                previous = server.status
                 if healthy:
                     if server.status != ServerStatus.DRAINING:
                         server.status = ServerStatus.HEALTHY
                 else:
                     server.status = ServerStatus.UNHEALTHY
+                if server.status != previous:
+                    self._available_dirty = True
     
     def get_stats(self) -> Dict[str, Any]:
         """Get load balancer statistics."""
+        # Copy raw fields under the lock; formatting happens after release
+        # so metrics scrapes do not hold up routing
         with self._lock:
-            healthy = sum(1 for s in self.servers.values() if s.status == ServerStatus.HEALTHY)
-            total = len(self.servers)
-            
-            return {
-                "strategy": self.strategy.value,
-                "total_servers": total,
-                "healthy_servers": healthy,
-                "unhealthy_servers": total - healthy,
-                "servers": {
-                    s.id: {
-                        "status": s.status.value,
-                        "url": s.url,
-                        "connections": s.current_connections,
-                        "total_requests": s.total_requests,
-                        "failure_rate": round(s.failure_rate * 100, 2),
-                        "avg_response_ms": round(s.avg_response_time_ms, 2),
-                        "circuit_state": self.circuit_breakers[s.id].state.value
-                    }
-                    for s in self.servers.values()
-                }
+            snapshot = [
+                (
+                    s, s.status, s.current_connections, s.total_requests,
+                    s.failed_requests, s.avg_response_time_ms,
+                    s._circuit_breaker.state,
+                    s.last_health_check_ns, s.last_failure_ns
+                )
+                for s in self.servers.values()
+            ]
+        
+        servers = {}
+        healthy = 0
+        for (server, status, connections, total_requests, failed_requests,
+             avg_response_ms, circuit_state, last_health_check_ns, last_failure_ns) in snapshot:
+            if status == ServerStatus.HEALTHY:
+                healthy += 1
+            failure_rate = failed_requests / total_requests if total_requests else 0.0
+            servers[server.id] = {
+                "status": status.value,
+                "url": server.url,
+                "connections": connections,
+                "total_requests": total_requests,
+                "failure_rate": round(failure_rate * 100, 2),
+                "avg_response_ms": round(avg_response_ms, 2),
+                "circuit_state": circuit_state.value,
+                "last_health_check": monotonic_ns_isoformat(last_health_check_ns),
+                "last_failure": monotonic_ns_isoformat(last_failure_ns)
             }
+        
+        return {
+            "strategy": self.strategy.value,
+            "total_servers": len(snapshot),
+            "healthy_servers": healthy,
+            "unhealthy_servers": len(snapshot) - healthy,
+            "servers": servers
+        }
 
 
 # =============================================================================
@@ -575,25 +926,36 @@ class HealthCheckService:
         self.config = config
         self._running = False
         self._health_counts: Dict[str, int] = {}  # Track consecutive health results
+        self._session = None  # aiohttp.ClientSession, shared while running
+        self._timeout = None  # aiohttp.ClientTimeout, built once per run
     
     async def start(self):
         """Start health check loop."""
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("HealthCheckService requires aiohttp")
+        
         self._running = True
+        self._timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
+        )
         logger.info("Health check service started")
         
-        while self._running:
-            await self._check_all_servers()
-            await asyncio.sleep(self.config.interval_seconds)
+        try:
+            while self._running:
+                await self._check_all_servers()
+                await asyncio.sleep(self.config.interval_seconds)
+        finally:
+            session, self._session = self._session, None
+            await session.close()
     
     def stop(self):
-        """Stop health check loop."""
+        """Stop health check loop (the session closes when the loop exits)."""
         self._running = False
         logger.info("Health check service stopped")
     
     async def _check_all_servers(self):
-        """Check health of all servers."""
-        import aiohttp
-        
+        """Check health of all servers concurrently."""
         tasks = []
         for server_id, server in self.lb.servers.items():
             if server.status != ServerStatus.DRAINING:
@@ -603,17 +965,11 @@ class HealthCheckService:
     
     async def _check_server(self, server_id: str, server: ServerInstance):
         """Check health of a single server."""
-        import aiohttp
-        
         url = f"{server.url}{self.config.endpoint}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-                ) as response:
-                    healthy = response.status == 200
+            async with self._session.get(url, timeout=self._timeout) as response:
+                healthy = response.status == 200
         except Exception as e:
             healthy = False
             logger.debug(f"Health check failed for {server_id}: {e}")
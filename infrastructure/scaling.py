@@ -14,15 +14,20 @@ Version: 1.0.0
 """
 
 import os
+import heapq
+import itertools
 import time
 import logging
 import threading
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, ClassVar, Tuple
 from collections import deque
-import statistics
+
+import numpy as np
+
+from .load_balancer import monotonic_ns_isoformat
 
 logger = logging.getLogger(__name__)
 
@@ -49,11 +54,18 @@ class MetricType(str, Enum):
     CUSTOM = "custom"
 
 
+# Enum values resolved once, for the per-tick aggregation
+_METRIC_KEYS = tuple((mt, mt.value) for mt in MetricType)
+_CPU_KEY = MetricType.CPU.value
+_MEMORY_KEY = MetricType.MEMORY.value
+_LATENCY = MetricType.LATENCY
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ScalingPolicy:
     """Auto-scaling policy configuration."""
     min_replicas: int = 1
@@ -66,18 +78,32 @@ class ScalingPolicy:
     scale_down_cooldown_seconds: int = 300
     scale_up_increment: int = 1
     scale_down_increment: int = 1
+    # Scale up early when the CPU trend crosses the target within
+    # scale_up_cooldown_seconds + warm_up_seconds (time for a new replica
+    # to start serving); opt-in, needs samples every few seconds
+    predictive_scale_up: bool = False
+    warm_up_seconds: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricSample:
     """A single metric measurement."""
     metric_type: MetricType
     value: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
+class MetricsSnapshot:
+    """Aggregates of every metric window, taken in one pass under one lock."""
+    averages: Dict[str, float]
+    cpu_avg: float
+    mem_avg: float
+    latency_p95: Optional[float]
+
+
+@dataclass(slots=True, frozen=True)
 class ScalingDecision:
     """Result of scaling evaluation."""
     direction: ScalingDirection
@@ -85,10 +111,26 @@ class ScalingDecision:
     desired_replicas: int
     reason: str
     metrics: Dict[str, float]
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-
-
-@dataclass
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Decisions are immutable, so the status view is rendered once here
+        # instead of on every get_status() poll
+        object.__setattr__(self, '_dict', {
+            "direction": self.direction.value,
+            "from": self.current_replicas,
+            "to": self.desired_replicas,
+            "reason": self.reason,
+            "timestamp": monotonic_ns_isoformat(self.timestamp_ns)
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Status view of the decision (shared; do not mutate)."""
+        return self._dict
+
+
+@dataclass(slots=True)
 class ServiceInstance:
     """Represents a service instance in the cluster."""
     instance_id: str
@@ -97,57 +139,148 @@ class ServiceInstance:
     version: str
     started_at: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
-    last_heartbeat: datetime = field(default_factory=datetime.utcnow)
+    # time.monotonic_ns(); a plain int store, so heartbeats need no lock
+    last_heartbeat_ns: int = field(default_factory=time.monotonic_ns)
+    # time.monotonic_ns() at registration, for uptime without datetime math
+    started_at_ns: int = field(default_factory=time.monotonic_ns)
+    
+    HEARTBEAT_TIMEOUT_NS: ClassVar[int] = 30 * 1_000_000_000  # 30 second timeout
+    
+    @property
+    def expires_at_ns(self) -> int:
+        """Monotonic time at which the instance stops being healthy."""
+        return self.last_heartbeat_ns + self.HEARTBEAT_TIMEOUT_NS
+    
+    def is_healthy_at(self, now_ns: int) -> bool:
+        """Health at monotonic time ``now_ns``, for checking many instances per clock read."""
+        return now_ns - self.last_heartbeat_ns < self.HEARTBEAT_TIMEOUT_NS
     
     @property
     def is_healthy(self) -> bool:
         """Check if instance is healthy based on heartbeat."""
-        age = (datetime.utcnow() - self.last_heartbeat).total_seconds()
-        return age < 30  # 30 second timeout
+        return time.monotonic_ns() - self.last_heartbeat_ns < self.HEARTBEAT_TIMEOUT_NS
 
 
 # =============================================================================
 # Metrics Collector
 # =============================================================================
 
+class _MetricRing:
+    """
+    Growable ring buffer of (monotonic ns, value) samples in time order.
+    
+    Values and timestamps live in parallel numpy arrays, so expiry is a
+    ``searchsorted`` and aggregates run over contiguous floats. A running
+    ``total`` is kept on append and expiry so the mean is O(1).
+    """
+    
+    INITIAL_CAPACITY = 1024
+    
+    def __init__(self):
+        self.timestamps = np.zeros(self.INITIAL_CAPACITY, dtype=np.int64)
+        self.values = np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.head = 0  # index of the oldest sample
+        self.count = 0
+        self.total = 0.0
+    
+    def _segments(self) -> List[slice]:
+        """Physical slices holding the samples, oldest first."""
+        end = self.head + self.count
+        capacity = len(self.values)
+        if end <= capacity:
+            return [slice(self.head, end)]
+        return [slice(self.head, capacity), slice(0, end - capacity)]
+    
+    def append(self, timestamp_ns: int, value: float):
+        """Add the newest sample, doubling capacity when full."""
+        if self.count == len(self.values):
+            window = self.window_values(), self._window_timestamps()
+            capacity = 2 * len(self.values)
+            self.values = np.zeros(capacity, dtype=np.float64)
+            self.timestamps = np.zeros(capacity, dtype=np.int64)
+            self.values[:self.count], self.timestamps[:self.count] = window
+            self.head = 0
+            # Re-sum exactly so float drift cannot build up indefinitely
+            self.total = float(window[0].sum())
+        slot = (self.head + self.count) % len(self.values)
+        self.timestamps[slot] = timestamp_ns
+        self.values[slot] = value
+        self.count += 1
+        self.total += value
+    
+    def expire(self, cutoff_ns: int):
+        """Drop samples older than ``cutoff_ns`` by advancing the head."""
+        expired = 0
+        for segment in self._segments():
+            stamps = self.timestamps[segment]
+            stale = int(np.searchsorted(stamps, cutoff_ns))
+            if stale:
+                self.total -= float(self.values[segment][:stale].sum())
+            expired += stale
+            if stale < len(stamps):
+                break
+        self.head = (self.head + expired) % len(self.values)
+        self.count -= expired
+        if not self.count:
+            self.total = 0.0
+    
+    def mean(self) -> float:
+        """Mean of the window from the running total (``count`` > 0)."""
+        return self.total / self.count
+    
+    def window_values(self) -> np.ndarray:
+        """Sample values, oldest first (a view when contiguous)."""
+        segments = self._segments()
+        if len(segments) == 1:
+            return self.values[segments[0]]
+        return np.concatenate([self.values[segment] for segment in segments])
+    
+    def _window_timestamps(self) -> np.ndarray:
+        """Sample timestamps, oldest first (always a copy)."""
+        return np.concatenate([self.timestamps[segment] for segment in self._segments()])
+
+
 class MetricsCollector:
     """
     Collects and aggregates metrics for scaling decisions.
     
-    Uses sliding window for smooth metric averaging.
+    Uses sliding window for smooth metric averaging. Samples are kept as
+    raw floats in a numpy ring per metric rather than as MetricSample
+    objects.
     """
     
+    # Least samples and time they must span before forecast() fits a trend
+    FORECAST_MIN_SAMPLES = 8
+    FORECAST_MIN_SPAN_SECONDS = 30.0
+    
     def __init__(self, window_seconds: int = 60):
         self.window_seconds = window_seconds
-        self.metrics: Dict[MetricType, deque] = {
-            mt: deque() for mt in MetricType
+        self.metrics: Dict[MetricType, _MetricRing] = {
+            mt: _MetricRing() for mt in MetricType
         }
         self._lock = threading.Lock()
     
     def record(self, metric_type: MetricType, value: float):
         """Record a metric value."""
+        now_ns = time.monotonic_ns()
         with self._lock:
-            sample = MetricSample(metric_type=metric_type, value=value)
-            self.metrics[metric_type].append(sample)
-            self._cleanup(metric_type)
+            self.metrics[metric_type].append(now_ns, value)
+            self._cleanup(metric_type, now_ns)
     
-    def _cleanup(self, metric_type: MetricType):
+    def _cleanup(self, metric_type: MetricType, now_ns: Optional[int] = None):
         """Remove old samples outside the window."""
-        cutoff = datetime.utcnow() - timedelta(seconds=self.window_seconds)
-        while (
-            self.metrics[metric_type] and
-            self.metrics[metric_type][0].timestamp < cutoff
-        ):
-            self.metrics[metric_type].popleft()
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        self.metrics[metric_type].expire(now_ns - self.window_seconds * 1_000_000_000)
     
     def get_average(self, metric_type: MetricType) -> Optional[float]:
         """Get average value for metric type."""
         with self._lock:
             self._cleanup(metric_type)
-            samples = self.metrics[metric_type]
-            if not samples:
+            ring = self.metrics[metric_type]
+            if not ring.count:
                 return None
-            return statistics.mean(s.value for s in samples)
+            return ring.mean()
     
     def get_percentile(
         self,
@@ -157,19 +290,84 @@ class MetricsCollector:
         """Get percentile value for metric type."""
         with self._lock:
             self._cleanup(metric_type)
-            samples = self.metrics[metric_type]
-            if not samples:
+            ring = self.metrics[metric_type]
+            if not ring.count:
                 return None
-            values = sorted(s.value for s in samples)
-            index = int(len(values) * percentile / 100)
-            return values[min(index, len(values) - 1)]
+            return self._nearest_rank(ring.window_values(), percentile)
+    
+    @staticmethod
+    def _nearest_rank(values: np.ndarray, percentile: float) -> float:
+        """Same nearest-rank index as sorting, via an O(n) partition."""
+        index = min(int(len(values) * percentile / 100), len(values) - 1)
+        return float(np.partition(values, index)[index])
+    
+    def forecast(
+        self,
+        metric_type: MetricType,
+        horizon_seconds: float,
+        ceiling: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Linear forecast of a metric ``horizon_seconds`` from now.
+        
+        Least-squares line through the window's samples. A trend is only
+        trusted with at least ``FORECAST_MIN_SAMPLES`` samples spanning
+        ``FORECAST_MIN_SPAN_SECONDS``; otherwise returns None. The line is
+        never extrapolated further ahead than the samples span, and the
+        result is clamped to ``[0, ceiling]``.
+        """
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            self._cleanup(metric_type, now_ns)
+            ring = self.metrics[metric_type]
+            if ring.count < self.FORECAST_MIN_SAMPLES:
+                return None
+            values = ring.window_values()
+            seconds = (ring._window_timestamps() - now_ns) / 1e9
+        
+        span = float(seconds[-1] - seconds[0])
+        if span < self.FORECAST_MIN_SPAN_SECONDS:
+            return None
+        
+        mean_t = seconds.mean()
+        mean_v = values.mean()
+        dt = seconds - mean_t
+        slope = float(dt @ (values - mean_v)) / float(dt @ dt)
+        predicted = float(mean_v + slope * (min(horizon_seconds, span) - mean_t))
+        predicted = max(predicted, 0.0)
+        if ceiling is not None:
+            predicted = min(predicted, ceiling)
+        return predicted
     
     def get_all_averages(self) -> Dict[str, float]:
         """Get averages for all metric types."""
         return {
-            mt.value: self.get_average(mt) or 0.0
-            for mt in MetricType
+            key: self.get_average(mt) or 0.0
+            for mt, key in _METRIC_KEYS
         }
+    
+    def snapshot(self) -> MetricsSnapshot:
+        """All averages (O(1) each) plus P95 latency, under one lock."""
+        now_ns = time.monotonic_ns()
+        averages: Dict[str, float] = {}
+        latency_p95 = None
+        with self._lock:
+            for mt, key in _METRIC_KEYS:
+                self._cleanup(mt, now_ns)
+                ring = self.metrics[mt]
+                if not ring.count:
+                    averages[key] = 0.0
+                    continue
+                averages[key] = ring.mean()
+                if mt is _LATENCY:
+                    latency_p95 = self._nearest_rank(ring.window_values(), 95)
+        
+        return MetricsSnapshot(
+            averages=averages,
+            cpu_avg=averages[_CPU_KEY],
+            mem_avg=averages[_MEMORY_KEY],
+            latency_p95=latency_p95
+        )
 
 
 # =============================================================================
@@ -193,17 +391,22 @@ class AutoScaler:
         self.metrics = metrics_collector or MetricsCollector()
         self.scale_callback = scale_callback
         
+        # Written only by the scaling loop; readers take one snapshot per
+        # decision (int stores are atomic under the GIL, so no lock)
         self.current_replicas = policy.min_replicas
-        self.last_scale_up: Optional[datetime] = None
-        self.last_scale_down: Optional[datetime] = None
+        self.last_scale_up_ns = 0  # time.monotonic_ns(); 0 = never
+        self.last_scale_down_ns = 0
         self.decision_history: deque = deque(maxlen=100)
         
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # Set to end the current wait early (trigger() or stop())
+        self._wakeup = threading.Event()
     
     def start(self, interval_seconds: int = 15):
         """Start auto-scaling loop."""
         self._running = True
+        self._wakeup.clear()
         self._thread = threading.Thread(
             target=self._scaling_loop,
             args=(interval_seconds,),
@@ -215,6 +418,7 @@ class AutoScaler:
     def stop(self):
         """Stop auto-scaling loop."""
         self._running = False
+        self._wakeup.set()
         if self._thread:
             self._thread.join(timeout=5)
         logger.info("Auto-scaler stopped")
@@ -230,53 +434,78 @@ class AutoScaler:
                     self._apply_scaling(decision)
                 
             except Exception as e:
-                logger.error(f"Auto-scaler error: {e}")
+                logger.error("Auto-scaler error: %s", e)
             
-            time.sleep(interval)
+            self._wakeup.wait(timeout=interval)
+            self._wakeup.clear()
+    
+    def trigger(self):
+        """
+        Evaluate now instead of at the next interval, e.g. on a queue-depth
+        spike. Cooldowns still apply.
+        """
+        self._wakeup.set()
     
     def evaluate(self) -> ScalingDecision:
         """Evaluate current metrics and make scaling decision."""
-        metrics = self.metrics.get_all_averages()
+        snapshot = self.metrics.snapshot()
+        metrics = snapshot.averages
+        replicas = self.current_replicas
         
         # Check CPU
-        cpu = metrics.get(MetricType.CPU.value, 0)
+        cpu = snapshot.cpu_avg
         if cpu > self.policy.target_cpu_percent:
             return self._create_scale_up_decision(
                 f"CPU {cpu:.1f}% exceeds target {self.policy.target_cpu_percent}%",
-                metrics
+                metrics,
+                replicas
             )
         
         # Check Memory
-        memory = metrics.get(MetricType.MEMORY.value, 0)
+        memory = snapshot.mem_avg
         if memory > self.policy.target_memory_percent:
             return self._create_scale_up_decision(
                 f"Memory {memory:.1f}% exceeds target {self.policy.target_memory_percent}%",
-                metrics
+                metrics,
+                replicas
             )
         
         # Check Latency (P95)
-        latency = self.metrics.get_percentile(MetricType.LATENCY, 95)
+        latency = snapshot.latency_p95
         if latency and latency > self.policy.target_latency_ms:
             return self._create_scale_up_decision(
                 f"P95 latency {latency:.0f}ms exceeds target {self.policy.target_latency_ms}ms",
-                metrics
+                metrics,
+                replicas
             )
         
+        # Scale up ahead of a rising CPU trend so capacity is ready in time
+        if self.policy.predictive_scale_up:
+            horizon = self.policy.scale_up_cooldown_seconds + self.policy.warm_up_seconds
+            cpu_forecast = self.metrics.forecast(MetricType.CPU, horizon, ceiling=100.0)
+            if cpu_forecast is not None and cpu_forecast > self.policy.target_cpu_percent:
+                return self._create_scale_up_decision(
+                    f"CPU forecast {cpu_forecast:.1f}% in {horizon}s exceeds target {self.policy.target_cpu_percent}%",
+                    metrics,
+                    replicas
+                )
+        
         # Check for scale down opportunity
         if (
             cpu < self.policy.target_cpu_percent * 0.5 and
             memory < self.policy.target_memory_percent * 0.5 and
-            self.current_replicas > self.policy.min_replicas
+            replicas > self.policy.min_replicas
         ):
             return self._create_scale_down_decision(
                 f"Resources under-utilized (CPU: {cpu:.1f}%, Memory: {memory:.1f}%)",
-                metrics
+                metrics,
+                replicas
             )
         
         return ScalingDecision(
             direction=ScalingDirection.NONE,
-            current_replicas=self.current_replicas,
-            desired_replicas=self.current_replicas,
+            current_replicas=replicas,
+            desired_replicas=replicas,
             reason="Metrics within target range",
             metrics=metrics
         )
@@ -284,37 +513,38 @@ class AutoScaler:
     def _create_scale_up_decision(
         self,
         reason: str,
-        metrics: Dict[str, float]
+        metrics: Dict[str, float],
+        replicas: int
     ) -> ScalingDecision:
-        """Create scale up decision if cooldown allows."""
-        if self.last_scale_up:
-            elapsed = (datetime.utcnow() - self.last_scale_up).total_seconds()
+        """Create scale up decision for ``replicas`` if cooldown allows."""
+        if self.last_scale_up_ns:
+            elapsed = (time.monotonic_ns() - self.last_scale_up_ns) / 1_000_000_000
             if elapsed < self.policy.scale_up_cooldown_seconds:
                 return ScalingDecision(
                     direction=ScalingDirection.NONE,
-                    current_replicas=self.current_replicas,
-                    desired_replicas=self.current_replicas,
+                    current_replicas=replicas,
+                    desired_replicas=replicas,
                     reason=f"Scale up cooldown ({int(self.policy.scale_up_cooldown_seconds - elapsed)}s remaining)",
                     metrics=metrics
                 )
         
         desired = min(
-            self.current_replicas + self.policy.scale_up_increment,
+            replicas + self.policy.scale_up_increment,
             self.policy.max_replicas
         )
         
-        if desired == self.current_replicas:
+        if desired == replicas:
             return ScalingDecision(
                 direction=ScalingDirection.NONE,
-                current_replicas=self.current_replicas,
-                desired_replicas=self.current_replicas,
+                current_replicas=replicas,
+                desired_replicas=replicas,
                 reason="Already at maximum replicas",
                 metrics=metrics
             )
         
         return ScalingDecision(
             direction=ScalingDirection.UP,
-            current_replicas=self.current_replicas,
+            current_replicas=replicas,
             desired_replicas=desired,
             reason=reason,
             metrics=metrics
@@ -323,37 +553,38 @@ class AutoScaler:
     def _create_scale_down_decision(
         self,
         reason: str,
-        metrics: Dict[str, float]
+        metrics: Dict[str, float],
+        replicas: int
     ) -> ScalingDecision:
-        """Create scale down decision if cooldown allows."""
-        if self.last_scale_down:
-            elapsed = (datetime.utcnow() - self.last_scale_down).total_seconds()
+        """Create scale down decision for ``replicas`` if cooldown allows."""
+        if self.last_scale_down_ns:
+            elapsed = (time.monotonic_ns() - self.last_scale_down_ns) / 1_000_000_000
             if elapsed < self.policy.scale_down_cooldown_seconds:
                 return ScalingDecision(
                     direction=ScalingDirection.NONE,
-                    current_replicas=self.current_replicas,
-                    desired_replicas=self.current_replicas,
+                    current_replicas=replicas,
+                    desired_replicas=replicas,
                     reason=f"Scale down cooldown ({int(self.policy.scale_down_cooldown_seconds - elapsed)}s remaining)",
                     metrics=metrics
                 )
         
         desired = max(
-            self.current_replicas - self.policy.scale_down_increment,
+            replicas - self.policy.scale_down_increment,
             self.policy.min_replicas
         )
         
-        if desired == self.current_replicas:
+        if desired == replicas:
             return ScalingDecision(
                 direction=ScalingDirection.NONE,
-                current_replicas=self.current_replicas,
-                desired_replicas=self.current_replicas,
+                current_replicas=replicas,
+                desired_replicas=replicas,
                 reason="Already at minimum replicas",
                 metrics=metrics
             )
         
         return ScalingDecision(
             direction=ScalingDirection.DOWN,
-            current_replicas=self.current_replicas,
+            current_replicas=replicas,
             desired_replicas=desired,
             reason=reason,
             metrics=metrics
@@ -362,41 +593,38 @@ class AutoScaler:
     def _apply_scaling(self, decision: ScalingDecision):
         """Apply scaling decision."""
         logger.info(
-            f"Scaling {decision.direction.value}: "
-            f"{decision.current_replicas} -> {decision.desired_replicas} "
-            f"({decision.reason})"
+            "Scaling %s: %d -> %d (%s)",
+            decision.direction.value,
+            decision.current_replicas,
+            decision.desired_replicas,
+            decision.reason
         )
         
         self.current_replicas = decision.desired_replicas
         
         if decision.direction == ScalingDirection.UP:
-            self.last_scale_up = datetime.utcnow()
+            self.last_scale_up_ns = time.monotonic_ns()
         else:
-            self.last_scale_down = datetime.utcnow()
+            self.last_scale_down_ns = time.monotonic_ns()
         
         if self.scale_callback:
             try:
                 self.scale_callback(decision.desired_replicas)
             except Exception as e:
-                logger.error(f"Scale callback failed: {e}")
+                logger.error("Scale callback failed: %s", e)
     
     def get_status(self) -> Dict[str, Any]:
         """Get auto-scaler status."""
+        history = self.decision_history
         return {
             "current_replicas": self.current_replicas,
             "min_replicas": self.policy.min_replicas,
             "max_replicas": self.policy.max_replicas,
-            "last_scale_up": self.last_scale_up.isoformat() if self.last_scale_up else None,
-            "last_scale_down": self.last_scale_down.isoformat() if self.last_scale_down else None,
+            "last_scale_up": monotonic_ns_isoformat(self.last_scale_up_ns),
+            "last_scale_down": monotonic_ns_isoformat(self.last_scale_down_ns),
             "recent_decisions": [
-                {
-                    "direction": d.direction.value,
-                    "from": d.current_replicas,
-                    "to": d.desired_replicas,
-                    "reason": d.reason,
-                    "timestamp": d.timestamp.isoformat()
-                }
-                for d in list(self.decision_history)[-10:]
+                d.to_dict()
+                for d in itertools.islice(history, max(0, len(history) - 10), None)
             ],
             "current_metrics": self.metrics.get_all_averages()
         }
@@ -411,12 +639,61 @@ class ServiceRegistry:
     Service Discovery and Registry.
     
     Manages service instances for discovery and load balancing.
+    
+    Services are striped over ``SHARDS`` dicts keyed by service name, each
+    with its own lock that only structural changes (register, deregister,
+    cleanup) take. Each structural change also republishes the service's
+    instances as an immutable tuple (copy-on-write), which is what lookups
+    read. Heartbeats and lookups, including ``get_all_services``, are
+    lock-free: single dict reads, reference swaps and int stores are atomic
+    under the GIL. A service registered during ``get_all_services`` may or
+    may not appear in its result.
+    
+    Each instance has one entry in an expiry heap. ``cleanup_stale`` pops
+    only entries that are due; an instance that heartbeated since its
+    entry was pushed is re-pushed with its new expiry instead of removed.
     """
     
+    # Power of two >= 2 stripes per CPU (min 8); shard = hash(service_name) & (SHARDS - 1)
+    SHARDS = 1 << (max(8, 2 * (os.cpu_count() or 1)) - 1).bit_length()
+    
     def __init__(self, heartbeat_timeout_seconds: int = 30):
         self.heartbeat_timeout = heartbeat_timeout_seconds
-        self.services: Dict[str, Dict[str, ServiceInstance]] = {}
-        self._lock = threading.Lock()
+        # (lock, services, snapshots): services is authoritative and changed
+        # under the lock; snapshots maps service name -> tuple of instances
+        self._shards: List[Tuple[
+            threading.Lock,
+            Dict[str, Dict[str, ServiceInstance]],
+            Dict[str, Tuple[ServiceInstance, ...]]
+        ]] = [
+            (threading.Lock(), {}, {}) for _ in range(self.SHARDS)
+        ]
+        # (expires_at_ns, push sequence, service_name, instance_id, instance);
+        # the sequence keeps ties from comparing instances
+        self._expiry_heap: List[Tuple[int, int, str, str, ServiceInstance]] = []
+        self._expiry_seq = itertools.count()
+        self._expiry_lock = threading.Lock()
+    
+    def _shard(self, service_name: str) -> Tuple[
+        threading.Lock,
+        Dict[str, Dict[str, ServiceInstance]],
+        Dict[str, Tuple[ServiceInstance, ...]]
+    ]:
+        """(lock, services, snapshots) owning ``service_name``."""
+        return self._shards[hash(service_name) & (self.SHARDS - 1)]
+    
+    @staticmethod
+    def _publish(
+        services: Dict[str, Dict[str, ServiceInstance]],
+        snapshots: Dict[str, Tuple[ServiceInstance, ...]],
+        service_name: str
+    ):
+        """Republish a service's instance tuple; caller holds the shard lock."""
+        instances = services.get(service_name)
+        if instances:
+            snapshots[service_name] = tuple(instances.values())
+        else:
+            snapshots.pop(service_name, None)
     
     def register(
         self,
@@ -437,72 +714,92 @@ class ServiceRegistry:
             metadata=metadata or {}
         )
         
-        with self._lock:
-            if service_name not in self.services:
-                self.services[service_name] = {}
+        lock, services, snapshots = self._shard(service_name)
+        with lock:
+            if service_name not in services:
+                services[service_name] = {}
             
-            self.services[service_name][instance_id] = instance
+            services[service_name][instance_id] = instance
+            self._publish(services, snapshots, service_name)
+        
+        with self._expiry_lock:
+            self._push_expiry(service_name, instance_id, instance)
         
-        logger.info(f"Registered {service_name}/{instance_id} at {host}:{port}")
+        logger.info("Registered %s/%s at %s:%s", service_name, instance_id, host, port)
         return instance
     
+    def _push_expiry(self, service_name: str, instance_id: str, instance: ServiceInstance):
+        """Schedule an expiry check; caller holds ``self._expiry_lock``."""
+        heapq.heappush(
+            self._expiry_heap,
+            (instance.expires_at_ns, next(self._expiry_seq), service_name, instance_id, instance)
+        )
+    
     def deregister(self, service_name: str, instance_id: str):
         """Deregister a service instance."""
-        with self._lock:
-            if service_name in self.services:
-                if instance_id in self.services[service_name]:
-                    del self.services[service_name][instance_id]
-                    logger.info(f"Deregistered {service_name}/{instance_id}")
+        lock, services, snapshots = self._shard(service_name)
+        with lock:
+            if service_name in services:
+                if instance_id in services[service_name]:
+                    del services[service_name][instance_id]
+                    self._publish(services, snapshots, service_name)
+                    logger.info("Deregistered %s/%s", service_name, instance_id)
     
     def heartbeat(self, service_name: str, instance_id: str) -> bool:
-        """Update heartbeat for an instance."""
-        with self._lock:
-            if (
-                service_name in self.services and
-                instance_id in self.services[service_name]
-            ):
-                self.services[service_name][instance_id].last_heartbeat = datetime.utcnow()
-                return True
-        return False
+        """Update heartbeat for an instance (lock-free)."""
+        instance = self._shard(service_name)[1].get(service_name, {}).get(instance_id)
+        if instance is None:
+            return False
+        instance.last_heartbeat_ns = time.monotonic_ns()
+        return True
     
     def get_instances(
         self,
         service_name: str,
         healthy_only: bool = True
     ) -> List[ServiceInstance]:
-        """Get all instances of a service."""
-        with self._lock:
-            if service_name not in self.services:
-                return []
-            
-            instances = list(self.services[service_name].values())
-            
-            if healthy_only:
-                instances = [i for i in instances if i.is_healthy]
-            
-            return instances
+        """Get all instances of a service (lock-free)."""
+        instances = self._shard(service_name)[2].get(service_name, ())
+        
+        if healthy_only:
+            now_ns = time.monotonic_ns()
+            return [i for i in instances if i.is_healthy_at(now_ns)]
+        
+        return list(instances)
     
     def get_all_services(self) -> Dict[str, List[ServiceInstance]]:
-        """Get all registered services and their instances."""
-        with self._lock:
-            return {
-                name: list(instances.values())
-                for name, instances in self.services.items()
-            }
+        """Get all registered services and their instances (lock-free)."""
+        all_services = {}
+        for _, _, snapshots in self._shards:
+            # Copy the items first so concurrent registers can't resize the
+            # dict mid-iteration
+            for name, instances in list(snapshots.items()):
+                all_services[name] = list(instances)
+        return all_services
     
     def cleanup_stale(self):
-        """Remove stale instances that haven't sent heartbeat."""
-        with self._lock:
-            for service_name in list(self.services.keys()):
-                stale = [
-                    instance_id
-                    for instance_id, instance in self.services[service_name].items()
-                    if not instance.is_healthy
-                ]
-                
-                for instance_id in stale:
-                    del self.services[service_name][instance_id]
-                    logger.warning(f"Removed stale instance {service_name}/{instance_id}")
+        """Remove stale instances that haven't sent heartbeat (O(due log n))."""
+        now_ns = time.monotonic_ns()
+        while True:
+            with self._expiry_lock:
+                if not self._expiry_heap or self._expiry_heap[0][0] > now_ns:
+                    return
+                _, _, service_name, instance_id, instance = heapq.heappop(self._expiry_heap)
+            
+            lock, services, snapshots = self._shard(service_name)
+            with lock:
+                instances = services.get(service_name)
+                if instances is None or instances.get(instance_id) is not instance:
+                    # Deregistered or re-registered; the new instance has its own entry
+                    continue
+                if instance.expires_at_ns > now_ns:
+                    # Heartbeated since this entry was pushed
+                    with self._expiry_lock:
+                        self._push_expiry(service_name, instance_id, instance)
+                    continue
+                del instances[instance_id]
+                self._publish(services, snapshots, service_name)
+            logger.warning("Removed stale instance %s/%s", service_name, instance_id)
 
 
 # =============================================================================
@@ -564,7 +861,7 @@ class ClusterCoordinator:
             try:
                 self.registry.cleanup_stale()
             except Exception as e:
-                logger.error(f"Cleanup error: {e}")
+                logger.error("Cleanup error: %s", e)
             
             time.sleep(10)
     
@@ -576,25 +873,27 @@ class ClusterCoordinator:
             "healthy_instances": 0
         }
         
+        now_ns = time.monotonic_ns()
         for service_name, instances in self.registry.get_all_services().items():
-            healthy = [i for i in instances if i.is_healthy]
+            health = [i.is_healthy_at(now_ns) for i in instances]
+            healthy = sum(health)
             status["services"][service_name] = {
                 "total": len(instances),
-                "healthy": len(healthy),
+                "healthy": healthy,
                 "instances": [
                     {
                         "id": i.instance_id,
                         "host": i.host,
                         "port": i.port,
                         "version": i.version,
-                        "healthy": i.is_healthy,
-                        "uptime_seconds": (datetime.utcnow() - i.started_at).total_seconds()
+                        "healthy": is_healthy,
+                        "uptime_seconds": (now_ns - i.started_at_ns) / 1e9
                     }
-                    for i in instances
+                    for i, is_healthy in zip(instances, health)
                 ]
             }
             status["total_instances"] += len(instances)
-            status["healthy_instances"] += len(healthy)
+            status["healthy_instances"] += healthy
         
         if self.scaler:
             status["auto_scaler"] = self.scaler.get_status()
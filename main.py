@@ -195,6 +195,8 @@ def make_prediction(args):
 def benchmark(args):
     """Benchmark model performance."""
     import time
+    from concurrent.futures import ThreadPoolExecutor
+    import numpy as np
     from data.data_generator import generate_synthetic_data
     from models.loan_model import LoanApprovalModel
     
@@ -216,41 +218,99 @@ def benchmark(args):
     print(f"\n📊 Generating {n_samples} test samples...")
     test_df = generate_synthetic_data(n_samples=n_samples)
     
+    # Single-row frames are built up front so the timed region is the
+    # model call only, not DataFrame.sample()
+    rng = np.random.default_rng()
+    samples = [test_df.iloc[[i]] for i in rng.integers(0, len(test_df), 100)]
+    
+    # Untimed warm-up: first calls pay one-off costs (lazy imports inside
+    # sklearn/shap, caches) that would otherwise land in the first sample
+    model.predict(samples[0])
+    model.explain_prediction(samples[0])
+    
     # Benchmark single predictions
     print("\n⏱️  Single Prediction Benchmark:")
-    times = []
-    for i in range(100):
-        sample = test_df.sample(1)
-        start = time.perf_counter()
+    times_ns = np.empty(len(samples), dtype=np.int64)
+    for i, sample in enumerate(samples):
+        start = time.perf_counter_ns()
         _ = model.predict(sample)
-        times.append((time.perf_counter() - start) * 1000)
+        times_ns[i] = time.perf_counter_ns() - start
+    times = times_ns / 1e6
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
     
-    print(f"   Mean latency: {sum(times)/len(times):.2f} ms")
-    print(f"   Min latency: {min(times):.2f} ms")
-    print(f"   Max latency: {max(times):.2f} ms")
-    print(f"   Throughput: {1000/(sum(times)/len(times)):.0f} predictions/sec")
+    print(f"   Mean latency: {times.mean():.2f} ms")
+    print(f"   Min latency: {times.min():.2f} ms")
+    print(f"   Max latency: {times.max():.2f} ms")
+    print(f"   p50/p95/p99: {p50:.2f} / {p95:.2f} / {p99:.2f} ms")
+    print(f"   Throughput: {1000/times.mean():.0f} predictions/sec")
     
     # Benchmark with explanations
     print("\n⏱️  Prediction + Explanation Benchmark:")
-    times = []
-    for i in range(50):
-        sample = test_df.sample(1)
-        start = time.perf_counter()
+    times_ns = np.empty(50, dtype=np.int64)
+    for i, sample in enumerate(samples[:50]):
+        start = time.perf_counter_ns()
         _ = model.predict(sample)
         _ = model.explain_prediction(sample)
-        times.append((time.perf_counter() - start) * 1000)
-    
-    print(f"   Mean latency: {sum(times)/len(times):.2f} ms")
-    print(f"   Throughput: {1000/(sum(times)/len(times)):.0f} predictions/sec")
+        times_ns[i] = time.perf_counter_ns() - start
+    times = times_ns / 1e6
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    
+    print(f"   Mean latency: {times.mean():.2f} ms")
+    print(f"   p50/p95/p99: {p50:.2f} / {p95:.2f} / {p99:.2f} ms")
+    print(f"   Throughput: {1000/times.mean():.0f} predictions/sec")
+    
+    # Concurrent predictions: per-call latency under contention (GIL,
+    # shared model state), as a multi-threaded server would see it
+    workers = args.workers if hasattr(args, 'workers') else 4
+    print(f"\n⏱️  Concurrent Prediction Benchmark ({workers} workers):")
+    
+    def timed_predict(sample):
+        start = time.perf_counter_ns()
+        model.predict(sample)
+        return time.perf_counter_ns() - start
+    
+    calls = samples * 2
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(timed_predict, sample) for sample in calls]
+        times_ns = np.array([future.result() for future in futures], dtype=np.int64)
+    wall_ms = (time.perf_counter_ns() - start) / 1e6
+    times = times_ns / 1e6
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    
+    print(f"   Mean latency: {times.mean():.2f} ms")
+    print(f"   p50/p95/p99: {p50:.2f} / {p95:.2f} / {p99:.2f} ms")
+    print(f"   Throughput: {len(calls)*1000/wall_ms:.0f} predictions/sec")
+    
+    # Model-only timings: rows are preprocessed once into a numpy matrix,
+    # so these measure the estimator alone (inference vs end-to-end above)
+    X = model.preprocess_data(test_df)
+    estimator = model.model
+    estimator.predict_proba(X[:1])
+    
+    print("\n⏱️  Model-only Single Row Benchmark:")
+    rows = rng.integers(0, len(X), 100)
+    times_ns = np.empty(len(rows), dtype=np.int64)
+    for i, row in enumerate(rows):
+        x = X[row:row + 1]
+        start = time.perf_counter_ns()
+        _ = estimator.predict_proba(x)
+        times_ns[i] = time.perf_counter_ns() - start
+    times = times_ns / 1e6
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    
+    print(f"   Mean latency: {times.mean():.3f} ms")
+    print(f"   p50/p95/p99: {p50:.3f} / {p95:.3f} / {p99:.3f} ms")
+    print(f"   Throughput: {1000/times.mean():.0f} predictions/sec")
     
     # Benchmark batch predictions
     print("\n⏱️  Batch Prediction Benchmark:")
-    batch_sizes = [10, 50, 100, 500]
+    batch_sizes = [10, 100, 1000, 10_000]
     for batch_size in batch_sizes:
-        batch = test_df.sample(batch_size)
-        start = time.perf_counter()
-        _ = model.predict_batch(batch)
-        elapsed = (time.perf_counter() - start) * 1000
+        batch = X[rng.integers(0, len(X), batch_size)]
+        start = time.perf_counter_ns()
+        _ = estimator.predict_proba(batch)
+        elapsed = (time.perf_counter_ns() - start) / 1e6
         print(f"   Batch size {batch_size}: {elapsed:.2f} ms ({batch_size*1000/elapsed:.0f} samples/sec)")
     
     print("\n" + "="*60)
@@ -353,6 +413,8 @@ Examples:
     
     # Benchmark command
     bench_parser = subparsers.add_parser('benchmark', help='Benchmark performance')
+    bench_parser.add_argument('--workers', type=int, default=4,
+                              help='Threads for the concurrent prediction benchmark')
     bench_parser.set_defaults(func=benchmark)
     
     # Status command
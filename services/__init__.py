@@ -55,6 +55,12 @@ from .application_service import (
     KYCRequiredError
 )
 
+from .audit_service import (
+    AuditBatcher,
+    get_audit_batcher,
+    listen_for_audit_rows
+)
+
 from .rollback_service import (
     ModelRollbackService,
     DecisionHistoryStore,
@@ -182,5 +188,10 @@ __all__ = [
     'mask_for_display',
     'mask_applicant',
     'is_sensitive_field',
-    'privacy_protected'
+    'privacy_protected',
+    
+    # Audit Batcher
+    'AuditBatcher',
+    'get_audit_batcher',
+    'listen_for_audit_rows'
 ]
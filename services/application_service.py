@@ -29,6 +29,7 @@ from services.ml_service import (
     MLPredictionService, ApplicantData, LoanData, PredictionResult,
     get_ml_service
 )
+from services.audit_service import get_audit_batcher
 from services.decision_engine import (
     DecisionEngine, get_decision_engine,
     ApplicantProfile, LoanRequest, FinalDecision,
@@ -684,22 +685,18 @@ class ApplicationService:
         new_values: Optional[dict] = None,
         notes: Optional[str] = None,
         request_ip: Optional[str] = None
-    ) -> ApplicationAuditLog:
-        """Create audit log entry."""
-        audit = ApplicationAuditLog(
-            entity_type="loan_application",
-            entity_id=application.id,
-            application_id=application.id,
-            user_id=user.id,
-            action=action,
-            changes=changes,
-            old_values=old_values,
-            new_values=new_values,
-            notes=notes,
-            ip_address=request_ip
-        )
-        db.add(audit)
-        return audit
+    ) -> None:
+        """Create audit log entry (written by the batcher once ``db`` commits)."""
+        get_audit_batcher().defer(db, [{
+            "entity_type": "loan_application",
+            "entity_id": application.id,
+            "application_id": application.id,
+            "user_id": user.id,
+            "action": action,
+            "changes": changes or ApplicationAuditLog.delta(old_values, new_values),
+            "notes": notes,
+            "ip_address": request_ip
+        }])
 
 
 # Singleton for dependency injection
@@ -241,12 +241,11 @@ class LoanDatabaseService:
         try:
             with get_session_context() as session:
                 repo = ApplicantRepository(session)
-                applicant = repo.get_by_id(applicant_id)
                 
-                if not applicant:
+                if not repo.update_by_id(applicant_id, updates):
                     return False, None, "Applicant not found"
                 
-                applicant = repo.update(applicant, updates)
+                applicant = repo.get_by_id(applicant_id)
                 logger.info(f"Updated applicant: {applicant_id}")
                 return True, applicant, None
                 
@@ -547,12 +546,17 @@ class LoanDatabaseService:
             applicant_repo = ApplicantRepository(session)
             loan_repo = LoanApplicationRepository(session)
             
+            status_counts = loan_repo.count_by_status()
+            
             return {
                 'applicants': applicant_repo.get_statistics(),
                 'applications': loan_repo.get_statistics(),
                 'risk_analysis': loan_repo.get_risk_analysis(),
                 'pending_review': len(loan_repo.get_applications_for_review()),
-                'pending_processing': len(loan_repo.get_pending_applications())
+                'pending_processing': (
+                    status_counts.get(ApplicationStatus.PENDING.value, 0)
+                    + status_counts.get(ApplicationStatus.DRAFT.value, 0)
+                )
             }
     
     def get_application_history(self, application_id: UUID) -> List[Dict[str, Any]]:
@@ -0,0 +1,123 @@
+"""
+Partition Maintenance
+=====================
+Keeps the PostgreSQL range partitions of ``application_audit_logs``
+(monthly on ``created_at``) and ``user_sessions`` (weekly on
+``expires_at``) ahead of the clock, and drops session partitions past
+their retention.
+
+``create_all`` only creates the first few partitions. Without this job
+every later row falls into the DEFAULT partition, which is never dropped,
+and creating the partition afterwards has to move those rows out of it
+first (``ensure_audit_partitions`` / ``ensure_session_partitions`` do
+that).
+
+The API runs ``PartitionMaintainer`` from its lifespan; deployments
+without the API can call ``run_partition_maintenance`` from cron.
+Each run holds a transaction-level advisory lock, so several replicas
+never maintain partitions at the same time.
+
+Author: Loan Analytics Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from database.connection import get_db
+from database.models import (
+    ensure_audit_partitions,
+    ensure_session_partitions,
+    drop_expired_session_partitions
+)
+
+logger = logging.getLogger(__name__)
+
+# pg advisory lock key shared by every replica running maintenance
+_MAINTENANCE_LOCK_KEY = 0x4C4F414E
+
+
+def run_partition_maintenance() -> Dict[str, List[str]]:
+    """
+    Ensure upcoming partitions and drop expired ones, in one transaction.
+
+    Returns:
+        Partition names ensured per table, plus the session partitions
+        dropped (empty if skipped or not PostgreSQL)
+    """
+    engine = get_db().engine
+    if engine.dialect.name != 'postgresql':
+        return {}
+
+    with engine.begin() as connection:
+        locked = connection.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {'key': _MAINTENANCE_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            logger.info("Partition maintenance already running elsewhere; skipped")
+            return {}
+        return {
+            'application_audit_logs': ensure_audit_partitions(connection),
+            # Ensure first: it moves stranded sessions into droppable weeks
+            'user_sessions': ensure_session_partitions(connection),
+            'user_sessions_dropped': drop_expired_session_partitions(connection),
+        }
+
+
+class PartitionMaintainer:
+    """Background task running ``run_partition_maintenance`` periodically."""
+
+    def __init__(self, interval_seconds: float = 6 * 3600):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is scheduled."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background task on the running event loop (runs once immediately)."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("Partition maintainer started")
+
+    async def stop(self) -> None:
+        """Cancel the background task."""
+        if not self.running:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Partition maintainer stopped")
+
+    async def _run(self) -> None:
+        """Maintain partitions, then sleep, until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                ensured = await loop.run_in_executor(None, run_partition_maintenance)
+                if ensured:
+                    logger.info(f"Partitions ensured: {ensured}")
+            except Exception as e:
+                logger.error(f"Partition maintenance failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+# Singleton for dependency injection
+_partition_maintainer: Optional[PartitionMaintainer] = None
+
+
+def get_partition_maintainer() -> PartitionMaintainer:
+    """Get partition maintainer instance."""
+    global _partition_maintainer
+    if _partition_maintainer is None:
+        _partition_maintainer = PartitionMaintainer()
+    return _partition_maintainer
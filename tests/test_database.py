@@ -0,0 +1,153 @@
+"""
+Database Test Suite
+===================
+Tests for the repositories against an in-memory SQLite database.
+
+Run with: pytest tests/test_database.py -v
+
+Author: Loan Analytics Team
+Version: 1.0.0
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def session():
+    """Session on a fresh in-memory SQLite database with all tables."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from database.models import Base
+    from database.repositories import invalidate_stats
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    invalidate_stats()
+    with Session(engine) as session:
+        yield session
+    invalidate_stats()
+    engine.dispose()
+
+
+def make_applicant(n, **fields):
+    """Minimal valid applicant; ``n`` keeps the unique columns distinct."""
+    from database.models import Applicant
+
+    values = {
+        'applicant_ref': f'APL{n:05d}',
+        'first_name': 'Test',
+        'last_name': f'Applicant{n}',
+        'email': f'applicant{n}@example.com',
+        'phone_primary': f'98765{n:05d}',
+        'monthly_income': 50000,
+    }
+    values.update(fields)
+    return Applicant(**values)
+
+
+class TestApplicantRepository:
+    """Test cases for ApplicantRepository."""
+
+    def test_get_statistics(self, session):
+        """Statistics aggregate the applicants that are not soft-deleted."""
+        from database.models import KYCStatus
+        from database.repositories import ApplicantRepository
+
+        repo = ApplicantRepository(session)
+        repo.create(make_applicant(1, monthly_income=40000, cibil_score=700,
+                                   kyc_status=KYCStatus.VERIFIED))
+        repo.create(make_applicant(2, monthly_income=60000, cibil_score=800,
+                                   kyc_status=KYCStatus.PENDING))
+        repo.create(make_applicant(3, monthly_income=1000000, cibil_score=300,
+                                   kyc_status=KYCStatus.PENDING, is_deleted=True))
+        session.commit()
+
+        stats = repo.get_statistics()
+
+        assert stats['total_applicants'] == 2
+        assert stats['average_income'] == 50000
+        assert stats['average_cibil_score'] == 750
+        assert stats['kyc_status_distribution'] == {
+            KYCStatus.VERIFIED.value: 1,
+            KYCStatus.PENDING.value: 1,
+        }
+
+    def test_deleted_applicant_is_hidden(self, session):
+        """delete() soft-deletes; the active-applicant queries skip the row."""
+        from database.repositories import ApplicantRepository
+
+        repo = ApplicantRepository(session)
+        kept = repo.create(make_applicant(1, monthly_income=200000))
+        gone = repo.create(make_applicant(2, monthly_income=300000))
+        session.commit()
+
+        assert repo.delete(gone.id)
+        session.commit()
+
+        assert gone.is_deleted
+        assert repo.get_all_active() == [kept]
+        assert list(repo.iter_high_value_applicants()) == [kept]
+        assert repo.search() == ([kept], 1)
+        assert repo.search(is_active=False) == ([gone], 1)
+
+    def test_applicant_writes_invalidate_cached_stats(self, session):
+        """Cached aggregates are dropped when an applicant is written."""
+        from database.models import KYCStatus
+        from database.repositories import ApplicantRepository
+
+        repo = ApplicantRepository(session)
+        first = repo.create(make_applicant(1, kyc_status=KYCStatus.PENDING))
+        assert repo.get_statistics()['total_applicants'] == 1
+
+        repo.create(make_applicant(2, kyc_status=KYCStatus.PENDING))
+        assert repo.get_statistics()['total_applicants'] == 2
+
+        repo.update_kyc_status(first.id, KYCStatus.VERIFIED)
+        assert repo.count_by_kyc_status() == {
+            KYCStatus.VERIFIED.value: 1,
+            KYCStatus.PENDING.value: 1,
+        }
+
+        repo.delete(first.id)
+        assert repo.get_statistics()['total_applicants'] == 1
+
+    def test_cached_stats_are_per_database(self, session):
+        """Two databases in one process do not share cached aggregates."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from database.models import Base
+        from database.repositories import ApplicantRepository
+
+        repo = ApplicantRepository(session)
+        repo.create(make_applicant(1))
+        assert repo.get_statistics()['total_applicants'] == 1
+
+        other_engine = create_engine('sqlite://')
+        Base.metadata.create_all(other_engine)
+        with Session(other_engine) as other_session:
+            other = ApplicantRepository(other_session)
+            assert other.get_statistics()['total_applicants'] == 0
+        other_engine.dispose()
+
+    def test_update_keeps_phone_search_columns(self, session):
+        """Both update paths keep the derived phone columns in sync."""
+        from database.repositories import ApplicantRepository
+
+        repo = ApplicantRepository(session)
+        applicant = repo.create(make_applicant(1))
+
+        updated = repo.update(applicant, {'phone_primary': '+91 91234-56789'})
+        assert updated is applicant
+        assert applicant.phone_normalized == '919123456789'
+        assert applicant.phone_last4 == '6789'
+
+        assert repo.update_by_id(applicant.id, {'phone_primary': '(080) 5555-1234'})
+        session.refresh(applicant)
+        assert applicant.phone_primary == '(080) 5555-1234'
+        assert applicant.phone_normalized == '08055551234'
+        assert applicant.phone_last4 == '1234'
@@ -0,0 +1,294 @@
+"""
+Infrastructure Test Suite
+=========================
+Tests for the load balancer, rate limiting and scaling components.
+
+Run with: pytest tests/test_infrastructure.py -v
+
+Author: Loan Analytics Team
+Version: 1.0.0
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestCircuitBreakerRouting:
+    """Test cases for half-open circuit breakers behind the load balancer."""
+
+    @pytest.fixture
+    def balancer(self):
+        """Six healthy servers, breakers that open on one failure and recover at once."""
+        from infrastructure.load_balancer import (
+            LoadBalancer, LoadBalancingStrategy, CircuitBreakerConfig
+        )
+
+        lb = LoadBalancer(
+            strategy=LoadBalancingStrategy.ROUND_ROBIN,
+            circuit_config=CircuitBreakerConfig(
+                failure_threshold=1,
+                recovery_timeout_seconds=0
+            )
+        )
+        for i in range(6):
+            lb.add_server(f"s{i}", "localhost", 8000 + i)
+            lb.update_server_health(f"s{i}", True)
+        return lb
+
+    def test_half_open_server_recovers(self, balancer):
+        """A probing server gets trial traffic and closes again."""
+        from infrastructure.load_balancer import CircuitState
+
+        s0 = balancer.servers["s0"]
+        balancer.record_request_start(s0)
+        balancer.record_request_end(s0, success=False, response_time_ms=1.0)
+        assert s0._circuit_breaker.state is CircuitState.OPEN
+
+        routed = 0
+        for _ in range(3000):
+            server = balancer.get_server()
+            assert server is not None
+            if server is s0:
+                routed += 1
+            balancer.record_request_start(server)
+            balancer.record_request_end(server, success=True, response_time_ms=1.0)
+
+        assert routed > 0
+        assert s0._circuit_breaker.state is CircuitState.CLOSED
+
+    def test_only_selected_server_claims_trial_slot(self, balancer):
+        """Routing to one server leaves other probing servers' slots free."""
+        from infrastructure.load_balancer import CircuitState
+
+        for server_id in ("s0", "s1"):
+            server = balancer.servers[server_id]
+            balancer.record_request_start(server)
+            balancer.record_request_end(server, success=False, response_time_ms=1.0)
+
+        picked = balancer.get_server()
+        for server_id in ("s0", "s1"):
+            breaker = balancer.servers[server_id]._circuit_breaker
+            assert breaker.state is CircuitState.HALF_OPEN
+            expected = 1 if balancer.servers[server_id] is picked else 0
+            assert breaker._half_open_inflight == expected
+
+    def test_half_open_slots_are_bounded(self):
+        """try_acquire admits half_open_max_requests trials until released."""
+        from infrastructure.load_balancer import CircuitBreaker, CircuitBreakerConfig
+
+        breaker = CircuitBreaker(CircuitBreakerConfig(
+            failure_threshold=1,
+            recovery_timeout_seconds=0,
+            half_open_max_requests=2
+        ))
+        breaker.record_failure()
+
+        assert breaker.try_acquire()
+        assert breaker.try_acquire()
+        assert not breaker.try_acquire()
+        assert not breaker.can_execute()
+
+        breaker.release()
+        assert breaker.can_execute()
+        assert breaker.try_acquire()
+
+
+class TestMetricRing:
+    """Test cases for the metrics collector's numpy sample ring."""
+
+    @pytest.fixture
+    def ring(self, monkeypatch):
+        """Ring with room for four samples, so tests can wrap and grow it."""
+        from infrastructure.scaling import _MetricRing
+
+        monkeypatch.setattr(_MetricRing, "INITIAL_CAPACITY", 4)
+        return _MetricRing()
+
+    def test_expire_across_wrapped_segments(self, ring):
+        """Expiry walks both physical segments once the window wraps."""
+        for ts in range(1, 5):
+            ring.append(ts, float(ts))
+        ring.expire(3)
+        ring.append(5, 5.0)
+        ring.append(6, 6.0)
+
+        assert len(ring._segments()) == 2
+        assert ring.window_values().tolist() == [3.0, 4.0, 5.0, 6.0]
+
+        ring.expire(6)
+        assert ring.count == 1
+        assert ring.window_values().tolist() == [6.0]
+        assert ring.total == pytest.approx(6.0)
+        assert ring.mean() == pytest.approx(6.0)
+
+    def test_running_total_after_grow_and_expire(self, ring):
+        """The running total matches the window through growth and expiry."""
+        for ts in range(1, 5):
+            ring.append(ts, float(ts))
+        ring.expire(3)
+        for ts in range(5, 10):
+            ring.append(ts, float(ts))
+
+        assert len(ring.values) == 8
+        assert ring.window_values().tolist() == [float(ts) for ts in range(3, 10)]
+        assert ring.total == pytest.approx(sum(range(3, 10)))
+
+        ring.expire(7)
+        assert ring.total == pytest.approx(7 + 8 + 9)
+        assert ring.mean() == pytest.approx(8.0)
+
+        ring.expire(100)
+        assert ring.count == 0
+        assert ring.total == 0.0
+
+
+class TestClientWindow:
+    """Test cases for the per-client admission ring behind DistributedRateLimiter."""
+
+    def test_expired_counts_once_full(self):
+        """A full ring counts stale entries on both sides of ``head``."""
+        from infrastructure.load_balancer import _ClientWindow
+
+        window = _ClientWindow(3)
+        for now in (1.0, 2.0, 3.0, 4.0):
+            window.append(now)
+
+        assert window.count == 3
+        assert window.head == 1
+        assert window.newest() == 4.0
+        assert window.expired(0.0) == 0
+        assert window.expired(3.5) == 2
+        assert window.expired(10.0) == 3
+
+    def test_limiter_admits_again_after_window(self, monkeypatch):
+        """A client at its limit is admitted once its oldest entry ages out."""
+        import infrastructure.load_balancer as lb
+
+        clock = [100.0]
+        monkeypatch.setattr(lb.time, "monotonic", lambda: clock[0])
+        limiter = lb.DistributedRateLimiter(requests_per_window=3, window_seconds=10)
+
+        for _ in range(3):
+            clock[0] += 1
+            assert limiter.is_allowed("client")[0]
+        allowed, info = limiter.is_allowed("client")
+        assert not allowed
+        assert info["remaining"] == 0
+
+        clock[0] = 111.5  # first admission (101) is now outside the window
+        allowed, info = limiter.is_allowed("client")
+        assert allowed
+        assert info["remaining"] == 0
+
+
+class TestServiceRegistryExpiry:
+    """Test cases for heap-driven expiry of registry instances."""
+
+    def test_heartbeat_repushes_expiry(self, monkeypatch):
+        """A due entry for a heartbeated instance is re-pushed, a stale one removed."""
+        from infrastructure.scaling import ServiceRegistry, ServiceInstance
+
+        registry = ServiceRegistry()
+        # Entries pushed at registration are due immediately
+        monkeypatch.setattr(ServiceInstance, "HEARTBEAT_TIMEOUT_NS", 0)
+        live = registry.register("api", "live", "localhost", 8000)
+        stale = registry.register("api", "stale", "localhost", 8001)
+        monkeypatch.setattr(ServiceInstance, "HEARTBEAT_TIMEOUT_NS", 30 * 1_000_000_000)
+
+        assert registry.heartbeat("api", "live")
+        stale.last_heartbeat_ns -= 60 * 1_000_000_000
+
+        registry.cleanup_stale()
+
+        assert registry.get_instances("api", healthy_only=False) == [live]
+        assert [entry[3] for entry in registry._expiry_heap] == ["live"]
+        assert registry._expiry_heap[0][0] == live.expires_at_ns
+
+        # The re-pushed entry is not due yet, so another pass keeps it
+        registry.cleanup_stale()
+        assert registry.get_instances("api", healthy_only=False) == [live]
+
+
+def fill_cpu(collector, values, step_seconds=5):
+    """Append CPU samples ``step_seconds`` apart, the last one just now."""
+    import time
+    from infrastructure.scaling import MetricType
+
+    ring = collector.metrics[MetricType.CPU]
+    now_ns = time.monotonic_ns()
+    for age, value in zip(range(len(values) - 1, -1, -1), values):
+        ring.append(now_ns - age * step_seconds * 1_000_000_000, float(value))
+
+
+class TestPredictiveScaling:
+    """Test cases for the CPU trend forecast and predictive scale-up."""
+
+    def test_forecast_needs_enough_history(self):
+        """Too few samples, or too short a span, give no forecast."""
+        from infrastructure.scaling import MetricsCollector, MetricType
+
+        collector = MetricsCollector()
+        fill_cpu(collector, [30, 40])
+        assert collector.forecast(MetricType.CPU, 90) is None
+
+        collector = MetricsCollector()
+        fill_cpu(collector, range(30, 40), step_seconds=1)
+        assert collector.forecast(MetricType.CPU, 90) is None
+
+    def test_forecast_follows_trend(self):
+        """A steady rise is extrapolated along the fitted line."""
+        from infrastructure.scaling import MetricsCollector, MetricType
+
+        collector = MetricsCollector()
+        fill_cpu(collector, [30 + 3 * i for i in range(12)])  # 0.6 %/s, ends at 63
+
+        assert collector.forecast(MetricType.CPU, 10) == pytest.approx(69.0, abs=0.5)
+
+    def test_forecast_is_clamped(self):
+        """Extrapolation stops at the sampled span and at the ceiling."""
+        from infrastructure.scaling import MetricsCollector, MetricType
+
+        collector = MetricsCollector()
+        fill_cpu(collector, [30 + 3 * i for i in range(12)])
+        span_ahead = collector.forecast(MetricType.CPU, 55)
+
+        assert collector.forecast(MetricType.CPU, 10_000) == pytest.approx(span_ahead, abs=0.5)
+        assert collector.forecast(MetricType.CPU, 55, ceiling=80.0) == 80.0
+
+        collector = MetricsCollector()
+        fill_cpu(collector, [90 - 8 * i for i in range(12)])
+        assert collector.forecast(MetricType.CPU, 55) == 0.0
+
+    def test_evaluate_scales_up_on_forecast_only_when_enabled(self):
+        """A rising trend below target scales up only with predictive_scale_up."""
+        from infrastructure.scaling import (
+            AutoScaler, MetricsCollector, ScalingPolicy, ScalingDirection
+        )
+
+        collector = MetricsCollector()
+        fill_cpu(collector, [30 + 3 * i for i in range(12)])  # average 46.5%
+
+        assert not ScalingPolicy().predictive_scale_up
+        decision = AutoScaler(ScalingPolicy(), collector).evaluate()
+        assert decision.direction is ScalingDirection.NONE
+
+        policy = ScalingPolicy(predictive_scale_up=True)
+        decision = AutoScaler(policy, collector).evaluate()
+        assert decision.direction is ScalingDirection.UP
+        assert "forecast" in decision.reason
+
+    def test_evaluate_ignores_flat_load(self):
+        """A flat load below target never triggers a predictive scale-up."""
+        from infrastructure.scaling import (
+            AutoScaler, MetricsCollector, ScalingPolicy, ScalingDirection
+        )
+
+        collector = MetricsCollector()
+        fill_cpu(collector, [45] * 12)
+
+        decision = AutoScaler(ScalingPolicy(predictive_scale_up=True), collector).evaluate()
+        assert decision.direction is ScalingDirection.NONE
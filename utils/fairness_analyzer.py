@@ -288,18 +288,21 @@ class FairnessAnalyzer:
         return comparison.reset_index()
 
 
+AGE_BINS = [0, 25, 35, 45, 55, 100]
+AGE_LABELS = ['18-25', '26-35', '36-45', '46-55', '55+']
+
+INCOME_BINS = [0, 25000, 50000, 75000, 100000, float('inf')]
+INCOME_LABELS = ['Below 25K', '25K-50K', '50K-75K', '75K-1L', 'Above 1L']
+
+
 def create_age_groups(ages: pd.Series) -> pd.Series:
     """Convert age to age groups for fairness analysis."""
-    bins = [0, 25, 35, 45, 55, 100]
-    labels = ['18-25', '26-35', '36-45', '46-55', '55+']
-    return pd.cut(ages, bins=bins, labels=labels)
+    return pd.cut(ages, bins=AGE_BINS, labels=AGE_LABELS)
 
 
 def create_income_groups(incomes: pd.Series) -> pd.Series:
     """Convert income to income groups for fairness analysis."""
-    bins = [0, 25000, 50000, 75000, 100000, float('inf')]
-    labels = ['Below 25K', '25K-50K', '50K-75K', '75K-1L', 'Above 1L']
-    return pd.cut(incomes, bins=bins, labels=labels)
+    return pd.cut(incomes, bins=INCOME_BINS, labels=INCOME_LABELS)
 
 
 def generate_fairness_summary_text(report: Dict) -> str: